@@ -0,0 +1,325 @@
+"""Many games advanced together, stored as arrays instead of objects."""
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from shooter.board import Board
+from shooter.direction import Direction
+from shooter.geometry import move_towards, squares_in_screen, squares_intersecting
+from shooter.utils import random_location, random_squares_not_intersecting
+
+NO_DIRECTION = -1
+
+# Indexed by direction value. The last row is used for NO_DIRECTION.
+_MOVE_VECTORS = np.array(
+    [direction.to_vector() for direction in Direction] + [[0, 0]], dtype=float
+)
+
+
+class BatchedUpdateResult(NamedTuple):
+    """Result of a batched update."""
+
+    score_deltas: np.ndarray
+    lost: np.ndarray
+    final_scores: np.ndarray
+
+
+class BatchedBoard:  # pylint: disable=too-many-instance-attributes
+    """
+    A batch of independent games, sharing the rules of :class:`Board`.
+
+    Every game state is kept in arrays whose first axis is the game index.
+    Bullets are kept in padded arrays, ordered by the time they were shot.
+    Only the first ``bullet_counts[i]`` bullets of game ``i`` are alive.
+    """
+
+    player_speed = Board.player_speed
+    enemy_speed = Board.enemy_speed
+    bullet_speed = Board.bullet_speed
+    shooter_width = Board.shooter_width
+    bullet_width = Board.bullet_width
+    enemy_reload_time = Board.enemy_reload_time
+    player_reload_time = Board.player_reload_time
+    hit_score = Board.hit_score
+    spawn_candidates = Board.spawn_candidates
+
+    def __init__(
+        self,
+        games_count: int,
+        bullets_capacity: int = 64,
+        auto_reset: bool = True,
+        seed: Optional[int] = None,
+    ):
+        self.games_count = games_count
+        self.auto_reset = auto_reset
+        self.rng = np.random.default_rng(seed)
+        self.player_locations = np.zeros((games_count, 2))
+        self.enemy_locations = np.zeros((games_count, 2))
+        self.player_time_to_reload = np.zeros(games_count)
+        self.enemy_time_to_reload = np.zeros(games_count)
+        self.bullet_locations = np.zeros((games_count, bullets_capacity, 2))
+        self.bullet_velocities = np.zeros((games_count, bullets_capacity, 2))
+        self.bullet_is_player = np.zeros((games_count, bullets_capacity), dtype=bool)
+        self.bullet_counts = np.zeros(games_count, dtype=int)
+        self.scores = np.zeros(games_count, dtype=int)
+        self.lost = np.zeros(games_count, dtype=bool)
+        self.kept_bullets = np.zeros((games_count, bullets_capacity), dtype=bool)
+        self.reset()
+
+    @classmethod
+    def from_board(
+        cls,
+        board: Board,
+        games_count: int,
+        auto_reset: bool = False,
+        seed: Optional[int] = None,
+    ) -> "BatchedBoard":
+        """Make a batched board whose games are all copies of a board."""
+        if board.enemies_count != 1:
+            raise ValueError(
+                "Only boards with a single enemy can be batched, "
+                f"not {board.enemies_count} enemies"
+            )
+        bullets_count = len(board.bullet_is_player)
+        batched_board = cls(
+            games_count=games_count,
+            bullets_capacity=max(bullets_count, 1),
+            auto_reset=auto_reset,
+            seed=seed,
+        )
+        batched_board.player_locations[:] = board.player.location
+        batched_board.enemy_locations[:] = board.enemy_locations[0]
+        batched_board.player_time_to_reload[:] = board.player.time_to_reload
+        batched_board.enemy_time_to_reload[:] = board.enemy_time_to_reload[0]
+        batched_board.bullet_locations[:, :bullets_count] = board.bullet_locations
+        batched_board.bullet_velocities[:, :bullets_count] = board.bullet_velocities
+        batched_board.bullet_is_player[:, :bullets_count] = board.bullet_is_player
+        batched_board.bullet_counts[:] = bullets_count
+        batched_board.scores[:] = board.score
+        batched_board.lost[:] = board.is_lost
+        return batched_board
+
+    @property
+    def bullets_capacity(self) -> int:
+        """Number of bullets each game can hold before growing the arrays."""
+        return self.bullet_locations.shape[1]
+
+    @property
+    def bullet_mask(self) -> np.ndarray:
+        """Mask of the alive bullets."""
+        return np.arange(self.bullets_capacity) < self.bullet_counts[:, np.newaxis]
+
+    def random_shooter_locations(self, count: int) -> np.ndarray:
+        """Get random locations of shooters."""
+        return random_location(margin=self.shooter_width, size=(count, 2), rng=self.rng)
+
+    def reset(self, games: Optional[np.ndarray] = None, seed: Optional[int] = None):
+        """
+        Reset the given games, or all games if none are given.
+
+        The random generator is reseeded if a seed is given.
+        """
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        if games is None:
+            games = np.arange(self.games_count)
+        self.player_locations[games] = self.random_shooter_locations(len(games))
+        self.respawn_enemies(games)
+        self.bullet_counts[games] = 0
+        self.lost[games] = False
+        self.scores[games] = 0
+
+    def respawn_enemies(self, games: np.ndarray):
+        """Respawn enemies of the given games so they don't touch the players."""
+        self.enemy_locations[games] = random_squares_not_intersecting(
+            others=self.player_locations[games],
+            width=self.shooter_width,
+            margin=self.shooter_width,
+            rng=self.rng,
+            candidates_count=self.spawn_candidates,
+        )
+
+    def update(
+        self,
+        delta_time: float,
+        move_directions: np.ndarray,
+        shoot_angles: np.ndarray,
+        should_shoot: np.ndarray,
+    ) -> BatchedUpdateResult:
+        """
+        Update all games.
+
+        :param delta_time: Time passed since last update
+        :param move_directions: Direction value for each player, or NO_DIRECTION
+        :param shoot_angles: Shooting angle, in radians, for each player
+        :param should_shoot: Should each player try to shoot
+        :return: Score gained and whether the game was lost, for each game.
+            Final scores are reported before lost games are reset.
+        """
+        self.update_players(
+            delta_time=delta_time,
+            move_directions=np.asarray(move_directions),
+            shoot_angles=np.asarray(shoot_angles),
+            should_shoot=np.asarray(should_shoot, dtype=bool),
+        )
+        self.update_enemies(delta_time)
+        score_deltas = self.update_bullets(delta_time)
+        result = BatchedUpdateResult(
+            score_deltas=score_deltas,
+            lost=self.lost.copy(),
+            final_scores=self.scores.copy(),
+        )
+        if self.auto_reset:
+            self.reset(np.flatnonzero(self.lost))
+        return result
+
+    def update_players(
+        self,
+        delta_time: float,
+        move_directions: np.ndarray,
+        shoot_angles: np.ndarray,
+        should_shoot: np.ndarray,
+    ):
+        """Update players locations and shoot if required to."""
+        self.player_locations += (delta_time * self.player_speed) * _MOVE_VECTORS[
+            move_directions
+        ]
+        self.player_time_to_reload = np.maximum(
+            0, self.player_time_to_reload - delta_time
+        )
+        shooting = np.flatnonzero(should_shoot & (self.player_time_to_reload == 0))
+        self.player_time_to_reload[shooting] = self.player_reload_time
+        self.add_bullets(
+            games=shooting,
+            locations=self.player_locations[shooting],
+            angles=shoot_angles[shooting],
+            is_player=True,
+        )
+        self.lost |= ~squares_in_screen(self.player_locations, self.shooter_width)
+
+    def update_enemies(self, delta_time: float):
+        """Update enemies locations and shoot players if possible."""
+        move_towards(
+            self.enemy_locations,
+            targets=self.player_locations,
+            max_distance=delta_time * self.enemy_speed,
+        )
+        self.enemy_time_to_reload = np.maximum(
+            0, self.enemy_time_to_reload - delta_time
+        )
+        shooting = np.flatnonzero(self.enemy_time_to_reload == 0)
+        self.enemy_time_to_reload[shooting] = self.enemy_reload_time
+        delta = self.player_locations[shooting] - self.enemy_locations[shooting]
+        self.add_bullets(
+            games=shooting,
+            locations=self.enemy_locations[shooting],
+            angles=np.arctan2(delta[:, 1], delta[:, 0]),
+            is_player=False,
+        )
+        self.lost |= squares_intersecting(
+            self.enemy_locations,
+            self.shooter_width,
+            self.player_locations,
+            self.shooter_width,
+        )
+
+    def update_bullets(self, delta_time: float) -> np.ndarray:
+        """
+        Update bullets and return the score gained in each game.
+
+        Like :meth:`Board.update_bullets`, bullets are handled in the order they
+        were shot, so a bullet shot after one that hit the enemy is tested
+        against the respawned enemy.
+        """
+        score_deltas = np.zeros(self.games_count, dtype=int)
+        alive = self.bullet_mask
+        self.bullet_locations += delta_time * self.bullet_velocities
+        hitting_player = (
+            alive
+            & ~self.bullet_is_player
+            & squares_intersecting(
+                self.bullet_locations,
+                self.bullet_width,
+                self.player_locations[:, np.newaxis],
+                self.shooter_width,
+            )
+        )
+        self.lost |= hitting_player.any(axis=1)
+        removed = hitting_player.copy()
+        can_hit_enemy = alive & self.bullet_is_player
+        bullet_indices = np.arange(self.bullets_capacity)
+        last_tested = np.full(self.games_count, -1)
+        while True:
+            hitting_enemy = (
+                can_hit_enemy
+                & (bullet_indices > last_tested[:, np.newaxis])
+                & squares_intersecting(
+                    self.bullet_locations,
+                    self.bullet_width,
+                    self.enemy_locations[:, np.newaxis],
+                    self.shooter_width,
+                )
+            )
+            hit_games = np.flatnonzero(hitting_enemy.any(axis=1))
+            if len(hit_games) == 0:
+                break
+            first_hits = hitting_enemy[hit_games].argmax(axis=1)
+            removed[hit_games, first_hits] = True
+            last_tested[hit_games] = first_hits
+            score_deltas[hit_games] += self.hit_score
+            self.respawn_enemies(hit_games)
+        self.scores += score_deltas
+        self.keep_bullets(
+            alive
+            & ~removed
+            & squares_in_screen(self.bullet_locations, self.bullet_width)
+        )
+        return score_deltas
+
+    def add_bullets(
+        self, games: np.ndarray, locations: np.ndarray, angles: np.ndarray, is_player
+    ):
+        """Add a single bullet to each of the given games."""
+        if len(games) == 0:
+            return
+        required_capacity = self.bullet_counts[games].max() + 1
+        if required_capacity > self.bullets_capacity:
+            self.grow_bullets_capacity(
+                max(required_capacity, 2 * self.bullets_capacity)
+            )
+        indices = self.bullet_counts[games]
+        self.bullet_locations[games, indices] = locations
+        self.bullet_velocities[games, indices] = self.bullet_speed * np.stack(
+            [np.cos(angles), np.sin(angles)], axis=1
+        )
+        self.bullet_is_player[games, indices] = is_player
+        self.bullet_counts[games] += 1
+
+    def keep_bullets(self, keep: np.ndarray):
+        """
+        Keep only the bullets in mask, without changing their order.
+
+        The mask is kept as ``kept_bullets``, so bullets can be followed from
+        one update to the next.
+        """
+        self.kept_bullets = keep
+        order = np.argsort(~keep, axis=1, kind="stable")
+        self.bullet_locations = np.take_along_axis(
+            self.bullet_locations, order[..., np.newaxis], axis=1
+        )
+        self.bullet_velocities = np.take_along_axis(
+            self.bullet_velocities, order[..., np.newaxis], axis=1
+        )
+        self.bullet_is_player = np.take_along_axis(self.bullet_is_player, order, axis=1)
+        self.bullet_counts = keep.sum(axis=1)
+
+    def grow_bullets_capacity(self, capacity: int):
+        """Grow the bullets arrays to a new capacity."""
+        padding = capacity - self.bullets_capacity
+        self.bullet_locations = np.pad(
+            self.bullet_locations, ((0, 0), (0, padding), (0, 0))
+        )
+        self.bullet_velocities = np.pad(
+            self.bullet_velocities, ((0, 0), (0, padding), (0, 0))
+        )
+        self.bullet_is_player = np.pad(self.bullet_is_player, ((0, 0), (0, padding)))
@@ -0,0 +1,411 @@
+"""
+Benchmarks of the simulation core.
+
+Each benchmark is a setup function returning the function to time. The timed
+function may return the number of units it processed (for example, finished
+episodes). Otherwise, each call counts as a single unit.
+Results are measured in seconds per unit, so lower is always better.
+"""
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+from shooter.batched_board import NO_DIRECTION, BatchedBoard
+from shooter.board import (
+    BRUTE_FORCE_BROAD_PHASE,
+    DISCRETE_COLLISIONS,
+    SPATIAL_HASH_BROAD_PHASE,
+    SWEPT_COLLISIONS,
+    Board,
+)
+from shooter.policies import scripted_policy
+from shooter.rasterizer import rasterize_batched_board
+from shooter.shooter_class import Shooter
+from shooter.simulation import BATCHED_ENGINE, BOARD_ENGINE, simulate
+from shooter.square import Square
+
+BenchmarkFunction = Callable[[], Optional[int]]
+BenchmarkSetup = Callable[[], BenchmarkFunction]
+
+DEFAULT_MIN_TIME = 0.2
+DEFAULT_REPEATS = 3
+DEFAULT_THRESHOLD = 0.1
+# CLI runs are short, so importing the CLI must take a small part of them.
+CLI_IMPORT_BUDGET = 0.25
+
+BENCHMARKS: Dict[str, BenchmarkSetup] = {}
+
+
+def benchmark(name: str) -> Callable[[BenchmarkSetup], BenchmarkSetup]:
+    """Register a benchmark setup function under a name."""
+
+    def decorator(setup: BenchmarkSetup) -> BenchmarkSetup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+class Regression(NamedTuple):
+    """A benchmark that got slower than its baseline."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """How many times slower than the baseline."""
+        return self.current / self.baseline
+
+
+def make_shooter(location) -> Shooter:
+    """Make a shooter with the board default parameters."""
+    return Shooter(
+        location=np.array(location, dtype=float),
+        width=Board.shooter_width,
+        speed=Board.player_speed,
+        bullet_width=Board.bullet_width,
+        bullet_speed=Board.bullet_speed,
+        reload_time=Board.player_reload_time,
+    )
+
+
+def make_board_with_bullets(
+    bullets_count: int,
+    broad_phase: str = BRUTE_FORCE_BROAD_PHASE,
+    collision_mode: str = DISCRETE_COLLISIONS,
+) -> Board:
+    """
+    Make a board with standing enemy bullets that never hit anything.
+
+    Bullets are spread over the screen, away from the standing player.
+    """
+    board = Board(broad_phase=broad_phase, collision_mode=collision_mode)
+    board.player.location = np.array([0.1, 0.1])
+    board.enemy_locations[0] = [0.9, 0.9]
+    rng = np.random.default_rng(0)
+    board.bullet_locations = rng.uniform(0.3, 0.95, size=(bullets_count, 2))
+    board.bullet_velocities = np.zeros((bullets_count, 2))
+    board.bullet_is_player = np.zeros(bullets_count, dtype=bool)
+    return board
+
+
+@benchmark("square_is_intersecting")
+def square_is_intersecting_benchmark() -> BenchmarkFunction:
+    """Intersection test of two squares."""
+    square1 = Square(location=np.array([0.5, 0.5]), width=0.1)
+    square2 = Square(location=np.array([0.55, 0.55]), width=0.1)
+
+    def is_intersecting():
+        square1.is_intersecting(square2)
+
+    return is_intersecting
+
+
+@benchmark("square_valid")
+def square_valid_benchmark() -> BenchmarkFunction:
+    """Screen test of a square."""
+    square = Square(location=np.array([0.5, 0.5]), width=0.1)
+
+    def valid():
+        square.valid  # pylint: disable=pointless-statement
+
+    return valid
+
+
+@benchmark("shooter_move_towards")
+def shooter_move_towards_benchmark() -> BenchmarkFunction:
+    """Moving a shooter towards a location."""
+    shooter = make_shooter([0.1, 0.1])
+    target = np.array([0.9, 0.9])
+
+    def move_towards():
+        shooter.move_towards(delta_time=1e-6, location=target)
+
+    return move_towards
+
+
+@benchmark("shooter_shoot_towards")
+def shooter_shoot_towards_benchmark() -> BenchmarkFunction:
+    """Shooting a bullet towards a location."""
+    shooter = make_shooter([0.1, 0.1])
+    target = np.array([0.9, 0.9])
+
+    def shoot_towards():
+        shooter.time_to_reload = 0
+        shooter.shoot_towards(target)
+
+    return shoot_towards
+
+
+@benchmark("bullet_update")
+def bullet_update_benchmark() -> BenchmarkFunction:
+    """Moving a single bullet."""
+    bullet = make_shooter([0.5, 0.5]).shoot(angle_radians=np.pi / 3)
+
+    def update():
+        bullet.update(delta_time=1e-6)
+
+    return update
+
+
+def board_update_benchmark(
+    bullets_count: int,
+    broad_phase: str = BRUTE_FORCE_BROAD_PHASE,
+    collision_mode: str = DISCRETE_COLLISIONS,
+) -> BenchmarkSetup:
+    """Make a benchmark of a board update with a number of live bullets."""
+
+    def setup() -> BenchmarkFunction:
+        board = make_board_with_bullets(
+            bullets_count, broad_phase=broad_phase, collision_mode=collision_mode
+        )
+
+        def update():
+            board.update(
+                delta_time=1e-6,
+                move_direction=None,
+                shoot_angle_radians=0,
+                should_shoot=False,
+            )
+
+        return update
+
+    setup.__doc__ = (
+        f"Board update with {bullets_count} live bullets, "
+        f"using the {broad_phase} broad phase and {collision_mode} collisions."
+    )
+    return setup
+
+
+# Brute force is the default broad phase, so it keeps the short names. Running
+# both broad phases over the same bullet counts shows where they cross over.
+for _bullets_count in [0, 10, 100, 1000, 10000]:
+    benchmark(f"board_update[{_bullets_count}]")(board_update_benchmark(_bullets_count))
+    benchmark(f"board_update[{SPATIAL_HASH_BROAD_PHASE},{_bullets_count}]")(
+        board_update_benchmark(_bullets_count, broad_phase=SPATIAL_HASH_BROAD_PHASE)
+    )
+    for _broad_phase in [BRUTE_FORCE_BROAD_PHASE, SPATIAL_HASH_BROAD_PHASE]:
+        benchmark(f"board_update[{SWEPT_COLLISIONS},{_broad_phase},{_bullets_count}]")(
+            board_update_benchmark(
+                _bullets_count,
+                broad_phase=_broad_phase,
+                collision_mode=SWEPT_COLLISIONS,
+            )
+        )
+
+
+def board_enemies_update_benchmark(enemies_count: int) -> BenchmarkSetup:
+    """Make a benchmark of a board update where all enemies move and shoot."""
+
+    def setup() -> BenchmarkFunction:
+        board = Board(enemies_count=enemies_count)
+        board.player.location = np.array([0.05, 0.05])
+        rng = np.random.default_rng(0)
+        board.enemy_locations = rng.uniform(0.3, 0.95, size=(enemies_count, 2))
+
+        def update():
+            board.keep_bullets(np.zeros_like(board.bullet_is_player))
+            board.enemy_time_to_reload[:] = 0
+            board.update(
+                delta_time=1e-6,
+                move_direction=None,
+                shoot_angle_radians=0,
+                should_shoot=False,
+            )
+
+        return update
+
+    setup.__doc__ = f"Board update with {enemies_count} enemies, all shooting."
+    return setup
+
+
+for _enemies_count in [1, 10, 100, 1000]:
+    benchmark(f"board_update_enemies[{_enemies_count}]")(
+        board_enemies_update_benchmark(_enemies_count)
+    )
+
+
+def episodes_benchmark(engine: str) -> BenchmarkSetup:
+    """Make an end-to-end benchmark, measured in seconds per finished episode."""
+
+    def setup() -> BenchmarkFunction:
+        seeds = iter(range(2**32))
+
+        def run_episodes():
+            result = simulate(
+                games_count=16,
+                steps=200,
+                delta_time=0.05,
+                policy=scripted_policy,
+                seed=next(seeds),
+                engine=engine,
+            )
+            return len(result.episodes)
+
+        return run_episodes
+
+    setup.__doc__ = f"End-to-end episodes of the {engine} engine."
+    return setup
+
+
+for _engine in [BOARD_ENGINE, BATCHED_ENGINE]:
+    benchmark(f"episodes[{_engine}]")(episodes_benchmark(_engine))
+
+
+@benchmark("rasterize_batched_board")
+def rasterize_batched_board_benchmark() -> BenchmarkFunction:
+    """Rendering 256 games with bullets into 84x84 color images."""
+    batched_board = BatchedBoard(games_count=256, seed=0)
+    for _ in range(8):
+        batched_board.update(
+            delta_time=0.05,
+            move_directions=np.full(256, NO_DIRECTION),
+            shoot_angles=np.zeros(256),
+            should_shoot=np.ones(256, dtype=bool),
+        )
+
+    def render():
+        rasterize_batched_board(batched_board)
+
+    return render
+
+
+@benchmark("board_advance_until")
+def board_advance_until_benchmark() -> BenchmarkFunction:
+    """Advancing a board by a second of standing and shooting."""
+    seeds = iter(range(2**32))
+
+    def advance():
+        board = Board(seed=next(seeds))
+        board.advance_until(
+            1, move_direction=None, shoot_angle_radians=0, should_shoot=True
+        )
+
+    return advance
+
+
+@benchmark("board_snapshot_restore")
+def board_snapshot_restore_benchmark() -> BenchmarkFunction:
+    """Snapshot and restore of a board with 100 bullets."""
+    board = make_board_with_bullets(100)
+
+    def snapshot_restore():
+        board.restore(board.snapshot())
+
+    return snapshot_restore
+
+
+def import_seconds(module_name: str) -> float:
+    """Time to import a module, with everything it imports, in a new interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # The module is imported last, with its cumulative time in microseconds.
+    return int(result.stderr.splitlines()[-1].split("|")[1]) / 1e6
+
+
+@benchmark("cli_startup")
+def cli_startup_benchmark() -> BenchmarkFunction:
+    """Running the CLI help in a new interpreter."""
+
+    def run_cli():
+        subprocess.run(
+            [sys.executable, "-m", "shooter", "--help"],
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+
+    return run_cli
+
+
+def time_function(
+    function: BenchmarkFunction,
+    min_time: float = DEFAULT_MIN_TIME,
+    repeats: int = DEFAULT_REPEATS,
+) -> float:
+    """
+    Measure seconds per unit of a function.
+
+    The number of calls is doubled until they take at least min_time.
+    Then, the measurement is repeated and the best one is taken.
+    """
+
+    def run(calls: int):
+        units = 0
+        start_time = time.perf_counter()
+        for _ in range(calls):
+            function_units = function()
+            units += 1 if function_units is None else function_units
+        return time.perf_counter() - start_time, units
+
+    calls = 1
+    elapsed, units = run(calls)
+    while elapsed < min_time:
+        calls *= 2
+        elapsed, units = run(calls)
+    best = elapsed / max(units, 1)
+    for _ in range(repeats - 1):
+        elapsed, units = run(calls)
+        best = min(best, elapsed / max(units, 1))
+    return best
+
+
+def run_benchmarks(
+    names: Optional[Iterable[str]] = None,
+    min_time: float = DEFAULT_MIN_TIME,
+    repeats: int = DEFAULT_REPEATS,
+) -> Dict[str, float]:
+    """Run benchmarks by their names, or all of them, in seconds per unit."""
+    if names is None:
+        names = BENCHMARKS.keys()
+    return {
+        name: time_function(BENCHMARKS[name](), min_time=min_time, repeats=repeats)
+        for name in names
+    }
+
+
+def save_results(results: Dict[str, float], path: str):
+    """Save benchmark results as JSON."""
+    data = {
+        "metadata": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+        },
+        "benchmarks": results,
+    }
+    with open(path, mode="w", encoding="utf-8") as results_file:
+        json.dump(data, results_file, indent=2)
+
+
+def load_results(path: str) -> Dict[str, float]:
+    """Load benchmark results saved as JSON."""
+    with open(path, mode="r", encoding="utf-8") as results_file:
+        return json.load(results_file)["benchmarks"]
+
+
+def compare_results(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Regression]:
+    """
+    Find benchmarks that are slower than the baseline by more than threshold.
+
+    Benchmarks missing from either results are ignored.
+    """
+    return [
+        Regression(name=name, baseline=baseline[name], current=current)
+        for name, current in results.items()
+        if name in baseline and current > baseline[name] * (1 + threshold)
+    ]
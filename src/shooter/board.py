@@ -1,12 +1,33 @@
 """The actual game."""
+import time
+import uuid
 from enum import Enum
-from typing import List, Optional
+from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple
 
 import numpy as np
 
+from shooter.constants import EPSILON
 from shooter.direction import Direction
+from shooter.geometry import (
+    move_towards,
+    squares_in_screen,
+    squares_intersecting,
+    swept_squares_hit_times,
+)
+from shooter.instrumentation import BoardStats
 from shooter.shooter_class import Bullet, Shooter
-from shooter.utils import random_location
+from shooter.spatial_hash import SpatialHash
+from shooter.utils import random_location, random_squares_not_intersecting
+
+if TYPE_CHECKING:  # pragma: no cover
+    from shooter.batched_board import BatchedBoard
+
+BRUTE_FORCE_BROAD_PHASE = "brute_force"
+SPATIAL_HASH_BROAD_PHASE = "spatial_hash"
+BROAD_PHASES = [BRUTE_FORCE_BROAD_PHASE, SPATIAL_HASH_BROAD_PHASE]
+DISCRETE_COLLISIONS = "discrete"
+SWEPT_COLLISIONS = "swept"
+COLLISION_MODES = [DISCRETE_COLLISIONS, SWEPT_COLLISIONS]
 
 
 class GameStatus(Enum):
@@ -16,8 +37,34 @@ class GameStatus(Enum):
     LOST = 1
 
 
-class Board:
-    """Game board class"""
+class BoardSnapshot(NamedTuple):
+    """
+    Immutable state of a board, kept as the bytes of a single flat array.
+
+    The array holds the player location, its time to reload, the score and the
+    status, then the enemies and then the bullets. Snapshots are hashable, so
+    equal states can be found in a transposition table.
+    """
+
+    data: bytes
+    enemies_count: int
+    bullets_count: int
+
+
+class Board:  # pylint: disable=too-many-instance-attributes
+    """
+    Game board class.
+
+    The player is a :class:`Shooter`, while enemies are kept as arrays of
+    locations and times to reload, so they all move and shoot at once.
+    All randomness comes from the board's own generator, so boards created or
+    reset with the same seed play exactly the same.
+    Boards given a :class:`BoardStats` record timings of update phases and
+    counts of the work they do into it.
+    With discrete collisions, bullets only hit shooters they touch at the end of
+    an update. With swept collisions, bullets hit shooters anywhere along their
+    paths, so large time steps can't skip over hits.
+    """
 
     player_speed = 0.5
     enemy_speed = 0.3
@@ -27,28 +74,95 @@ class Board:
     enemy_reload_time = 1
     player_reload_time = 0.5
     hit_score = 1
+    spatial_hash_cell_size = 0.1
+    spawn_candidates = 8
 
-    def __init__(self):
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        enemies_count: int = 1,
+        broad_phase: str = BRUTE_FORCE_BROAD_PHASE,
+        seed: Optional[int] = None,
+        stats: Optional[BoardStats] = None,
+        collision_mode: str = DISCRETE_COLLISIONS,
+    ):
+        if broad_phase not in BROAD_PHASES:
+            raise ValueError(f"Unknown broad phase: {broad_phase}")
+        if collision_mode not in COLLISION_MODES:
+            raise ValueError(f"Unknown collision mode: {collision_mode}")
+        self.broad_phase = broad_phase
+        self.collision_mode = collision_mode
+        self.stats = stats
+        self.rng = np.random.default_rng(seed)
+        self.spatial_hash = SpatialHash(self.spatial_hash_cell_size)
         self.player = Shooter(
-            location=self.random_shooter_location(),
+            location=self.random_shooter_locations(1)[0],
             width=self.shooter_width,
             speed=self.player_speed,
             bullet_width=self.bullet_width,
             bullet_speed=self.bullet_speed,
             reload_time=self.player_reload_time,
         )
-        self.enemy = Shooter(
-            location=self.random_shooter_location(),
-            width=self.shooter_width,
-            speed=self.enemy_speed,
-            bullet_width=self.bullet_width,
-            bullet_speed=self.bullet_speed,
-            reload_time=self.enemy_reload_time,
-        )
-        self.bullets: List[Bullet] = []
+        self.enemy_shooter_id = uuid.uuid4()
+        self.enemy_locations = np.empty((enemies_count, 2))
+        self.enemy_time_to_reload = np.zeros(enemies_count)
+        self.respawn_enemies(np.arange(enemies_count))
+        self.bullet_locations = np.empty((0, 2))
+        self.bullet_velocities = np.empty((0, 2))
+        self.bullet_is_player = np.empty(0, dtype=bool)
         self.status = GameStatus.PLAYING
         self.score = 0
 
+    @property
+    def enemies_count(self) -> int:
+        """Number of enemies in the board."""
+        return len(self.enemy_locations)
+
+    @property
+    def enemies(self) -> Tuple[Shooter, ...]:
+        """
+        Enemies in the board.
+
+        Enemies are kept as arrays, so this is a read-only copy of them.
+        """
+        enemies = []
+        for location, time_to_reload in zip(
+            self.enemy_locations, self.enemy_time_to_reload
+        ):
+            enemy = Shooter(
+                location=location,
+                width=self.shooter_width,
+                speed=self.enemy_speed,
+                bullet_width=self.bullet_width,
+                bullet_speed=self.bullet_speed,
+                reload_time=self.enemy_reload_time,
+            )
+            enemy.shooter_id = self.enemy_shooter_id
+            enemy.time_to_reload = float(time_to_reload)
+            enemies.append(enemy)
+        return tuple(enemies)
+
+    @property
+    def bullets(self) -> Tuple[Bullet, ...]:
+        """
+        Bullets in the board, ordered by the time they were shot.
+
+        Bullets are kept as arrays, so this is a read-only copy of them.
+        """
+        return tuple(
+            Bullet(
+                location=location,
+                width=self.bullet_width,
+                shooter_id=(
+                    self.player.shooter_id if is_player else self.enemy_shooter_id
+                ),
+                speed=self.bullet_speed,
+                angle_radians=np.arctan2(velocity[1], velocity[0]),
+            )
+            for location, velocity, is_player in zip(
+                self.bullet_locations, self.bullet_velocities, self.bullet_is_player
+            )
+        )
+
     @property
     def is_playing(self):
         """Are we still playing."""
@@ -63,23 +177,101 @@ class Board:
         """Set game as lost."""
         self.status = GameStatus.LOST
 
-    def random_shooter_location(self) -> np.ndarray:
-        """Get a random location of a shooter"""
-        return random_location(margin=self.shooter_width)
+    def nearest_enemy(self) -> int:
+        """Index of the enemy nearest to the player."""
+        return int(
+            np.argmin(
+                np.linalg.norm(self.enemy_locations - self.player.location, axis=1)
+            )
+        )
 
-    def reset(self):
-        """Reset board."""
-        self.player.location = self.random_shooter_location()
-        self.respawn_enemy()
-        self.bullets.clear()
+    def random_shooter_locations(self, count: int) -> np.ndarray:
+        """Get random locations of shooters"""
+        return random_location(margin=self.shooter_width, size=(count, 2), rng=self.rng)
+
+    def reset(self, seed: Optional[int] = None):
+        """Reset board, reseeding its random generator if a seed is given."""
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self.player.location = self.random_shooter_locations(1)[0]
+        self.respawn_enemies(np.arange(self.enemies_count))
+        self.enemy_time_to_reload[:] = 0
+        self.keep_bullets(np.zeros_like(self.bullet_is_player))
         self.status = GameStatus.PLAYING
         self.score = 0
 
-    def respawn_enemy(self):
-        """Respawn enemy so it doesn't touch the player."""
-        self.enemy.location = self.random_shooter_location()
-        while self.enemy.is_intersecting(self.player):
-            self.enemy.location = self.random_shooter_location()
+    def snapshot(self) -> BoardSnapshot:
+        """
+        Take a snapshot of the board state.
+
+        The random generator is not part of the snapshot, so states that only
+        differ in their future respawns are equal.
+        """
+        return BoardSnapshot(
+            data=np.concatenate(
+                [
+                    self.player.location,
+                    [self.player.time_to_reload, self.score, self.status.value],
+                    self.enemy_locations.ravel(),
+                    self.enemy_time_to_reload,
+                    self.bullet_locations.ravel(),
+                    self.bullet_velocities.ravel(),
+                    self.bullet_is_player,
+                ]
+            ).tobytes(),
+            enemies_count=self.enemies_count,
+            bullets_count=len(self.bullet_is_player),
+        )
+
+    def restore(self, snapshot: BoardSnapshot):
+        """Set the board state to a snapshot."""
+        enemies_count, bullets_count = snapshot.enemies_count, snapshot.bullets_count
+        # Copy once, so the board owns all of its arrays. Slicing at plain
+        # offsets is much faster than np.split for these small arrays.
+        data = np.frombuffer(snapshot.data).copy()
+        reloads_start = 5 + 2 * enemies_count
+        bullets_start = reloads_start + enemies_count
+        velocities_start = bullets_start + 2 * bullets_count
+        is_player_start = velocities_start + 2 * bullets_count
+        state = data[:5]
+        enemy_locations = data[5:reloads_start]
+        self.enemy_time_to_reload = data[reloads_start:bullets_start]
+        bullet_locations = data[bullets_start:velocities_start]
+        bullet_velocities = data[velocities_start:is_player_start]
+        bullet_is_player = data[is_player_start:]
+        self.player.location = state[:2]
+        self.player.time_to_reload = float(state[2])
+        self.score = int(state[3])
+        self.status = GameStatus(int(state[4]))
+        self.enemy_locations = enemy_locations.reshape(enemies_count, 2)
+        self.bullet_locations = bullet_locations.reshape(bullets_count, 2)
+        self.bullet_velocities = bullet_velocities.reshape(bullets_count, 2)
+        self.bullet_is_player = bullet_is_player.astype(bool)
+
+    def fork(self, games_count: int, seed: Optional[int] = None) -> "BatchedBoard":
+        """
+        Make independent copies of the board, as games of a batched board.
+
+        Lost games of the copies are not reset. Only boards with a single enemy
+        can be forked.
+        """
+        # Batched boards are built on top of boards, so import them lazily.
+        from shooter.batched_board import (  # pylint: disable=import-outside-toplevel
+            BatchedBoard,
+        )
+
+        return BatchedBoard.from_board(self, games_count=games_count, seed=seed)
+
+    def respawn_enemies(self, enemies: np.ndarray):
+        """Respawn the given enemies so they don't touch the player."""
+        self.enemy_locations[enemies] = random_squares_not_intersecting(
+            others=np.broadcast_to(self.player.location, (len(enemies), 2)),
+            width=self.shooter_width,
+            margin=self.shooter_width,
+            rng=self.rng,
+            candidates_count=self.spawn_candidates,
+            stats=self.stats,
+        )
 
     def update(
         self,
@@ -89,14 +281,171 @@ class Board:
         should_shoot: bool,
     ):
         """Update board."""
+        stats = self.stats
+        start_time = phase_time = time.perf_counter() if stats is not None else 0.0
+        player_start, enemy_starts = None, None
+        if self.collision_mode == SWEPT_COLLISIONS:
+            player_start, enemy_starts = (
+                self.player.location,
+                self.enemy_locations.copy(),
+            )
         self.update_player(
             delta_time=delta_time,
             move_direction=move_direction,
             shoot_angle_radians=shoot_angle_radians,
             should_shoot=should_shoot,
         )
-        self.update_enemy(delta_time)
-        self.update_bullets(delta_time)
+        if stats is not None:
+            phase_time = stats.lap("update_player", phase_time)
+        self.update_enemies(delta_time)
+        if stats is not None:
+            phase_time = stats.lap("update_enemies", phase_time)
+        self.update_bullets(
+            delta_time, player_start=player_start, enemy_starts=enemy_starts
+        )
+        if stats is not None:
+            stats.lap("update_bullets", phase_time)
+            stats.lap("update", start_time)
+
+    def advance_until(  # pylint: disable=too-many-arguments
+        self,
+        max_time: float,
+        move_direction: Optional[Direction],
+        shoot_angle_radians: float,
+        should_shoot: bool,
+        max_step: float = 0.05,
+    ) -> float:
+        """
+        Repeat an action for some time, jumping from one event to the next.
+
+        Events are bullets hitting shooters, enemies touching the player, the
+        player leaving the screen and shooters reloading. Between events,
+        everything moves in straight lines, so updates with swept collisions
+        jump straight to the next event. Enemies chase a moving player along
+        curves, so updates are at most ``max_step`` long while the player
+        moves.
+        Bullets leaving the screen don't change the rest of the game, so they
+        are removed at the next event instead of being events themselves.
+        Returns the time that passed, which is shorter than ``max_time`` only
+        if the game was lost.
+        """
+        elapsed_time = 0.0
+        while self.is_playing and elapsed_time < max_time:
+            # Reloaded shooters shoot at the start of a step, so their bullets
+            # start moving at the same time as everything else.
+            self.update_player(
+                delta_time=0,
+                move_direction=None,
+                shoot_angle_radians=shoot_angle_radians,
+                should_shoot=should_shoot,
+            )
+            self.update_enemies(0)
+            step = max_time - elapsed_time
+            if move_direction is not None:
+                step = min(step, max_step)
+            # Rounding errors may keep events just out of reach, so steps are
+            # never much shorter than EPSILON.
+            step = max(
+                self.next_event_time(step, move_direction, should_shoot),
+                min(step, EPSILON),
+            )
+            player_start = self.player.location
+            enemy_starts = self.enemy_locations.copy()
+            self.update_player(
+                delta_time=step,
+                move_direction=move_direction,
+                shoot_angle_radians=shoot_angle_radians,
+                should_shoot=False,
+            )
+            self.update_enemies(step, should_shoot=False)
+            self.update_bullets(
+                step,
+                player_start=player_start,
+                enemy_starts=enemy_starts,
+                collision_mode=SWEPT_COLLISIONS,
+            )
+            if self.stats is not None:
+                self.stats.count("advance_steps")
+            elapsed_time += step
+        return elapsed_time
+
+    def next_event_time(  # pylint: disable=too-many-locals
+        self,
+        max_time: float,
+        move_direction: Optional[Direction],
+        should_shoot: bool,
+    ) -> float:
+        """
+        Time of the next event while repeating an action, up to ``max_time``.
+
+        Shooters are assumed to move in straight lines. Reloading shooters
+        shoot as soon as they finish, so an event is due right away if any
+        shooter already finished reloading.
+        """
+        event_time = min(max_time, self.enemy_time_to_reload.min(initial=max_time))
+        if should_shoot:
+            event_time = min(event_time, self.player.time_to_reload)
+        player_velocity = (
+            self.player_speed * move_direction.to_vector()
+            if move_direction is not None
+            else np.zeros(2)
+        )
+        player_location = self.player.location
+        half_width = self.shooter_width / 2
+        # Time until an edge of the player is just past an edge of the screen.
+        moving = player_velocity != 0
+        leave_times = (
+            np.where(
+                player_velocity[moving] > 0,
+                1 - half_width - player_location[moving],
+                half_width - player_location[moving],
+            )
+            / player_velocity[moving]
+            + EPSILON
+        )
+        event_time = min(event_time, leave_times.min(initial=event_time))
+        # Enemies touch the player before they reach it, so they move at full
+        # speed until the next event.
+        directions = (
+            player_location + event_time * player_velocity - self.enemy_locations
+        )
+        distances = np.linalg.norm(directions, axis=1, keepdims=True)
+        enemy_velocities = np.where(
+            distances > EPSILON,
+            self.enemy_speed * directions / np.maximum(distances, EPSILON),
+            0,
+        )
+        is_player = self.bullet_is_player
+        hit_times = [
+            swept_squares_hit_times(
+                self.enemy_locations,
+                enemy_velocities,
+                self.shooter_width,
+                player_location,
+                player_velocity,
+                self.shooter_width,
+                duration=event_time,
+            ),
+            swept_squares_hit_times(
+                self.bullet_locations[~is_player],
+                self.bullet_velocities[~is_player],
+                self.bullet_width,
+                player_location,
+                player_velocity,
+                self.shooter_width,
+                duration=event_time,
+            ),
+            swept_squares_hit_times(
+                self.bullet_locations[is_player, np.newaxis],
+                self.bullet_velocities[is_player, np.newaxis],
+                self.bullet_width,
+                self.enemy_locations,
+                enemy_velocities,
+                self.shooter_width,
+                duration=event_time,
+            ).ravel(),
+        ]
+        return min(event_time, np.concatenate(hit_times).min(initial=event_time))
 
     def update_player(
         self,
@@ -113,38 +462,322 @@ class Board:
         else:
             self.player.update_time_to_reload(delta_time)
         if should_shoot and self.player.can_shoot:
-            self.bullets.append(self.player.shoot(shoot_angle_radians))
+            self.player.time_to_reload = self.player.reload_time
+            self.add_bullets(
+                locations=self.player.location[np.newaxis],
+                angles=np.array([shoot_angle_radians]),
+                is_player=True,
+            )
         if not self.player.valid:
             self.set_lost()
 
-    def update_enemy(self, delta_time):
-        """Update enemy location and shoot player if possible."""
-        self.enemy.move_towards(delta_time=delta_time, location=self.player.location)
-        if self.enemy.can_shoot:
-            bullet = self.enemy.shoot_towards(self.player.location)
-            self.bullets.append(bullet)
-        if self.enemy.is_intersecting(self.player):
+    def update_enemies(self, delta_time: float, should_shoot: bool = True):
+        """
+        Update enemies locations and shoot the player if possible.
+
+        Each enemy moves like :meth:`Shooter.move_towards` the player.
+        Enemies that should not shoot stay reloaded until they do.
+        """
+        move_towards(
+            self.enemy_locations,
+            targets=self.player.location,
+            max_distance=delta_time * self.enemy_speed,
+        )
+        self.enemy_time_to_reload = np.maximum(
+            0, self.enemy_time_to_reload - delta_time
+        )
+        shooting = np.flatnonzero(should_shoot & (self.enemy_time_to_reload == 0))
+        self.enemy_time_to_reload[shooting] = self.enemy_reload_time
+        delta = self.player.location - self.enemy_locations[shooting]
+        self.add_bullets(
+            locations=self.enemy_locations[shooting],
+            angles=np.arctan2(delta[:, 1], delta[:, 0]),
+            is_player=False,
+        )
+        if squares_intersecting(
+            self.enemy_locations,
+            self.shooter_width,
+            self.player.location,
+            self.shooter_width,
+        ).any():
             self.set_lost()
 
-    def update_bullets(self, delta_time):
+    def update_bullets(
+        self,
+        delta_time: float,
+        player_start: Optional[np.ndarray] = None,
+        enemy_starts: Optional[np.ndarray] = None,
+        collision_mode: Optional[str] = None,
+    ):
         """
         Update bullets.
 
         1. Update bullet location
         2. Check if bullet hit player. If it does than we lost
-        3. Check if bullet hit enemy. If it does, gain points and respawn
+        3. Check if bullet hit an enemy. If it does, gain points and respawn it
         4. Remove not relevant bullets.
+
+        Collisions are found with the board's collision mode, unless another
+        one is given. With swept collisions, shooters move in straight lines
+        from their start locations, if given, to their current locations during
+        the update.
+        """
+        self.bullet_locations += delta_time * self.bullet_velocities
+        if self.stats is not None:
+            self.stats.count("bullets_processed", len(self.bullet_locations))
+        if self.broad_phase == SPATIAL_HASH_BROAD_PHASE:
+            self.spatial_hash.build(self.bullet_locations)
+        removed = np.zeros_like(self.bullet_is_player)
+        if collision_mode is None:
+            collision_mode = self.collision_mode
+        if collision_mode == DISCRETE_COLLISIONS:
+            self.discrete_bullet_collisions(removed)
+        else:
+            self.swept_bullet_collisions(
+                removed,
+                delta_time=delta_time,
+                player_start=(
+                    self.player.location if player_start is None else player_start
+                ),
+                enemy_starts=(
+                    self.enemy_locations if enemy_starts is None else enemy_starts
+                ),
+            )
+        self.keep_bullets(
+            ~removed & squares_in_screen(self.bullet_locations, self.bullet_width)
+        )
+
+    def discrete_bullet_collisions(self, removed: np.ndarray):
+        """
+        Hit shooters with bullets touching them, and mark the bullets as removed.
+
+        Bullets are handled in the order they were shot, so a bullet shot after
+        one that hit an enemy is tested against the respawned enemy. A bullet
+        hitting several enemies only hits the first of them.
+        """
+        hitting_player, _ = self.bullet_hits(
+            self.player.location[np.newaxis], is_player=False
+        )
+        if len(hitting_player) != 0:
+            self.set_lost()
+        removed[hitting_player] = True
+        bullets, enemies = self.bullet_hits(self.enemy_locations, is_player=True)
+        respawn_time = time.perf_counter() if self.stats is not None else 0.0
+        while len(bullets) != 0:
+            hit_index, enemy = bullets[0], enemies[0]
+            removed[hit_index] = True
+            if self.stats is not None:
+                self.stats.count("enemy_hits")
+            self.score += self.hit_score
+            self.respawn_enemies(np.array([enemy]))
+            # Only hits of the respawned enemy changed, so test it again.
+            respawned_bullets, _ = self.bullet_hits(
+                self.enemy_locations[[enemy]], is_player=True
+            )
+            later = (bullets > hit_index) & (enemies != enemy)
+            respawned_bullets = respawned_bullets[respawned_bullets > hit_index]
+            bullets = np.concatenate([bullets[later], respawned_bullets])
+            enemies = np.concatenate(
+                [enemies[later], np.full(len(respawned_bullets), enemy)]
+            )
+            order = np.lexsort((enemies, bullets))
+            bullets, enemies = bullets[order], enemies[order]
+        if self.stats is not None:
+            self.stats.lap("respawn_loop", respawn_time)
+
+    def swept_bullet_collisions(
+        self,
+        removed: np.ndarray,
+        delta_time: float,
+        player_start: np.ndarray,
+        enemy_starts: np.ndarray,
+    ):
         """
-        kept_bullets = []
-        for bullet in self.bullets:
-            bullet.update(delta_time)
-            if bullet.is_hitting(self.player):
-                self.set_lost()
-                continue
-            if bullet.is_hitting(self.enemy):
-                self.score += self.hit_score
-                self.respawn_enemy()
-                continue
-            if bullet.valid:
-                kept_bullets.append(bullet)
-        self.bullets = kept_bullets
+        Hit shooters with bullets crossing their paths, and mark the bullets as
+        removed.
+
+        Hits are handled in the order they happen. A respawned enemy stands
+        still for the rest of the update, and is tested again against the
+        bullets from the time it was hit on.
+        """
+        hitting_player, _, _ = self.swept_bullet_hits(
+            player_start[np.newaxis],
+            self.player.location[np.newaxis],
+            is_player=False,
+            delta_time=delta_time,
+        )
+        if len(hitting_player) != 0:
+            self.set_lost()
+        removed[hitting_player] = True
+        bullets, enemies, hit_times = self.swept_bullet_hits(
+            enemy_starts, self.enemy_locations, is_player=True, delta_time=delta_time
+        )
+        respawn_time = time.perf_counter() if self.stats is not None else 0.0
+        while len(bullets) != 0:
+            hit_index, enemy, hit_time = bullets[0], enemies[0], hit_times[0]
+            removed[hit_index] = True
+            if self.stats is not None:
+                self.stats.count("enemy_hits")
+            self.score += self.hit_score
+            self.respawn_enemies(np.array([enemy]))
+            respawned_location = self.enemy_locations[[enemy]]
+            respawned_bullets, _, respawned_times = self.swept_bullet_hits(
+                respawned_location,
+                respawned_location,
+                is_player=True,
+                delta_time=delta_time,
+                start_time=hit_time,
+            )
+            alive = ~removed[respawned_bullets]
+            others = (bullets != hit_index) & (enemies != enemy)
+            bullets = np.concatenate([bullets[others], respawned_bullets[alive]])
+            enemies = np.concatenate(
+                [enemies[others], np.full(np.count_nonzero(alive), enemy)]
+            )
+            hit_times = np.concatenate([hit_times[others], respawned_times[alive]])
+            order = np.lexsort((enemies, bullets, hit_times))
+            bullets, enemies, hit_times = (
+                bullets[order],
+                enemies[order],
+                hit_times[order],
+            )
+        if self.stats is not None:
+            self.stats.lap("respawn_loop", respawn_time)
+
+    def bullet_hits(
+        self, shooter_locations: np.ndarray, is_player: bool
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find bullets hitting shooters.
+
+        Only bullets shot by the player, or only bullets shot by enemies, are
+        tested. With the spatial hash broad phase, only bullets near a shooter
+        are tested against it at all.
+        Returns the indices of the bullets and of the shooters they hit, ordered
+        by bullet, then by shooter.
+        """
+        if self.broad_phase == BRUTE_FORCE_BROAD_PHASE:
+            candidates = np.flatnonzero(self.bullet_is_player == is_player)
+            if self.stats is not None:
+                self.stats.count(
+                    "collision_tests", len(candidates) * len(shooter_locations)
+                )
+            bullets, shooters = np.nonzero(
+                squares_intersecting(
+                    self.bullet_locations[candidates, np.newaxis],
+                    self.bullet_width,
+                    shooter_locations,
+                    self.shooter_width,
+                )
+            )
+            return candidates[bullets], shooters
+        # Bullets are hashed by their centers, so look around each shooter up to
+        # half a bullet width away.
+        half_width = (self.shooter_width + self.bullet_width) / 2
+        shooters, bullets = self.spatial_hash.query(
+            shooter_locations - half_width, shooter_locations + half_width
+        )
+        if self.stats is not None:
+            self.stats.count("collision_tests", len(bullets))
+        hitting = (self.bullet_is_player[bullets] == is_player) & squares_intersecting(
+            self.bullet_locations[bullets],
+            self.bullet_width,
+            shooter_locations[shooters],
+            self.shooter_width,
+        )
+        shooters, bullets = shooters[hitting], bullets[hitting]
+        order = np.lexsort((shooters, bullets))
+        return bullets[order], shooters[order]
+
+    def swept_bullet_hits(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        shooter_starts: np.ndarray,
+        shooter_ends: np.ndarray,
+        is_player: bool,
+        delta_time: float,
+        start_time: float = 0.0,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find bullets hitting shooters anywhere along their paths in an update.
+
+        Bullets moved to their current locations during the update, while
+        shooters moved in straight lines from their start locations to their end
+        locations. Only hits from ``start_time`` in the update on are found.
+        Returns the indices of the bullets, of the shooters they hit and the
+        earliest hit times, ordered by time, then by bullet, then by shooter.
+        """
+        duration = delta_time - start_time
+        shooter_velocities = (
+            (shooter_ends - shooter_starts) / delta_time
+            if delta_time != 0
+            else np.zeros_like(shooter_starts)
+        )
+        # Sweep from the locations at the start time to the current locations.
+        shooter_locations = shooter_ends - duration * shooter_velocities
+        bullet_locations = self.bullet_locations - duration * self.bullet_velocities
+        if self.broad_phase == BRUTE_FORCE_BROAD_PHASE:
+            candidates = np.flatnonzero(self.bullet_is_player == is_player)
+            if self.stats is not None:
+                self.stats.count(
+                    "collision_tests", len(candidates) * len(shooter_locations)
+                )
+            times = swept_squares_hit_times(
+                bullet_locations[candidates, np.newaxis],
+                self.bullet_velocities[candidates, np.newaxis],
+                self.bullet_width,
+                shooter_locations,
+                shooter_velocities,
+                self.shooter_width,
+                duration=duration,
+            )
+            bullets, shooters = np.nonzero(np.isfinite(times))
+            times = times[bullets, shooters]
+            bullets = candidates[bullets]
+        else:
+            # Bullets are hashed by their current locations, so look around the
+            # whole path of each shooter, up to the distance bullets moved.
+            reach = (self.shooter_width + self.bullet_width) / 2 + duration * np.abs(
+                self.bullet_velocities
+            ).max(initial=0)
+            shooters, bullets = self.spatial_hash.query(
+                np.minimum(shooter_locations, shooter_ends) - reach,
+                np.maximum(shooter_locations, shooter_ends) + reach,
+            )
+            if self.stats is not None:
+                self.stats.count("collision_tests", len(bullets))
+            times = swept_squares_hit_times(
+                bullet_locations[bullets],
+                self.bullet_velocities[bullets],
+                self.bullet_width,
+                shooter_locations[shooters],
+                shooter_velocities[shooters],
+                self.shooter_width,
+                duration=duration,
+            )
+            hitting = (self.bullet_is_player[bullets] == is_player) & np.isfinite(times)
+            bullets, shooters, times = (
+                bullets[hitting],
+                shooters[hitting],
+                times[hitting],
+            )
+        order = np.lexsort((shooters, bullets, times))
+        return bullets[order], shooters[order], start_time + times[order]
+
+    def add_bullets(self, locations: np.ndarray, angles: np.ndarray, is_player: bool):
+        """Add bullets shot from the given locations in the given directions."""
+        self.bullet_locations = np.concatenate([self.bullet_locations, locations])
+        self.bullet_velocities = np.concatenate(
+            [
+                self.bullet_velocities,
+                self.bullet_speed * np.stack([np.cos(angles), np.sin(angles)], axis=1),
+            ]
+        )
+        self.bullet_is_player = np.concatenate(
+            [self.bullet_is_player, np.full(len(locations), is_player)]
+        )
+
+    def keep_bullets(self, keep: np.ndarray):
+        """Keep only the bullets in mask."""
+        self.bullet_locations = self.bullet_locations[keep]
+        self.bullet_velocities = self.bullet_velocities[keep]
+        self.bullet_is_player = self.bullet_is_player[keep]
@@ -1,2 +1 @@
 from shooter.cli.main_cli import shooter_cli  # noqa
-from shooter.cli.play_cli import play_cli  # noqa
@@ -0,0 +1,73 @@
+"""CLI command to benchmark the simulation core."""
+import sys
+from typing import Optional, Tuple
+
+import click
+
+from shooter.benchmark import (
+    BENCHMARKS,
+    DEFAULT_MIN_TIME,
+    DEFAULT_REPEATS,
+    DEFAULT_THRESHOLD,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+@click.command("benchmark")
+@click.argument("names", nargs=-1, type=click.Choice(list(BENCHMARKS)))
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Save results as JSON to this file.",
+)
+@click.option(
+    "-b",
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare results to a baseline JSON file.",
+)
+@click.option(
+    "-t",
+    "--threshold",
+    type=float,
+    default=DEFAULT_THRESHOLD,
+    show_default=True,
+    help="Relative slowdown from the baseline that counts as a regression.",
+)
+@click.option("--min-time", type=float, default=DEFAULT_MIN_TIME, show_default=True)
+@click.option("--repeats", type=int, default=DEFAULT_REPEATS, show_default=True)
+def benchmark_cli(  # pylint: disable=too-many-arguments
+    names: Tuple[str, ...],
+    output: Optional[str],
+    baseline: Optional[str],
+    threshold: float,
+    min_time: float,
+    repeats: int,
+):
+    """
+    Benchmark the simulation core.
+
+    Runs the given benchmarks, or all of them if none are given.
+    Exits with an error if any benchmark regressed from the baseline.
+    """
+    results = run_benchmarks(names or None, min_time=min_time, repeats=repeats)
+    for name, seconds in results.items():
+        click.echo(f"{name}: {seconds * 1e6:.3f} usec ({1 / seconds:.1f}/sec)")
+    if output is not None:
+        save_results(results, output)
+    if baseline is None:
+        return
+    regressions = compare_results(results, load_results(baseline), threshold=threshold)
+    for regression in regressions:
+        click.echo(
+            f"Regression in {regression.name}: "
+            f"{regression.baseline * 1e6:.3f} usec -> "
+            f"{regression.current * 1e6:.3f} usec (x{regression.ratio:.2f})",
+            err=True,
+        )
+    if len(regressions) != 0:
+        sys.exit(1)
@@ -0,0 +1,57 @@
+"""CLI command to load test a shooter server."""
+import asyncio
+from typing import Optional
+
+import click
+
+from shooter.load_test import DEFAULT_ACTIONS_PER_SECOND, load_test
+from shooter.server import DEFAULT_HOST, DEFAULT_PORT
+
+
+@click.command("load-test")
+@click.option("--host", default=DEFAULT_HOST, show_default=True)
+@click.option("-p", "--port", type=int, default=DEFAULT_PORT, show_default=True)
+@click.option(
+    "--unix",
+    "path",
+    type=click.Path(dir_okay=False),
+    help="Connect to this Unix socket instead of a TCP port.",
+)
+@click.option("-n", "--sessions", type=int, default=1000, show_default=True)
+@click.option("-s", "--seconds", type=float, default=10.0, show_default=True)
+@click.option(
+    "-a",
+    "--actions-per-second",
+    type=float,
+    default=DEFAULT_ACTIONS_PER_SECOND,
+    show_default=True,
+    help="Mean actions sent by each client per second.",
+)
+@click.option("--seed", type=int)
+def load_test_cli(  # pylint: disable=too-many-arguments
+    host: str,
+    port: int,
+    path: Optional[str],
+    sessions: int,
+    seconds: float,
+    actions_per_second: float,
+    seed: Optional[int],
+):
+    """Connect many clients to a server and report how fast states arrive."""
+    result = asyncio.run(
+        load_test(
+            sessions=sessions,
+            seconds=seconds,
+            host=host,
+            port=port,
+            path=path,
+            actions_per_second=actions_per_second,
+            seed=seed,
+        )
+    )
+    click.echo(f"Sessions: {result.sessions} for {result.seconds:.3f} seconds")
+    click.echo(f"States/sec: {result.states_per_second:.1f}")
+    click.echo(f"Bytes/sec: {result.bytes_per_second:.1f}")
+    click.echo(f"Keyframes: {result.keyframes_received}")
+    click.echo(f"Actions: {result.actions_sent}")
+    click.echo(f"Errors: {result.errors}")
@@ -1,7 +1,84 @@
 """Main CLI group."""
+import importlib
+from typing import Dict, List, NamedTuple, Optional
+
 import click
+from click.utils import make_default_short_help
+
+
+class LazyCommand(NamedTuple):
+    """A subcommand that is only imported when it is used."""
+
+    import_path: str
+    short_help: str
+
+
+# Subcommands import heavy modules like pygame, so they are only imported when
+# they run. Their short help is kept here, so listing them imports nothing.
+LAZY_COMMANDS: Dict[str, LazyCommand] = {
+    "benchmark": LazyCommand(
+        "shooter.cli.benchmark_cli:benchmark_cli", "Benchmark the simulation core."
+    ),
+    "load-test": LazyCommand(
+        "shooter.cli.load_test_cli:load_test_cli",
+        "Connect many clients to a server and report how fast states arrive.",
+    ),
+    "play": LazyCommand("shooter.cli.play_cli:play_cli", "Play Shooter!"),
+    "replay": LazyCommand(
+        "shooter.cli.replay_cli:replay_cli",
+        "Play back a replay file, starting from an episode.",
+    ),
+    "serve": LazyCommand(
+        "shooter.cli.serve_cli:serve_cli",
+        "Host games for remote clients, until interrupted.",
+    ),
+    "simulate": LazyCommand(
+        "shooter.cli.simulate_cli:simulate_cli",
+        "Simulate games headlessly and report simulation speed.",
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """Group importing its subcommands only when they are used."""
+
+    def __init__(self, *args, lazy_commands: Dict[str, LazyCommand], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_commands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_commands:
+            return load_command(self.lazy_commands[cmd_name].import_path)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        cmd_names = self.list_commands(ctx)
+        if len(cmd_names) == 0:
+            return
+        # Truncate short help like click does, without importing the commands.
+        limit = formatter.width - 6 - max(len(cmd_name) for cmd_name in cmd_names)
+        rows = [
+            (
+                cmd_name,
+                make_default_short_help(self.lazy_commands[cmd_name].short_help, limit)
+                if cmd_name in self.lazy_commands
+                else self.commands[cmd_name].get_short_help_str(limit),
+            )
+            for cmd_name in cmd_names
+        ]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+def load_command(import_path: str) -> click.Command:
+    """Import a command from a ``module:attribute`` path."""
+    module_name, attribute = import_path.split(":")
+    return getattr(importlib.import_module(module_name), attribute)
 
 
-@click.group("shooter")
+@click.group("shooter", cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 def shooter_cli():
     """Main group for cli."""
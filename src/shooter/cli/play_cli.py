@@ -1,14 +1,24 @@
 """CLI command to play shooter."""
-import datetime
+from typing import Optional
 
+import click
 import numpy as np
 import pygame
 
 from shooter.board import Board
-from shooter.cli.main_cli import shooter_cli
-from shooter.cli.pygame_util import draw_rect, to_board_location, to_screen_location
-from shooter.constants import BLACK, BLUE, RED, SCREEN_SIZE, WHITE
+from shooter.cli.pygame_util import to_board_location
+from shooter.cli.renderer import BoardRenderer
+from shooter.constants import SCREEN_SIZE
 from shooter.direction import Direction
+from shooter.game_loop import (
+    DEFAULT_MAX_TICKS_PER_FRAME,
+    DEFAULT_TICK_RATE,
+    FixedTimestep,
+    board_positions,
+    interpolate_positions,
+)
+from shooter.instrumentation import BoardStats
+from shooter.replay import ReplayWriter
 from shooter.utils import direction_vector
 
 DIRECTIONS_DICT = {
@@ -19,22 +29,67 @@ DIRECTIONS_DICT = {
 }
 
 
-@shooter_cli.command("play")
-def play_cli():  # pylint: disable=too-many-branches,too-many-locals
-    """Play Shooter!"""
+@click.command("play")
+@click.option("-e", "--enemies", type=int, default=1, show_default=True)
+@click.option(
+    "--record",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Record the games into this replay file.",
+)
+@click.option(
+    "--tick-rate",
+    type=float,
+    default=DEFAULT_TICK_RATE,
+    show_default=True,
+    help="Board updates per second.",
+)
+@click.option(
+    "--fps",
+    type=int,
+    default=60,
+    show_default=True,
+    help="Maximal frames drawn per second.",
+)
+@click.option(
+    "--max-ticks-per-frame",
+    type=int,
+    default=DEFAULT_MAX_TICKS_PER_FRAME,
+    show_default=True,
+    help="Board updates to catch up with in a single frame, before slowing down.",
+)
+@click.option("--stats", is_flag=True, help="Print timings of board update phases.")
+def play_cli(  # pylint: disable=too-many-branches,too-many-locals,too-many-statements
+    enemies: int,
+    record: Optional[str],
+    tick_rate: float,
+    fps: int,
+    max_ticks_per_frame: int,
+    stats: bool,
+):
+    """
+    Play Shooter!
+
+    The board is updated in fixed ticks, and frames are drawn between them.
+    """
     pygame.init()
 
     # Set up the drawing window
     screen = pygame.display.set_mode([SCREEN_SIZE, SCREEN_SIZE])
-    font = pygame.font.SysFont("Ariel", 24)
-    board = Board()
+    renderer = BoardRenderer(screen, font=pygame.font.SysFont("Ariel", 24))
+    board = Board(enemies_count=enemies, stats=BoardStats() if stats else None)
+    recorder = ReplayWriter(record) if record is not None else None
+    if recorder is not None:
+        recorder.record(board)
 
     # Run until the user asks to quit
     running = True
     clock = pygame.time.Clock()
     should_shoot = False
     direction = None
-    last_update_time = datetime.datetime.now()
+    timestep = FixedTimestep(
+        tick_rate=tick_rate, max_ticks_per_frame=max_ticks_per_frame
+    )
+    previous_positions = board_positions(board)
     while running:
         # Did the user click the window close button?
         for event in pygame.event.get():
@@ -50,56 +105,58 @@ def play_cli():  # pylint: disable=too-many-branches,too-many-locals
                     should_shoot = False
                 if event.key == pygame.K_r:
                     board.reset()
-                    last_update_time = datetime.datetime.now()
+                    timestep.restart()
+                    previous_positions = board_positions(board)
+                    if recorder is not None:
+                        recorder.end_episode()
+                        recorder.record(board)
                 if DIRECTIONS_DICT.get(event.key) == direction:
                     direction = None
 
-        # Fill the background with white
-        screen.fill(WHITE)
-
         # Get direction of shooting angle
         mouse_position = to_board_location(pygame.mouse.get_pos())
         delta_x, delta_y = mouse_position - board.player.location
         angle_radians = np.arctan2(delta_y, delta_x)
 
-        # Update board if still playing
-        if board.is_playing:
-            now_time = datetime.datetime.now()
-            delta_time = (now_time - last_update_time).total_seconds()
-            board.update(
-                delta_time=delta_time,
-                move_direction=direction,
-                shoot_angle_radians=angle_radians,
-                should_shoot=should_shoot,
-            )
-            last_update_time = now_time
-
-        # Draw board
-
-        img = font.render(f"Score: {board.score}", False, BLACK)
-        rect = img.get_rect()
-        rect.midtop = to_screen_location(np.array([0.5, 0]))
-        screen.blit(img, rect)
+        # Update board in fixed ticks while still playing
+        for _ in range(timestep.advance()):
+            if not board.is_playing:
+                break
+            previous_positions = board_positions(board)
+            update_arguments = {
+                "delta_time": timestep.tick_duration,
+                "move_direction": direction,
+                "shoot_angle_radians": float(angle_radians),
+                "should_shoot": should_shoot,
+            }
+            board.update(**update_arguments)
+            if recorder is not None:
+                recorder.record(board, **update_arguments)
 
-        draw_rect(screen, color=BLUE, square=board.player)
+        # Draw board between the last two ticks
+        aim_end = None
         if board.is_playing:
-            end_pos = board.player.location + 2 * board.player.width * direction_vector(
-                angle_radians
+            positions = interpolate_positions(
+                previous_positions,
+                board,
+                alpha=timestep.alpha,
+                tick_duration=timestep.tick_duration,
             )
-            pygame.draw.line(
-                screen,
-                color=BLUE,
-                start_pos=to_screen_location(board.player.location),
-                end_pos=to_screen_location(end_pos),
+            aim_end = positions.player_location + 2 * board.player.width * (
+                direction_vector(angle_radians)
             )
-        draw_rect(screen, color=RED, square=board.enemy)
-        for bullet in board.bullets:
-            color = BLUE if bullet.shooter_id == board.player.shooter_id else RED
-            draw_rect(screen, color=color, square=bullet)
+        else:
+            positions = board_positions(board)
+        renderer.render(board, positions=positions, aim_end=aim_end)
+        if renderer.stats.frames_count % fps == 0:
+            pygame.display.set_caption(f"Shooter - {renderer.stats.summary()}")
 
-        # Flip the display
-        clock.tick(60)
-        pygame.display.flip()
+        clock.tick(fps)
 
     # Done! Time to quit.
+    if recorder is not None:
+        recorder.close()
     pygame.quit()
+    click.echo(renderer.stats.summary())
+    if board.stats is not None:
+        click.echo(board.stats.report())
@@ -1,21 +1,23 @@
 """Utility methods for playing shooter."""
-from typing import Tuple
+import functools
+from typing import List, Tuple
 
 import numpy as np
 import pygame
 
 from shooter.constants import SCREEN_SIZE
+from shooter.rasterizer import to_pixel_location, to_pixel_size
 from shooter.square import Square
 
 
 def to_screen_size(size: float):
     """Turn board size to screen size."""
-    return int(size * SCREEN_SIZE)
+    return to_pixel_size(size, SCREEN_SIZE)
 
 
 def to_screen_location(location: np.ndarray):
     """Turn board location to screen location."""
-    return (SCREEN_SIZE * location).astype(np.int)
+    return to_pixel_location(location, SCREEN_SIZE)
 
 
 def to_board_location(location: Tuple[int, int]):
@@ -25,6 +27,49 @@ def to_board_location(location: Tuple[int, int]):
 
 def draw_rect(screen: pygame.Surface, square: Square, color: Tuple[int, int, int]):
     """Draw square on screen."""
-    top_left = to_screen_location(square.top_left)
-    width = to_screen_size(square.width)
-    pygame.draw.rect(screen, color, pygame.Rect(*top_left, width, width))
+    draw_square(screen, location=square.location, width=square.width, color=color)
+
+
+def draw_square(
+    screen: pygame.Surface,
+    location: np.ndarray,
+    width: float,
+    color: Tuple[int, int, int],
+):
+    """Draw a square with a given center location on screen."""
+    top_left = to_screen_location(location - width / 2)
+    screen_width = to_screen_size(width)
+    pygame.draw.rect(screen, color, pygame.Rect(*top_left, screen_width, screen_width))
+
+
+@functools.lru_cache(maxsize=None)
+def square_sprite(screen_width: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    """A filled square surface, made once for each size and color."""
+    sprite = pygame.Surface((screen_width, screen_width))
+    sprite.fill(color)
+    return sprite
+
+
+def draw_squares(
+    screen: pygame.Surface,
+    locations: np.ndarray,
+    width: float,
+    color: Tuple[int, int, int],
+) -> List[Tuple[int, int, int, int]]:
+    """
+    Draw squares with the given center locations on screen, all at once.
+
+    All locations are converted to the screen together, and the squares are
+    blitted as a single batch of sprites. Returns the rectangles drawn.
+    """
+    screen_width = to_screen_size(width)
+    top_lefts = to_screen_location(np.reshape(locations, (-1, 2)) - width / 2).tolist()
+    sprite = square_sprite(screen_width, color)
+    blits = [(sprite, top_left) for top_left in top_lefts]
+    # Surface.fblits skips the per blit bookkeeping, but only exists since
+    # pygame 2.6.
+    if hasattr(screen, "fblits"):
+        screen.fblits(blits)
+    else:
+        screen.blits(blits, doreturn=False)
+    return [(x, y, screen_width, screen_width) for x, y in top_lefts]
@@ -0,0 +1,160 @@
+"""Draw boards on the game window, updating only the parts that changed."""
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from shooter.board import Board
+from shooter.cli.pygame_util import draw_squares, to_screen_location
+from shooter.constants import BLACK, BLUE, RED, WHITE
+from shooter.game_loop import BoardPositions, board_positions
+
+DEFAULT_STATS_FRAMES = 60
+DEFAULT_MAX_DIRTY_RECTS = 512
+
+RectLike = Tuple[int, int, int, int]
+
+
+class FrameStats:
+    """Frame rate and draw time, measured over the last frames."""
+
+    def __init__(self, frames_count: int = DEFAULT_STATS_FRAMES):
+        self.frame_times: Deque[float] = deque(maxlen=frames_count + 1)
+        self.draw_times: Deque[float] = deque(maxlen=frames_count)
+        self.frames_count = 0
+
+    def record_frame(self, draw_seconds: float, frame_time: Optional[float] = None):
+        """Record a drawn frame, and the time it took to draw."""
+        self.frame_times.append(
+            time.perf_counter() if frame_time is None else frame_time
+        )
+        self.draw_times.append(draw_seconds)
+        self.frames_count += 1
+
+    @property
+    def fps(self) -> float:
+        """Frames per second."""
+        if len(self.frame_times) < 2:
+            return 0.0
+        elapsed = self.frame_times[-1] - self.frame_times[0]
+        return (len(self.frame_times) - 1) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def mean_draw_seconds(self) -> float:
+        """Mean time it took to draw a frame."""
+        if len(self.draw_times) == 0:
+            return 0.0
+        return sum(self.draw_times) / len(self.draw_times)
+
+    def summary(self) -> str:
+        """Short text of the frame stats."""
+        return f"{self.fps:.1f} FPS, draw {1000 * self.mean_draw_seconds:.2f} ms"
+
+
+class BoardRenderer:
+    """
+    Draw boards on a screen, and update the display.
+
+    Only the areas drawn in the last frame and in this frame are cleared and
+    updated on the display. Text surfaces are only rendered when their text
+    changes. When too many areas changed, the whole display is updated instead.
+    """
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        font: pygame.font.Font,
+        max_dirty_rects: int = DEFAULT_MAX_DIRTY_RECTS,
+    ):
+        self.screen = screen
+        self.font = font
+        self.max_dirty_rects = max_dirty_rects
+        self.stats = FrameStats()
+        self.texts: Dict[str, Tuple[str, pygame.Surface]] = {}
+        self.previous_rects: List[RectLike] = []
+        self.background = pygame.Surface(screen.get_size())
+        self.background.fill(WHITE)
+        self.screen.blit(self.background, (0, 0))
+        self.full_update = True
+
+    def text_surface(self, slot: str, text: str) -> pygame.Surface:
+        """Surface of a text, rendered again only when the text in a slot changes."""
+        cached = self.texts.get(slot)
+        if cached is None or cached[0] != text:
+            cached = (text, self.font.render(text, False, BLACK))
+            self.texts[slot] = cached
+        return cached[1]
+
+    def draw_text(self, slot: str, text: str, **position) -> RectLike:
+        """Draw a text at a position of its rectangle, like ``midtop``."""
+        surface = self.text_surface(slot, text)
+        return tuple(self.screen.blit(surface, surface.get_rect(**position)))
+
+    def render(
+        self,
+        board: Board,
+        positions: Optional[BoardPositions] = None,
+        aim_end: Optional[np.ndarray] = None,
+        footer: Optional[str] = None,
+    ):
+        """
+        Draw a board, at the given positions or at its own locations.
+
+        An aim line is drawn from the player to ``aim_end``, and the footer text
+        is drawn at the bottom of the screen.
+        """
+        start_time = time.perf_counter()
+        if positions is None:
+            positions = board_positions(board)
+        # Filling many small rectangles is slow, so copy them all from the
+        # background in a single batch instead.
+        self.screen.blits(
+            [(self.background, rect[:2], rect) for rect in self.previous_rects],
+            doreturn=False,
+        )
+        rects: List[RectLike] = [
+            self.draw_text(
+                "score",
+                f"Score: {board.score}",
+                midtop=tuple(to_screen_location(np.array([0.5, 0]))),
+            )
+        ]
+        if footer is not None:
+            rects.append(
+                self.draw_text(
+                    "footer",
+                    footer,
+                    midbottom=tuple(to_screen_location(np.array([0.5, 1]))),
+                )
+            )
+        rects += draw_squares(
+            self.screen, positions.player_location, board.shooter_width, BLUE
+        )
+        rects += draw_squares(
+            self.screen, positions.enemy_locations, board.shooter_width, RED
+        )
+        is_player = positions.bullet_is_player
+        rects += draw_squares(
+            self.screen, positions.bullet_locations[~is_player], board.bullet_width, RED
+        )
+        rects += draw_squares(
+            self.screen, positions.bullet_locations[is_player], board.bullet_width, BLUE
+        )
+        if aim_end is not None:
+            line_rect = pygame.draw.line(
+                self.screen,
+                color=BLUE,
+                start_pos=tuple(to_screen_location(positions.player_location)),
+                end_pos=tuple(to_screen_location(aim_end)),
+            )
+            rects.append(tuple(line_rect))
+        dirty_rects = self.previous_rects + rects
+        if self.full_update or len(dirty_rects) > self.max_dirty_rects:
+            pygame.display.flip()
+            self.full_update = False
+        else:
+            pygame.display.update(dirty_rects)
+        self.previous_rects = rects
+        self.stats.record_frame(time.perf_counter() - start_time)
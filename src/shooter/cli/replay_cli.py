@@ -0,0 +1,95 @@
+"""CLI command to play back recorded games."""
+import click
+import numpy as np
+import pygame
+
+from shooter.board import Board
+from shooter.cli.renderer import BoardRenderer
+from shooter.constants import SCREEN_SIZE
+from shooter.replay import ReplayReader, restore_frame
+
+
+@click.command("replay")
+@click.argument("replay_file", type=click.Path(exists=True, dir_okay=False))
+@click.option("-e", "--episode", type=int, default=0, show_default=True)
+@click.option(
+    "--speed",
+    type=float,
+    default=1.0,
+    show_default=True,
+    help="Playback speed, relative to the recorded time.",
+)
+def replay_cli(  # pylint: disable=too-many-branches
+    replay_file: str, episode: int, speed: float
+):
+    """
+    Play back a replay file, starting from an episode.
+
+    Press space to pause, the arrows to step while paused, and up or down to
+    double or halve the playback speed.
+    """
+    reader = ReplayReader(replay_file)
+    if not 0 <= episode < reader.episodes_count:
+        raise click.BadParameter(
+            f"Replay has {reader.episodes_count} episodes", param_hint="--episode"
+        )
+    pygame.init()
+
+    # Set up the drawing window
+    screen = pygame.display.set_mode([SCREEN_SIZE, SCREEN_SIZE])
+    renderer = BoardRenderer(screen, font=pygame.font.SysFont("Ariel", 24))
+    board = Board()
+
+    running = True
+    paused = False
+    clock = pygame.time.Clock()
+    tick = 0
+    # Recorded time that passed since the current tick.
+    elapsed_time = 0.0
+    while running:
+        step = 0
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    paused = not paused
+                if event.key == pygame.K_UP:
+                    speed *= 2
+                if event.key == pygame.K_DOWN:
+                    speed /= 2
+                if event.key == pygame.K_RIGHT:
+                    step = 1
+                if event.key == pygame.K_LEFT:
+                    step = -1
+
+        delta_time = speed * clock.tick(60) / 1000
+        if paused:
+            tick += step
+        else:
+            elapsed_time += delta_time
+            # Each tick is shown for the time of the update that follows it.
+            while (
+                tick + 1 < reader.episode_length(episode)
+                and reader.frame(episode, tick + 1).delta_time <= elapsed_time
+            ):
+                tick += 1
+                elapsed_time -= reader.frame(episode, tick).delta_time
+        if tick >= reader.episode_length(episode) - 1 and not paused:
+            if episode + 1 < reader.episodes_count:
+                episode, tick, elapsed_time = episode + 1, 0, 0.0
+        if tick < 0 < episode:
+            episode -= 1
+            tick = reader.episode_length(episode) - 1
+        tick = int(np.clip(tick, 0, reader.episode_length(episode) - 1))
+
+        restore_frame(board, reader.frame(episode, tick))
+        renderer.render(
+            board,
+            footer=(
+                f"Episode {episode + 1}/{reader.episodes_count} "
+                f"tick {tick + 1}/{reader.episode_length(episode)} x{speed:g}"
+            ),
+        )
+
+    pygame.quit()
@@ -0,0 +1,59 @@
+"""CLI command to host shooter games for remote clients."""
+import asyncio
+from typing import Optional
+
+import click
+
+from shooter.server import (
+    DEFAULT_HOST,
+    DEFAULT_MAX_SESSIONS,
+    DEFAULT_PORT,
+    DEFAULT_SERVER_TICK_RATE,
+    GameServer,
+)
+
+
+@click.command("serve")
+@click.option("--host", default=DEFAULT_HOST, show_default=True)
+@click.option("-p", "--port", type=int, default=DEFAULT_PORT, show_default=True)
+@click.option(
+    "--unix",
+    "path",
+    type=click.Path(dir_okay=False),
+    help="Listen on this Unix socket instead of a TCP port.",
+)
+@click.option(
+    "-n", "--max-sessions", type=int, default=DEFAULT_MAX_SESSIONS, show_default=True
+)
+@click.option(
+    "-r",
+    "--tick-rate",
+    type=float,
+    default=DEFAULT_SERVER_TICK_RATE,
+    show_default=True,
+    help="Ticks per second of all games.",
+)
+@click.option("--seed", type=int)
+def serve_cli(  # pylint: disable=too-many-arguments
+    host: str,
+    port: int,
+    path: Optional[str],
+    max_sessions: int,
+    tick_rate: float,
+    seed: Optional[int],
+):
+    """Host games for remote clients, until interrupted."""
+    server = GameServer(max_sessions=max_sessions, tick_rate=tick_rate, seed=seed)
+    try:
+        asyncio.run(serve(server, host=host, port=port, path=path))
+    except KeyboardInterrupt:
+        pass
+    click.echo(server.stats.report())
+
+
+async def serve(server: GameServer, host: str, port: int, path: Optional[str]):
+    """Start the server and tick its games forever."""
+    listener = await server.start(host=host, port=port, path=path)
+    for socket in listener.sockets:
+        click.echo(f"Serving on {socket.getsockname()}")
+    await server.ticker
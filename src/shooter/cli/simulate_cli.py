@@ -0,0 +1,103 @@
+"""CLI command to simulate shooter games without a display."""
+import json
+from typing import Optional
+
+import click
+
+from shooter.constants import DEFAULT_DELTA_TIME
+from shooter.policies import POLICIES
+from shooter.replay import ReplayWriter
+from shooter.simulation import BATCHED_ENGINE, BOARD_ENGINE, ENGINES, simulate
+
+
+@click.command("simulate")
+@click.option("-n", "--games", type=int, default=64, show_default=True)
+@click.option("-s", "--steps", type=int, default=1000, show_default=True)
+@click.option(
+    "-d", "--delta-time", type=float, default=DEFAULT_DELTA_TIME, show_default=True
+)
+@click.option("--seed", type=int)
+@click.option(
+    "-p",
+    "--policy",
+    type=click.Choice(list(POLICIES)),
+    default="scripted",
+    show_default=True,
+)
+@click.option(
+    "-e",
+    "--engine",
+    type=click.Choice(ENGINES),
+    default=BATCHED_ENGINE,
+    show_default=True,
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of worker processes, for the pool engine.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write each finished episode as a JSON line to this file.",
+)
+@click.option(
+    "--record",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Record the games into this replay file, with the board engine.",
+)
+@click.option(
+    "--stats",
+    is_flag=True,
+    help="Print timings of board update phases, with the board engine.",
+)
+def simulate_cli(  # pylint: disable=too-many-arguments
+    games: int,
+    steps: int,
+    delta_time: float,
+    seed: Optional[int],
+    policy: str,
+    engine: str,
+    workers: int,
+    output: Optional[str],
+    record: Optional[str],
+    stats: bool,
+):
+    """Simulate games headlessly and report simulation speed."""
+    if record is not None and engine != BOARD_ENGINE:
+        raise click.UsageError(f"Recording requires the {BOARD_ENGINE} engine")
+    if stats and engine != BOARD_ENGINE:
+        raise click.UsageError(f"Stats require the {BOARD_ENGINE} engine")
+    recorder = ReplayWriter(record) if record is not None else None
+    try:
+        result = simulate(
+            games_count=games,
+            steps=steps,
+            delta_time=delta_time,
+            policy=POLICIES[policy],
+            seed=seed,
+            engine=engine,
+            workers_count=workers,
+            recorder=recorder,
+            collect_stats=stats,
+        )
+    finally:
+        if recorder is not None:
+            recorder.close()
+    click.echo(f"Steps: {result.steps} in {result.elapsed_seconds:.3f} seconds")
+    click.echo(f"Steps/sec: {result.steps_per_second:.1f}")
+    click.echo(f"Episodes: {len(result.episodes)}")
+    click.echo(f"Episodes/sec: {result.episodes_per_second:.1f}")
+    click.echo(f"Mean score: {result.mean_score:.3f}")
+    click.echo(f"Mean episode length: {result.mean_episode_length:.1f}")
+    if result.stats is not None:
+        click.echo()
+        click.echo(result.stats.report())
+    if output is not None:
+        with open(output, mode="w", encoding="utf-8") as output_file:
+            for episode in result.episodes:
+                output_file.write(json.dumps(episode._asdict()) + "\n")
@@ -1,6 +1,8 @@
 """Constants module."""
 EPSILON = 1e-5
 
+DEFAULT_DELTA_TIME = 0.05
+
 SCREEN_SIZE = 500
 
 WHITE = (255, 255, 255)
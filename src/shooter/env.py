@@ -0,0 +1,175 @@
+"""Gym environments for shooter."""
+from typing import Optional
+
+import gym
+import numpy as np
+from gym import spaces
+from gym.envs.registration import register, registry
+from gym.vector import VectorEnv
+
+from shooter.batched_board import NO_DIRECTION, BatchedBoard
+from shooter.board import Board
+from shooter.constants import DEFAULT_DELTA_TIME
+from shooter.direction import Direction
+from shooter.observation import (
+    DEFAULT_OBSERVED_BULLETS,
+    batched_board_observations,
+    board_observation,
+    observation_size,
+)
+
+ENV_ID = "Shooter-v0"
+MAX_EPISODE_STEPS = 2000
+
+# The last move action means not moving at all.
+NO_MOVE_ACTION = len(Direction)
+
+
+def make_action_space() -> spaces.Tuple:
+    """Action space: move action, shooting angle and whether to shoot."""
+    return spaces.Tuple(
+        (
+            spaces.Discrete(NO_MOVE_ACTION + 1),
+            spaces.Box(low=-np.pi, high=np.pi, shape=(1,), dtype=np.float32),
+            spaces.Discrete(2),
+        )
+    )
+
+
+def make_observation_space(observed_bullets: int) -> spaces.Box:
+    """Observation space, as built by :mod:`shooter.observation`."""
+    return spaces.Box(
+        low=-np.inf,
+        high=np.inf,
+        shape=(observation_size(observed_bullets),),
+        dtype=np.float32,
+    )
+
+
+def register_envs():
+    """Register shooter environments in gym."""
+    if ENV_ID not in registry:
+        register(
+            id=ENV_ID,
+            entry_point="shooter.env:ShooterEnv",
+            max_episode_steps=MAX_EPISODE_STEPS,
+        )
+
+
+class ShooterEnv(gym.Env):
+    """A single shooter game. Reward is the score gained in each step."""
+
+    metadata = {"render_modes": []}
+
+    def __init__(
+        self,
+        delta_time: float = DEFAULT_DELTA_TIME,
+        observed_bullets: int = DEFAULT_OBSERVED_BULLETS,
+    ):
+        self.delta_time = delta_time
+        self.observed_bullets = observed_bullets
+        self.action_space = make_action_space()
+        self.observation_space = make_observation_space(observed_bullets)
+        self.board = Board()
+
+    def reset(
+        self,
+        *,
+        seed: Optional[int] = None,
+        return_info: bool = False,
+        options: Optional[dict] = None,
+    ):
+        super().reset(seed=seed)
+        self.board.reset(seed=seed)
+        observation = board_observation(self.board, self.observed_bullets)
+        if return_info:
+            return observation, {}
+        return observation
+
+    def step(self, action):
+        move, angle, should_shoot = action
+        score = self.board.score
+        self.board.update(
+            delta_time=self.delta_time,
+            move_direction=None if move == NO_MOVE_ACTION else Direction(move),
+            shoot_angle_radians=float(angle[0]),
+            should_shoot=bool(should_shoot),
+        )
+        return (
+            board_observation(self.board, self.observed_bullets),
+            float(self.board.score - score),
+            self.board.is_lost,
+            {"score": self.board.score},
+        )
+
+
+class ShooterVectorEnv(VectorEnv):
+    """
+    Many shooter games, stepped together by a single batched board.
+
+    Lost games are reset automatically. Like gym's own vector environments, the
+    last observation of a lost game is given in the ``final_observation`` info.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        delta_time: float = DEFAULT_DELTA_TIME,
+        observed_bullets: int = DEFAULT_OBSERVED_BULLETS,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(
+            num_envs=num_envs,
+            observation_space=make_observation_space(observed_bullets),
+            action_space=make_action_space(),
+        )
+        self.delta_time = delta_time
+        self.observed_bullets = observed_bullets
+        self.board = BatchedBoard(games_count=num_envs, auto_reset=False, seed=seed)
+        self.actions = None
+
+    def reset_wait(
+        self,
+        seed: Optional[int] = None,
+        return_info: bool = False,
+        options: Optional[dict] = None,
+    ):
+        self.board.reset(seed=seed)
+        observations = batched_board_observations(self.board, self.observed_bullets)
+        if return_info:
+            return observations, {}
+        return observations
+
+    def step_async(self, actions):
+        self.actions = actions
+
+    def step_wait(self, **kwargs):
+        moves, angles, should_shoot = self.actions
+        moves = np.asarray(moves)
+        result = self.board.update(
+            delta_time=self.delta_time,
+            move_directions=np.where(moves == NO_MOVE_ACTION, NO_DIRECTION, moves),
+            shoot_angles=np.asarray(angles).reshape(self.num_envs),
+            should_shoot=should_shoot,
+        )
+        observations = batched_board_observations(self.board, self.observed_bullets)
+        infos = {}
+        lost_games = np.flatnonzero(result.lost)
+        if len(lost_games) != 0:
+            final_observations = np.full(self.num_envs, None, dtype=object)
+            for game in lost_games:
+                final_observations[game] = observations[game].copy()
+            infos["final_observation"] = final_observations
+            infos["_final_observation"] = result.lost
+            infos["final_score"] = np.where(result.lost, result.final_scores, 0)
+            infos["_final_score"] = result.lost
+            self.board.reset(lost_games)
+            observations[lost_games] = batched_board_observations(
+                self.board, self.observed_bullets
+            )[lost_games]
+        return (
+            observations,
+            result.score_deltas.astype(np.float64),
+            result.lost,
+            infos,
+        )
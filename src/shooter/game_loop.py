@@ -0,0 +1,128 @@
+"""
+Fixed timestep game loop helpers.
+
+The board is advanced in ticks of a fixed duration, no matter how long frames
+take to render, so games play the same on slow and fast machines. Frames are
+drawn between ticks, with locations interpolated from the previous tick.
+"""
+import time
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+from shooter.board import Board
+
+DEFAULT_TICK_RATE = 60
+DEFAULT_MAX_TICKS_PER_FRAME = 5
+
+
+class FixedTimestep:
+    """
+    Accumulate real time, and tell how many fixed ticks should run.
+
+    When ticks fall behind by more than ``max_ticks_per_frame`` ticks, the time
+    of the missing ticks is dropped, so the game slows down instead of trying to
+    catch up forever.
+    """
+
+    def __init__(
+        self,
+        tick_rate: float = DEFAULT_TICK_RATE,
+        max_ticks_per_frame: int = DEFAULT_MAX_TICKS_PER_FRAME,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.tick_duration = 1 / tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.clock = clock
+        self.last_time = clock()
+        self.accumulated_time = 0.0
+        self.dropped_time = 0.0
+
+    @property
+    def alpha(self) -> float:
+        """How far we are from the last tick to the next one, between 0 and 1."""
+        return self.accumulated_time / self.tick_duration
+
+    def restart(self):
+        """Forget all accumulated time, for example after a pause."""
+        self.last_time = self.clock()
+        self.accumulated_time = 0.0
+
+    def advance(self) -> int:
+        """Accumulate the time since the last call, and take the ticks to run."""
+        now_time = self.clock()
+        self.accumulated_time += now_time - self.last_time
+        self.last_time = now_time
+        ticks = int(self.accumulated_time // self.tick_duration)
+        self.accumulated_time = max(
+            0.0, self.accumulated_time - ticks * self.tick_duration
+        )
+        if ticks > self.max_ticks_per_frame:
+            self.dropped_time += (ticks - self.max_ticks_per_frame) * self.tick_duration
+            ticks = self.max_ticks_per_frame
+        return ticks
+
+
+class BoardPositions(NamedTuple):
+    """Locations of everything drawn on a board."""
+
+    player_location: np.ndarray
+    enemy_locations: np.ndarray
+    bullet_locations: np.ndarray
+    bullet_is_player: np.ndarray
+
+
+def board_positions(board: Board) -> BoardPositions:
+    """Copy the current locations of a board."""
+    return BoardPositions(
+        player_location=board.player.location.copy(),
+        enemy_locations=board.enemy_locations.copy(),
+        bullet_locations=board.bullet_locations.copy(),
+        bullet_is_player=board.bullet_is_player.copy(),
+    )
+
+
+def interpolate_locations(
+    previous: np.ndarray, current: np.ndarray, alpha: float, max_distance: float
+) -> np.ndarray:
+    """
+    Interpolate locations between two ticks.
+
+    Locations that jumped farther than ``max_distance``, like respawned enemies,
+    are not interpolated.
+    """
+    distances = np.linalg.norm(current - previous, axis=-1, keepdims=True)
+    interpolated = previous + alpha * (current - previous)
+    return np.where(distances <= max_distance, interpolated, current)
+
+
+def interpolate_positions(
+    previous: BoardPositions, board: Board, alpha: float, tick_duration: float
+) -> BoardPositions:
+    """
+    Positions to draw a board at, ``alpha`` of the way from its previous tick.
+
+    Bullets fly in straight lines, so they are moved back along their velocity
+    instead of being matched with their previous locations.
+    """
+    # Allow for a little rounding when checking if shooters jumped.
+    max_speed = 1.01 * max(board.player_speed, board.enemy_speed)
+    return BoardPositions(
+        player_location=interpolate_locations(
+            previous.player_location,
+            board.player.location,
+            alpha,
+            max_distance=max_speed * tick_duration,
+        ),
+        enemy_locations=interpolate_locations(
+            previous.enemy_locations,
+            board.enemy_locations,
+            alpha,
+            max_distance=max_speed * tick_duration,
+        ),
+        bullet_locations=(
+            board.bullet_locations
+            - (1 - alpha) * tick_duration * board.bullet_velocities
+        ),
+        bullet_is_player=board.bullet_is_player,
+    )
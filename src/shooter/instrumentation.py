@@ -0,0 +1,135 @@
+"""
+Opt-in timings and counters of board updates.
+
+Boards only collect stats when they are given a :class:`BoardStats`, so
+uninstrumented boards pay for a single ``None`` check per phase.
+"""
+import bisect
+import itertools
+import math
+import time
+from typing import Dict, List
+
+# Histogram buckets are powers of two of microseconds. The first bucket holds
+# everything under 2 microseconds, and the last everything above about a second.
+HISTOGRAM_BUCKETS = 21
+HISTOGRAM_UNIT = 1e-6
+
+
+class PhaseTiming:
+    """Cumulative time and histogram of durations of a single phase."""
+
+    __slots__ = ("calls", "total_seconds", "max_seconds", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    @property
+    def mean_seconds(self) -> float:
+        """Mean duration of the phase."""
+        return self.total_seconds / self.calls if self.calls != 0 else 0.0
+
+    def add(self, seconds: float):
+        """Add a single duration of the phase."""
+        self.calls += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.histogram[bucket_index(seconds)] += 1
+
+    def merge(self, other: "PhaseTiming"):
+        """Add all durations of another timing of the same phase."""
+        self.calls += other.calls
+        self.total_seconds += other.total_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        self.histogram = [
+            count + other_count
+            for count, other_count in zip(self.histogram, other.histogram)
+        ]
+
+    def percentile_seconds(self, percentile: float) -> float:
+        """
+        Estimate a percentile of the durations, in seconds.
+
+        Durations are only known up to their histogram bucket, so this is the
+        upper bound of the bucket holding the percentile.
+        """
+        if self.calls == 0:
+            return 0.0
+        rank = math.ceil(percentile / 100 * self.calls)
+        index = bisect.bisect_left(list(itertools.accumulate(self.histogram)), rank)
+        return min(bucket_upper_bound(index), self.max_seconds)
+
+
+def bucket_index(seconds: float) -> int:
+    """Histogram bucket of a duration."""
+    units = seconds / HISTOGRAM_UNIT
+    if units < 2:
+        return 0
+    return min(int(math.log2(units)), HISTOGRAM_BUCKETS - 1)
+
+
+def bucket_upper_bound(index: int) -> float:
+    """Largest duration, in seconds, of a histogram bucket."""
+    if index == HISTOGRAM_BUCKETS - 1:
+        return math.inf
+    return HISTOGRAM_UNIT * 2 ** (index + 1)
+
+
+class BoardStats:
+    """
+    Timings of update phases and counters of work done by a board.
+
+    Stats of several boards can be merged, to report them together.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, PhaseTiming] = {}
+        self.counters: Dict[str, int] = {}
+
+    def add_time(self, phase: str, seconds: float):
+        """Add a duration of a phase."""
+        timing = self.phases.get(phase)
+        if timing is None:
+            timing = self.phases[phase] = PhaseTiming()
+        timing.add(seconds)
+
+    def lap(self, phase: str, start_time: float) -> float:
+        """Add the time of a phase that started at a given time, and return now."""
+        now_time = time.perf_counter()
+        self.add_time(phase, now_time - start_time)
+        return now_time
+
+    def count(self, counter: str, amount: int = 1):
+        """Increase a counter."""
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def merge(self, other: "BoardStats"):
+        """Add all timings and counters of other stats."""
+        for phase, other_timing in other.phases.items():
+            self.phases.setdefault(phase, PhaseTiming()).merge(other_timing)
+        for counter, amount in other.counters.items():
+            self.count(counter, amount)
+
+    def report(self) -> str:
+        """Table of all timings and counters, for printing."""
+        lines: List[str] = [
+            f"{'Phase':<20}{'Calls':>10}{'Total (s)':>12}{'Mean (us)':>12}"
+            f"{'p50 (us)':>12}{'p99 (us)':>12}{'Max (us)':>12}"
+        ]
+        for phase, timing in self.phases.items():
+            lines.append(
+                f"{phase:<20}{timing.calls:>10}{timing.total_seconds:>12.3f}"
+                f"{1e6 * timing.mean_seconds:>12.1f}"
+                f"{1e6 * timing.percentile_seconds(50):>12.1f}"
+                f"{1e6 * timing.percentile_seconds(99):>12.1f}"
+                f"{1e6 * timing.max_seconds:>12.1f}"
+            )
+        if len(self.counters) != 0:
+            lines.append("")
+            lines.append(f"{'Counter':<20}{'Count':>10}")
+            for counter, amount in self.counters.items():
+                lines.append(f"{counter:<20}{amount:>10}")
+        return "\n".join(lines)
@@ -0,0 +1,156 @@
+"""
+Load test of a game server by many clients playing random actions.
+
+Clients keep a :class:`RemoteBoard` of their game, so a load test checks that
+every state the server sends applies cleanly, as well as how fast it is sent.
+"""
+import asyncio
+import time
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from shooter.direction import Direction
+from shooter.protocol import (
+    KEYFRAME_MESSAGE,
+    WELCOME,
+    WELCOME_MESSAGE,
+    Action,
+    MessageReader,
+    ProtocolError,
+    RemoteBoard,
+    encode_action,
+)
+from shooter.server import DEFAULT_HOST, DEFAULT_PORT
+
+DEFAULT_ACTIONS_PER_SECOND = 10.0
+# Connections opened at once, so the server's listen backlog doesn't overflow.
+CONNECT_BATCH_SIZE = 100
+
+
+class LoadTestResult(NamedTuple):
+    """Totals of all clients of a load test."""
+
+    sessions: int
+    seconds: float
+    states_received: int
+    keyframes_received: int
+    bytes_received: int
+    actions_sent: int
+    errors: int
+
+    @property
+    def states_per_second(self) -> float:
+        """States received by all clients per second."""
+        return self.states_received / self.seconds
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Bytes received by all clients per second."""
+        return self.bytes_received / self.seconds
+
+
+class LoadTestClient(asyncio.Protocol):  # pylint: disable=too-many-instance-attributes
+    """Client sending random actions and applying the states it receives."""
+
+    def __init__(self, rng: np.random.Generator, actions_per_second: float):
+        self.rng = rng
+        self.actions_per_second = actions_per_second
+        self.transport: Optional[asyncio.Transport] = None
+        self.reader = MessageReader()
+        self.board: Optional[RemoteBoard] = None
+        self.session_id = -1
+        self.states_received = 0
+        self.keyframes_received = 0
+        self.bytes_received = 0
+        self.actions_sent = 0
+        self.errors = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data: bytes):
+        self.bytes_received += len(data)
+        try:
+            for message_type, payload in self.reader.feed(data):
+                self.handle_message(message_type, payload)
+        except ProtocolError:
+            self.errors += 1
+            self.transport.close()
+
+    def handle_message(self, message_type: int, payload: bytes):
+        """Handle a single message from the server."""
+        if message_type == WELCOME_MESSAGE:
+            self.session_id, tick_duration = WELCOME.unpack(payload)
+            self.board = RemoteBoard(tick_duration)
+            return
+        if self.board is None:
+            raise ProtocolError("States must follow a welcome message")
+        self.board.apply(message_type, payload)
+        self.states_received += 1
+        self.keyframes_received += message_type == KEYFRAME_MESSAGE
+        if self.rng.random() < self.actions_per_second * self.board.tick_duration:
+            self.transport.write(encode_action(self.random_action()))
+            self.actions_sent += 1
+
+    def random_action(self) -> Action:
+        """Random move, aiming and shooting."""
+        direction = self.rng.integers(-1, len(Direction))
+        return Action(
+            move_direction=None if direction == -1 else Direction(direction),
+            shoot_angle_radians=self.rng.uniform(0, 2 * np.pi),
+            should_shoot=bool(self.rng.integers(2)),
+        )
+
+
+async def load_test(  # pylint: disable=too-many-arguments
+    sessions: int,
+    seconds: float,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    path: Optional[str] = None,
+    actions_per_second: float = DEFAULT_ACTIONS_PER_SECOND,
+    seed: Optional[int] = None,
+) -> LoadTestResult:
+    """
+    Connect many clients to a server, play for a while and total what they got.
+
+    Clients play for the given seconds once they are all connected. They
+    connect to a Unix socket if a path is given, and to a TCP port otherwise.
+    """
+    loop = asyncio.get_running_loop()
+    rng = np.random.default_rng(seed)
+    clients: List[LoadTestClient] = []
+    start_time = time.perf_counter()
+
+    def make_client() -> LoadTestClient:
+        client = LoadTestClient(rng, actions_per_second)
+        clients.append(client)
+        return client
+
+    for batch_start in range(0, sessions, CONNECT_BATCH_SIZE):
+        batch_size = min(CONNECT_BATCH_SIZE, sessions - batch_start)
+        if path is not None:
+            connections = [
+                loop.create_unix_connection(make_client, path)
+                for _ in range(batch_size)
+            ]
+        else:
+            connections = [
+                loop.create_connection(make_client, host, port)
+                for _ in range(batch_size)
+            ]
+        await asyncio.gather(*connections)
+    await asyncio.sleep(seconds)
+    end_time = time.perf_counter()
+    for client in clients:
+        client.transport.close()
+    return LoadTestResult(
+        sessions=sessions,
+        seconds=end_time - start_time,
+        states_received=sum(client.states_received for client in clients),
+        keyframes_received=sum(client.keyframes_received for client in clients),
+        bytes_received=sum(client.bytes_received for client in clients),
+        actions_sent=sum(client.actions_sent for client in clients),
+        errors=sum(client.errors for client in clients),
+    )
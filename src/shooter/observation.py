@@ -0,0 +1,92 @@
+"""Fixed size observations of games, for learning agents."""
+import numpy as np
+
+from shooter.batched_board import BatchedBoard
+from shooter.board import Board
+
+STATE_FEATURES = 6
+BULLET_FEATURES = 6
+DEFAULT_OBSERVED_BULLETS = 16
+
+
+def observation_size(observed_bullets: int) -> int:
+    """Size of a single game observation."""
+    return STATE_FEATURES + BULLET_FEATURES * observed_bullets
+
+
+def build_observations(  # pylint: disable=too-many-arguments
+    player_locations: np.ndarray,
+    enemy_locations: np.ndarray,
+    player_time_to_reload: np.ndarray,
+    enemy_time_to_reload: np.ndarray,
+    bullet_locations: np.ndarray,
+    bullet_velocities: np.ndarray,
+    bullet_is_player: np.ndarray,
+    bullet_mask: np.ndarray,
+    observed_bullets: int,
+) -> np.ndarray:
+    """
+    Build flat observations for a batch of games.
+
+    Each observation starts with the player location, the enemy location and both
+    of their times to reload. Then, for each of the first ``observed_bullets``
+    bullets, it holds whether the bullet is alive, whether the player shot it, its
+    location and its velocity. Missing bullets are all zeros.
+    """
+    games_count = len(player_locations)
+    count = min(observed_bullets, bullet_locations.shape[1])
+    mask = bullet_mask[:, :count]
+    bullets = np.zeros((games_count, observed_bullets, BULLET_FEATURES))
+    bullets[:, :count, 0] = mask
+    bullets[:, :count, 1] = mask & bullet_is_player[:, :count]
+    bullets[:, :count, 2:4] = np.where(
+        mask[..., np.newaxis], bullet_locations[:, :count], 0
+    )
+    bullets[:, :count, 4:6] = np.where(
+        mask[..., np.newaxis], bullet_velocities[:, :count], 0
+    )
+    state = np.concatenate(
+        [
+            player_locations,
+            enemy_locations,
+            player_time_to_reload[:, np.newaxis],
+            enemy_time_to_reload[:, np.newaxis],
+        ],
+        axis=1,
+    )
+    return np.concatenate(
+        [state, bullets.reshape(games_count, -1)], axis=1, dtype=np.float32
+    )
+
+
+def batched_board_observations(
+    batched_board: BatchedBoard, observed_bullets: int
+) -> np.ndarray:
+    """Observations of all games in a batched board."""
+    return build_observations(
+        player_locations=batched_board.player_locations,
+        enemy_locations=batched_board.enemy_locations,
+        player_time_to_reload=batched_board.player_time_to_reload,
+        enemy_time_to_reload=batched_board.enemy_time_to_reload,
+        bullet_locations=batched_board.bullet_locations,
+        bullet_velocities=batched_board.bullet_velocities,
+        bullet_is_player=batched_board.bullet_is_player,
+        bullet_mask=batched_board.bullet_mask,
+        observed_bullets=observed_bullets,
+    )
+
+
+def board_observation(board: Board, observed_bullets: int) -> np.ndarray:
+    """Observation of a single board, seeing only the enemy nearest to the player."""
+    enemy = board.nearest_enemy()
+    return build_observations(
+        player_locations=board.player.location[np.newaxis],
+        enemy_locations=board.enemy_locations[[enemy]],
+        player_time_to_reload=np.array([board.player.time_to_reload]),
+        enemy_time_to_reload=board.enemy_time_to_reload[[enemy]],
+        bullet_locations=board.bullet_locations[np.newaxis],
+        bullet_velocities=board.bullet_velocities[np.newaxis],
+        bullet_is_player=board.bullet_is_player[np.newaxis],
+        bullet_mask=np.ones((1, len(board.bullet_is_player)), dtype=bool),
+        observed_bullets=observed_bullets,
+    )[0]
@@ -0,0 +1,76 @@
+"""Built-in policies, playing many games at once."""
+from typing import Callable, Dict, NamedTuple
+
+import numpy as np
+
+from shooter.batched_board import NO_DIRECTION
+from shooter.direction import Direction
+
+_DIRECTION_VECTORS = np.array([direction.to_vector() for direction in Direction])
+
+
+class PolicyActions(NamedTuple):
+    """Actions of a policy, one for each game."""
+
+    move_directions: np.ndarray
+    shoot_angles: np.ndarray
+    should_shoot: np.ndarray
+
+
+Policy = Callable[[np.ndarray, np.ndarray, np.random.Generator], PolicyActions]
+
+
+def random_policy(
+    player_locations: np.ndarray,
+    enemy_locations: np.ndarray,  # pylint: disable=unused-argument
+    rng: np.random.Generator,
+) -> PolicyActions:
+    """Move, aim and shoot randomly."""
+    games_count = len(player_locations)
+    return PolicyActions(
+        move_directions=rng.integers(NO_DIRECTION, len(Direction), size=games_count),
+        shoot_angles=rng.uniform(-np.pi, np.pi, size=games_count),
+        should_shoot=rng.integers(2, size=games_count).astype(bool),
+    )
+
+
+def scripted_policy(
+    player_locations: np.ndarray,
+    enemy_locations: np.ndarray,
+    rng: np.random.Generator,  # pylint: disable=unused-argument
+    margin: float = 0.15,
+) -> PolicyActions:
+    """
+    Shoot the enemy while running away from it.
+
+    The player runs along the axis it is farther away from the enemy.
+    If that will get it too close to the screen edge, it runs along the other
+    axis. If both are blocked, it stands still.
+    """
+    delta = enemy_locations - player_locations
+    horizontal = np.where(delta[:, 0] < 0, Direction.RIGHT, Direction.LEFT)
+    vertical = np.where(delta[:, 1] < 0, Direction.DOWN, Direction.UP)
+    prefer_horizontal = np.abs(delta[:, 0]) >= np.abs(delta[:, 1])
+    first_choice = np.where(prefer_horizontal, horizontal, vertical)
+    second_choice = np.where(prefer_horizontal, vertical, horizontal)
+
+    def is_blocked(directions):
+        locations = player_locations + margin * _DIRECTION_VECTORS[directions]
+        return np.any((locations < margin) | (locations > 1 - margin), axis=1)
+
+    move_directions = np.where(
+        is_blocked(first_choice),
+        np.where(is_blocked(second_choice), NO_DIRECTION, second_choice),
+        first_choice,
+    )
+    return PolicyActions(
+        move_directions=move_directions,
+        shoot_angles=np.arctan2(delta[:, 1], delta[:, 0]),
+        should_shoot=np.ones(len(player_locations), dtype=bool),
+    )
+
+
+POLICIES: Dict[str, Policy] = {
+    "random": random_policy,
+    "scripted": scripted_policy,
+}
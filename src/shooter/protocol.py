@@ -0,0 +1,192 @@
+"""
+Binary protocol between the game server and its clients.
+
+Every message starts with a header holding its type and payload length.
+Clients send actions. The server sends a welcome message once, and then the
+state of the client's game after every tick.
+
+Shooters move every tick, so their locations are always sent. Bullets move
+in straight lines, so each bullet is only sent once, when it is shot. Clients
+move bullets themselves exactly like the board does, and remove the bullets a
+state marks as removed. A keyframe is a state sent from scratch, for new games
+and for clients that skipped ticks.
+"""
+import struct
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from shooter.batched_board import NO_DIRECTION
+from shooter.direction import Direction
+
+HEADER = struct.Struct("<BI")
+# Move direction (or NO_DIRECTION), shoot angle and whether to shoot.
+ACTION = struct.Struct("<bf?")
+# Session id and tick duration.
+WELCOME = struct.Struct("<Id")
+
+ACTION_MESSAGE = 1
+WELCOME_MESSAGE = 2
+KEYFRAME_MESSAGE = 3
+DELTA_MESSAGE = 4
+
+# A state payload is a STATE_DTYPE record, then a bit mask of the previous
+# bullets that were kept, then the new bullets.
+STATE_DTYPE = np.dtype(
+    [
+        ("tick", "<u4"),
+        ("score", "<i4"),
+        ("lost", "?"),
+        ("player_location", "<f4", (2,)),
+        ("enemy_location", "<f4", (2,)),
+        ("previous_bullets", "<u2"),
+        ("new_bullets", "<u2"),
+    ]
+)
+# Bullets are moved by clients, so they are sent in full precision.
+BULLET_DTYPE = np.dtype(
+    [("location", "<f8", (2,)), ("velocity", "<f8", (2,)), ("is_player", "?")]
+)
+
+
+class ProtocolError(Exception):
+    """A message that breaks the protocol."""
+
+
+class Action(NamedTuple):
+    """Inputs of a single board update."""
+
+    move_direction: Optional[Direction]
+    shoot_angle_radians: float
+    should_shoot: bool
+
+
+def encode_message(message_type: int, payload: bytes = b"") -> bytes:
+    """Add a header to a payload."""
+    return HEADER.pack(message_type, len(payload)) + payload
+
+
+def encode_action(action: Action) -> bytes:
+    """Encode an action message."""
+    return encode_message(
+        ACTION_MESSAGE,
+        ACTION.pack(
+            NO_DIRECTION if action.move_direction is None else action.move_direction,
+            action.shoot_angle_radians,
+            action.should_shoot,
+        ),
+    )
+
+
+def decode_action(payload: bytes) -> Action:
+    """Decode the payload of an action message."""
+    if len(payload) != ACTION.size:
+        raise ProtocolError(f"Action payload must be {ACTION.size} bytes")
+    move_direction, shoot_angle_radians, should_shoot = ACTION.unpack(payload)
+    if move_direction == NO_DIRECTION:
+        return Action(None, shoot_angle_radians, should_shoot)
+    if not 0 <= move_direction < len(Direction):
+        raise ProtocolError(f"Unknown move direction: {move_direction}")
+    return Action(Direction(move_direction), shoot_angle_radians, should_shoot)
+
+
+def mask_size(bullets_count: int) -> int:
+    """Bytes of the mask of kept bullets."""
+    return (bullets_count + 7) // 8
+
+
+class MessageReader:
+    """Split a stream of bytes into messages."""
+
+    def __init__(self, max_payload_size: int = 1 << 20):
+        self.buffer = bytearray()
+        self.max_payload_size = max_payload_size
+
+    def feed(self, data: bytes) -> List[Tuple[int, bytes]]:
+        """Add received bytes, and take the types and payloads of whole messages."""
+        self.buffer += data
+        messages = []
+        start = 0
+        while len(self.buffer) - start >= HEADER.size:
+            message_type, payload_size = HEADER.unpack_from(self.buffer, start)
+            if payload_size > self.max_payload_size:
+                raise ProtocolError(f"Payload of {payload_size} bytes is too large")
+            payload_start = start + HEADER.size
+            end = payload_start + payload_size
+            if end > len(self.buffer):
+                break
+            messages.append((message_type, bytes(self.buffer[payload_start:end])))
+            start = end
+        del self.buffer[:start]
+        return messages
+
+
+class RemoteBoard:
+    """
+    A client's copy of a game hosted on the server.
+
+    States are applied in the order they are received. A delta must follow the
+    state before it, while a keyframe may follow anything.
+    """
+
+    def __init__(self, tick_duration: float):
+        self.tick_duration = tick_duration
+        self.tick = -1
+        self.score = 0
+        self.lost = False
+        self.player_location = np.zeros(2)
+        self.enemy_location = np.zeros(2)
+        self.bullet_locations = np.empty((0, 2))
+        self.bullet_velocities = np.empty((0, 2))
+        self.bullet_is_player = np.empty(0, dtype=bool)
+
+    def apply(self, message_type: int, payload: bytes):
+        """Apply a keyframe or a delta message."""
+        if len(payload) < STATE_DTYPE.itemsize:
+            raise ProtocolError("State payload is too short")
+        state = np.frombuffer(payload, dtype=STATE_DTYPE, count=1)[0]
+        previous_bullets = int(state["previous_bullets"])
+        new_bullets = int(state["new_bullets"])
+        mask_end = STATE_DTYPE.itemsize + mask_size(previous_bullets)
+        if len(payload) != mask_end + new_bullets * BULLET_DTYPE.itemsize:
+            raise ProtocolError("State payload size doesn't match its bullets")
+        if message_type == KEYFRAME_MESSAGE:
+            if previous_bullets != 0:
+                raise ProtocolError("Keyframes can't keep previous bullets")
+            self.keep_bullets(np.zeros(len(self.bullet_is_player), dtype=bool))
+        elif message_type == DELTA_MESSAGE:
+            if previous_bullets != len(self.bullet_is_player):
+                raise ProtocolError(
+                    f"Delta of {previous_bullets} bullets can't follow "
+                    f"a state of {len(self.bullet_is_player)} bullets"
+                )
+            kept = np.unpackbits(
+                np.frombuffer(payload, dtype=np.uint8, offset=STATE_DTYPE.itemsize),
+                count=previous_bullets,
+                bitorder="little",
+            ).astype(bool)
+            self.keep_bullets(kept)
+            self.bullet_locations += self.tick_duration * self.bullet_velocities
+        else:
+            raise ProtocolError(f"Unknown state message type: {message_type}")
+        bullets = np.frombuffer(payload, dtype=BULLET_DTYPE, offset=mask_end)
+        self.bullet_locations = np.concatenate(
+            [self.bullet_locations, bullets["location"]]
+        )
+        self.bullet_velocities = np.concatenate(
+            [self.bullet_velocities, bullets["velocity"]]
+        )
+        self.bullet_is_player = np.concatenate(
+            [self.bullet_is_player, bullets["is_player"]]
+        )
+        self.tick = int(state["tick"])
+        self.score = int(state["score"])
+        self.lost = bool(state["lost"])
+        self.player_location = state["player_location"].astype(float)
+        self.enemy_location = state["enemy_location"].astype(float)
+
+    def keep_bullets(self, keep: np.ndarray):
+        """Keep only the bullets in mask."""
+        self.bullet_locations = self.bullet_locations[keep]
+        self.bullet_velocities = self.bullet_velocities[keep]
+        self.bullet_is_player = self.bullet_is_player[keep]
@@ -0,0 +1,149 @@
+"""
+Render games into pixel arrays, without pygame.
+
+Squares are drawn with the same geometry as the game window: a square covers
+the pixels from its truncated top left corner, as wide as its truncated width.
+Each square is split into a mask of rows and a mask of columns, so the pixels
+covered by many squares are found with a single matrix multiplication.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from shooter.batched_board import BatchedBoard
+from shooter.board import Board
+from shooter.constants import BLUE, RED, WHITE
+
+DEFAULT_RESOLUTION = 84
+
+# ITU-R 601 luma weights of red, green and blue.
+GRAYSCALE_WEIGHTS = np.array([0.299, 0.587, 0.114])
+
+
+def to_pixel_location(location: np.ndarray, resolution: int) -> np.ndarray:
+    """Turn board locations to pixel locations."""
+    return (resolution * location).astype(int)
+
+
+def to_pixel_size(size: float, resolution: int) -> int:
+    """Turn board size to pixel size."""
+    return int(size * resolution)
+
+
+def squares_coverage(
+    locations: np.ndarray,
+    width: float,
+    resolution: int,
+    mask: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Which pixels are covered by any of the squares in each game.
+
+    Locations are of shape (games, squares, 2), and the mask tells which of the
+    squares to draw. Returns a boolean array of shape (games, rows, columns).
+    """
+    pixels = np.arange(resolution)
+    starts = to_pixel_location(locations - width / 2, resolution)[..., np.newaxis]
+    inside = (pixels >= starts) & (pixels < starts + to_pixel_size(width, resolution))
+    rows, columns = inside[..., 1, :], inside[..., 0, :]
+    if mask is not None:
+        rows = rows & mask[..., np.newaxis]
+    covered = np.matmul(
+        np.swapaxes(rows, -1, -2).astype(np.float32), columns.astype(np.float32)
+    )
+    return covered > 0
+
+
+def layers_palette(grayscale: bool) -> np.ndarray:
+    """Colors of the background and of each of the drawn layers."""
+    palette = np.array([WHITE, BLUE, RED, RED, BLUE], dtype=float)
+    if grayscale:
+        return (palette @ GRAYSCALE_WEIGHTS)[:, np.newaxis]
+    return palette
+
+
+def rasterize(  # pylint: disable=too-many-arguments,too-many-locals
+    player_locations: np.ndarray,
+    enemy_locations: np.ndarray,
+    bullet_locations: np.ndarray,
+    bullet_is_player: np.ndarray,
+    bullet_mask: np.ndarray,
+    shooter_width: float = Board.shooter_width,
+    bullet_width: float = Board.bullet_width,
+    resolution: int = DEFAULT_RESOLUTION,
+    grayscale: bool = False,
+    downsample: int = 1,
+) -> np.ndarray:
+    """
+    Render a batch of games into images of shape (games, height, width, channels).
+
+    Like the game window, the player is drawn over a white background, then the
+    enemies and then the bullets. Bullets of the player are drawn over bullets of
+    the enemies. Images are rendered in full resolution, and then averaged over
+    blocks of ``downsample`` pixels.
+    """
+    if resolution % downsample != 0:
+        raise ValueError(
+            f"Resolution ({resolution}) must be divisible by downsample ({downsample})"
+        )
+    games_count = len(player_locations)
+    layers = [
+        (player_locations[:, np.newaxis], shooter_width, None),
+        (enemy_locations, shooter_width, None),
+        (bullet_locations, bullet_width, bullet_mask & ~bullet_is_player),
+        (bullet_locations, bullet_width, bullet_mask & bullet_is_player),
+    ]
+    # Paint the index of the last layer covering each pixel, and then look up
+    # the colors of all pixels at once.
+    layer_indices = np.zeros((games_count, resolution, resolution), dtype=np.uint8)
+    for layer_index, (locations, width, mask) in enumerate(layers, start=1):
+        np.putmask(
+            layer_indices,
+            squares_coverage(locations, width, resolution, mask=mask),
+            layer_index,
+        )
+    palette = layers_palette(grayscale)
+    if downsample == 1:
+        return np.rint(palette).astype(np.uint8)[layer_indices]
+    size = resolution // downsample
+    images = palette[layer_indices].reshape(
+        games_count, size, downsample, size, downsample, palette.shape[-1]
+    )
+    return np.rint(images.mean(axis=(2, 4))).astype(np.uint8)
+
+
+def rasterize_batched_board(batched_board: BatchedBoard, **kwargs) -> np.ndarray:
+    """Render all games of a batched board, with arguments of :func:`rasterize`."""
+    bullets_count = batched_board.bullet_counts.max(initial=0)
+    return rasterize(
+        player_locations=batched_board.player_locations,
+        enemy_locations=batched_board.enemy_locations[:, np.newaxis],
+        bullet_locations=batched_board.bullet_locations[:, :bullets_count],
+        bullet_is_player=batched_board.bullet_is_player[:, :bullets_count],
+        bullet_mask=batched_board.bullet_mask[:, :bullets_count],
+        shooter_width=batched_board.shooter_width,
+        bullet_width=batched_board.bullet_width,
+        **kwargs,
+    )
+
+
+def rasterize_board(board: Board, **kwargs) -> np.ndarray:
+    """Render a single board, with arguments of :func:`rasterize`."""
+    return rasterize(
+        player_locations=board.player.location[np.newaxis],
+        enemy_locations=board.enemy_locations[np.newaxis],
+        bullet_locations=board.bullet_locations[np.newaxis],
+        bullet_is_player=board.bullet_is_player[np.newaxis],
+        bullet_mask=np.ones((1, len(board.bullet_is_player)), dtype=bool),
+        shooter_width=board.shooter_width,
+        bullet_width=board.bullet_width,
+        **kwargs,
+    )[0]
+
+
+def image_shape(
+    resolution: int = DEFAULT_RESOLUTION, grayscale: bool = False, downsample: int = 1
+) -> Tuple[int, int, int]:
+    """Shape of a single rendered image."""
+    size = resolution // downsample
+    return (size, size, 1 if grayscale else 3)
@@ -0,0 +1,309 @@
+"""
+Record games into compact binary replay files, and read them back.
+
+A replay file starts with a magic string, followed by chunks of ticks, then an
+index and a footer. Each tick holds the board state after an update, along
+with the arguments of that update. The first tick of each episode holds the
+initial state of the board, with no inputs.
+
+Every chunk holds three tables of packed little-endian records: ticks, enemies
+and bullets. Ticks point at their enemies and bullets by offsets inside their
+chunk. The index holds the place of each chunk and the ticks of each episode,
+and the footer at the end of the file points at the index. Readers memory-map
+the file and only read the records they are asked for.
+"""
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from shooter.batched_board import NO_DIRECTION
+from shooter.board import Board, GameStatus
+from shooter.direction import Direction
+
+MAGIC = b"SHOOTRP1"
+DEFAULT_CHUNK_TICKS = 4096
+
+TICK_DTYPE = np.dtype(
+    [
+        ("player_location", "<f8", (2,)),
+        ("player_time_to_reload", "<f8"),
+        ("score", "<i8"),
+        ("status", "u1"),
+        ("delta_time", "<f8"),
+        ("move_direction", "i1"),
+        ("shoot_angle_radians", "<f8"),
+        ("should_shoot", "?"),
+        ("enemies_start", "<u4"),
+        ("enemies_count", "<u4"),
+        ("bullets_start", "<u4"),
+        ("bullets_count", "<u4"),
+    ]
+)
+ENEMY_DTYPE = np.dtype([("location", "<f8", (2,)), ("time_to_reload", "<f8")])
+BULLET_DTYPE = np.dtype(
+    [("location", "<f8", (2,)), ("velocity", "<f8", (2,)), ("is_player", "?")]
+)
+CHUNK_DTYPE = np.dtype(
+    [
+        ("offset", "<u8"),
+        ("first_tick", "<u8"),
+        ("ticks_count", "<u8"),
+        ("enemies_count", "<u8"),
+        ("bullets_count", "<u8"),
+    ]
+)
+EPISODE_DTYPE = np.dtype([("first_tick", "<u8"), ("ticks_count", "<u8")])
+FOOTER_DTYPE = np.dtype(
+    [
+        ("index_offset", "<u8"),
+        ("chunks_count", "<u8"),
+        ("episodes_count", "<u8"),
+        ("magic", "S8"),
+    ]
+)
+
+RecordedTick = Tuple[tuple, np.ndarray, np.ndarray]
+
+
+class ReplayFrame(NamedTuple):
+    """A single recorded tick: the board state, and the inputs that led to it."""
+
+    player_location: np.ndarray
+    player_time_to_reload: float
+    enemy_locations: np.ndarray
+    enemy_time_to_reload: np.ndarray
+    bullet_locations: np.ndarray
+    bullet_velocities: np.ndarray
+    bullet_is_player: np.ndarray
+    score: int
+    status: GameStatus
+    delta_time: float
+    move_direction: Optional[Direction]
+    shoot_angle_radians: float
+    should_shoot: bool
+
+
+class ReplayWriter:  # pylint: disable=too-many-instance-attributes
+    """
+    Append recorded ticks to a replay file.
+
+    Ticks of several games may be recorded at once. Each game's current episode
+    is kept in memory until it ends, so episodes are written contiguously.
+    Finished ticks are written in chunks of ``chunk_ticks`` ticks.
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_ticks: int = DEFAULT_CHUNK_TICKS):
+        self.chunk_ticks = chunk_ticks
+        self.file = open(path, mode="wb")  # pylint: disable=consider-using-with
+        self.file.write(MAGIC)
+        self.chunks: List[tuple] = []
+        self.episodes: List[tuple] = []
+        self.ticks_count = 0
+        # Each recorded tick is kept as its tick record, enemies and bullets.
+        self.pending: List[RecordedTick] = []
+        self.games: Dict[int, List[RecordedTick]] = {}
+        self.closed = False
+
+    def record(  # pylint: disable=too-many-arguments
+        self,
+        board: Board,
+        delta_time: float = 0,
+        move_direction: Optional[Direction] = None,
+        shoot_angle_radians: float = 0,
+        should_shoot: bool = False,
+        game: int = 0,
+    ):
+        """
+        Record the state of a board after an update with the given arguments.
+
+        Record the initial state of each episode with the default arguments.
+        """
+        enemies = np.empty(board.enemies_count, dtype=ENEMY_DTYPE)
+        enemies["location"] = board.enemy_locations
+        enemies["time_to_reload"] = board.enemy_time_to_reload
+        bullets = np.empty(len(board.bullet_is_player), dtype=BULLET_DTYPE)
+        bullets["location"] = board.bullet_locations
+        bullets["velocity"] = board.bullet_velocities
+        bullets["is_player"] = board.bullet_is_player
+        tick = (
+            board.player.location,
+            board.player.time_to_reload,
+            board.score,
+            board.status.value,
+            delta_time,
+            NO_DIRECTION if move_direction is None else int(move_direction),
+            shoot_angle_radians,
+            should_shoot,
+            0,
+            len(enemies),
+            0,
+            len(bullets),
+        )
+        self.games.setdefault(game, []).append((tick, enemies, bullets))
+
+    def end_episode(self, game: int = 0):
+        """End the current episode of a game, if it has any ticks."""
+        ticks = self.games.pop(game, [])
+        if len(ticks) == 0:
+            return
+        self.episodes.append((self.ticks_count, len(ticks)))
+        self.ticks_count += len(ticks)
+        self.pending.extend(ticks)
+        if len(self.pending) >= self.chunk_ticks:
+            self.write_chunk()
+
+    def write_chunk(self):
+        """Write all finished ticks as a single chunk."""
+        if len(self.pending) == 0:
+            return
+        ticks, enemies, bullets = zip(*self.pending)
+        ticks = np.array(list(ticks), dtype=TICK_DTYPE)
+        enemies = np.concatenate(enemies)
+        bullets = np.concatenate(bullets)
+        for table in ["enemies", "bullets"]:
+            counts = ticks[f"{table}_count"]
+            ticks[f"{table}_start"] = np.cumsum(counts) - counts
+        self.chunks.append(
+            (
+                self.file.tell(),
+                self.ticks_count - len(ticks),
+                len(ticks),
+                len(enemies),
+                len(bullets),
+            )
+        )
+        for table in [ticks, enemies, bullets]:
+            self.file.write(table.tobytes())
+        self.pending.clear()
+
+    def close(self):
+        """End all episodes, and write the index and the footer."""
+        if self.closed:
+            return
+        self.closed = True
+        for game in list(self.games):
+            self.end_episode(game)
+        self.write_chunk()
+        index_offset = self.file.tell()
+        self.file.write(np.array(self.chunks, dtype=CHUNK_DTYPE).tobytes())
+        self.file.write(np.array(self.episodes, dtype=EPISODE_DTYPE).tobytes())
+        footer = (index_offset, len(self.chunks), len(self.episodes), MAGIC)
+        self.file.write(np.array(footer, dtype=FOOTER_DTYPE).tobytes())
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ReplayReader:
+    """
+    Random access to the ticks of a replay file.
+
+    The file is memory-mapped, so only the requested ticks are read from disk.
+    Arrays of returned frames are read-only views of the file.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.data = np.memmap(path, dtype=np.uint8, mode="r")
+        if (
+            len(self.data) < len(MAGIC) + FOOTER_DTYPE.itemsize
+            or self.data[: len(MAGIC)].tobytes() != MAGIC
+        ):
+            raise ValueError(f"Not a replay file: {path}")
+        footer_start = len(self.data) - FOOTER_DTYPE.itemsize
+        footer = self.data[footer_start:].view(FOOTER_DTYPE)[0]
+        if footer["magic"] != MAGIC:
+            raise ValueError(f"Replay file is truncated: {path}")
+        offset = int(footer["index_offset"])
+        self.chunks = self.table(offset, CHUNK_DTYPE, int(footer["chunks_count"]))
+        offset += self.chunks.nbytes
+        self.episodes = self.table(offset, EPISODE_DTYPE, int(footer["episodes_count"]))
+
+    def table(self, offset: int, dtype: np.dtype, count: int) -> np.ndarray:
+        """View of a table of records in the file."""
+        end = offset + dtype.itemsize * count
+        return self.data[offset:end].view(dtype)
+
+    @property
+    def episodes_count(self) -> int:
+        """Number of recorded episodes."""
+        return len(self.episodes)
+
+    @property
+    def ticks_count(self) -> int:
+        """Number of recorded ticks in all episodes."""
+        return int(self.episodes["ticks_count"].sum())
+
+    def episode_length(self, episode: int) -> int:
+        """Number of recorded ticks in an episode."""
+        return int(self.episodes[episode]["ticks_count"])
+
+    def chunk_tables(self, chunk: int):
+        """Ticks, enemies and bullets tables of a chunk."""
+        offset, _, ticks_count, enemies_count, bullets_count = (
+            int(value) for value in self.chunks[chunk]
+        )
+        ticks = self.table(offset, TICK_DTYPE, ticks_count)
+        offset += ticks.nbytes
+        enemies = self.table(offset, ENEMY_DTYPE, enemies_count)
+        offset += enemies.nbytes
+        return ticks, enemies, self.table(offset, BULLET_DTYPE, bullets_count)
+
+    def frame(self, episode: int, tick: int) -> ReplayFrame:
+        """Get a single tick of an episode."""
+        if not 0 <= tick < self.episode_length(episode):
+            raise IndexError(
+                f"Tick {tick} is out of range for episode {episode} "
+                f"of {self.episode_length(episode)} ticks"
+            )
+        global_tick = int(self.episodes[episode]["first_tick"]) + tick
+        chunk = (
+            int(np.searchsorted(self.chunks["first_tick"], global_tick, side="right"))
+            - 1
+        )
+        ticks, enemies, bullets = self.chunk_tables(chunk)
+        row = ticks[global_tick - int(self.chunks[chunk]["first_tick"])]
+        enemies_start, bullets_start = row["enemies_start"], row["bullets_start"]
+        enemies = enemies[enemies_start:][: row["enemies_count"]]
+        bullets = bullets[bullets_start:][: row["bullets_count"]]
+        return ReplayFrame(
+            player_location=row["player_location"],
+            player_time_to_reload=float(row["player_time_to_reload"]),
+            enemy_locations=enemies["location"],
+            enemy_time_to_reload=enemies["time_to_reload"],
+            bullet_locations=bullets["location"],
+            bullet_velocities=bullets["velocity"],
+            bullet_is_player=bullets["is_player"],
+            score=int(row["score"]),
+            status=GameStatus(int(row["status"])),
+            delta_time=float(row["delta_time"]),
+            move_direction=(
+                None
+                if row["move_direction"] == NO_DIRECTION
+                else Direction(int(row["move_direction"]))
+            ),
+            shoot_angle_radians=float(row["shoot_angle_radians"]),
+            should_shoot=bool(row["should_shoot"]),
+        )
+
+    def episode_frames(self, episode: int):
+        """Iterate over all ticks of an episode."""
+        for tick in range(self.episode_length(episode)):
+            yield self.frame(episode, tick)
+
+
+def restore_frame(board: Board, frame: ReplayFrame):
+    """Set the state of a board to a recorded frame."""
+    board.player.location = np.array(frame.player_location)
+    board.player.time_to_reload = frame.player_time_to_reload
+    board.enemy_locations = np.array(frame.enemy_locations)
+    board.enemy_time_to_reload = np.array(frame.enemy_time_to_reload)
+    board.bullet_locations = np.array(frame.bullet_locations)
+    board.bullet_velocities = np.array(frame.bullet_velocities)
+    board.bullet_is_player = np.array(frame.bullet_is_player)
+    board.score = frame.score
+    board.status = frame.status
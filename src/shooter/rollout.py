@@ -0,0 +1,310 @@
+"""
+Run batched boards in worker processes.
+
+Actions and results are passed through shared memory arrays. Only short
+commands are sent through pipes, so stepping costs the same no matter how
+many games each worker holds.
+"""
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from shooter.batched_board import BatchedBoard
+from shooter.constants import DEFAULT_DELTA_TIME
+from shooter.observation import (
+    DEFAULT_OBSERVED_BULLETS,
+    batched_board_observations,
+    observation_size,
+)
+
+RESET_COMMAND = "reset"
+STEP_COMMAND = "step"
+CLOSE_COMMAND = "close"
+DONE_REPLY = "done"
+
+DEFAULT_STEP_TIMEOUT = 10.0
+
+ArraySpecs = Dict[str, Tuple[Tuple[int, ...], str]]
+
+
+class RolloutStep(NamedTuple):
+    """Combined results of all games in a single step."""
+
+    observations: np.ndarray
+    score_deltas: np.ndarray
+    lost: np.ndarray
+    final_scores: np.ndarray
+
+
+class SharedArrays:
+    """Named arrays, all kept in a single shared memory block."""
+
+    def __init__(self, specs: ArraySpecs, name: Optional[str] = None):
+        self.specs = specs
+        offsets, size = {}, 0
+        for array_name, (shape, dtype) in specs.items():
+            offsets[array_name] = size
+            array_size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+            size += array_size + (-array_size) % 8
+        self.owner = name is None
+        if self.owner:
+            self.shared_memory = SharedMemory(create=True, size=max(size, 1))
+        else:
+            # Workers share the resource tracker of the owner, so attaching
+            # here does not make the memory outlive the owner.
+            self.shared_memory = SharedMemory(name=name)
+        self.arrays = {
+            array_name: np.ndarray(
+                shape,
+                dtype=dtype,
+                buffer=self.shared_memory.buf,
+                offset=offsets[array_name],
+            )
+            for array_name, (shape, dtype) in specs.items()
+        }
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self.shared_memory.name
+
+    def __getitem__(self, array_name: str) -> np.ndarray:
+        return self.arrays[array_name]
+
+    def close(self):
+        """Stop using the arrays, and free the memory if we own it."""
+        self.arrays.clear()
+        self.shared_memory.close()
+        if self.owner:
+            self.shared_memory.unlink()
+
+
+def rollout_array_specs(games_count: int, observed_bullets: int) -> ArraySpecs:
+    """Shapes and types of the arrays shared with workers."""
+    return {
+        "move_directions": ((games_count,), "int64"),
+        "shoot_angles": ((games_count,), "float64"),
+        "should_shoot": ((games_count,), "bool"),
+        "observations": ((games_count, observation_size(observed_bullets)), "float32"),
+        "score_deltas": ((games_count,), "int64"),
+        "lost": ((games_count,), "bool"),
+        "final_scores": ((games_count,), "int64"),
+    }
+
+
+def rollout_worker(  # pylint: disable=too-many-arguments
+    connection: Connection,
+    shared_memory_name: str,
+    specs: ArraySpecs,
+    games: slice,
+    delta_time: float,
+    observed_bullets: int,
+    seed: int,
+):
+    """
+    Worker process loop, stepping a batched board for a slice of the games.
+
+    The worker handles step, reset and close commands until it is closed or the
+    pool goes away.
+    """
+    shared_arrays = SharedArrays(specs, name=shared_memory_name)
+    arrays = {name: array[games] for name, array in shared_arrays.arrays.items()}
+    batched_board = BatchedBoard(
+        games_count=len(arrays["lost"]), auto_reset=True, seed=seed
+    )
+    try:
+        while True:
+            command = connection.recv()
+            if command == CLOSE_COMMAND:
+                break
+            if command == STEP_COMMAND:
+                result = batched_board.update(
+                    delta_time=delta_time,
+                    move_directions=arrays["move_directions"],
+                    shoot_angles=arrays["shoot_angles"],
+                    should_shoot=arrays["should_shoot"],
+                )
+                arrays["score_deltas"][:] = result.score_deltas
+                arrays["lost"][:] = result.lost
+                arrays["final_scores"][:] = result.final_scores
+            else:
+                batched_board.reset()
+            arrays["observations"][:] = batched_board_observations(
+                batched_board, observed_bullets
+            )
+            connection.send(DONE_REPLY)
+    except (EOFError, BrokenPipeError, KeyboardInterrupt):
+        pass
+    finally:
+        arrays.clear()
+        shared_arrays.close()
+
+
+class RolloutPool:  # pylint: disable=too-many-instance-attributes
+    """
+    A pool of worker processes, each stepping a shard of the games.
+
+    Workers that crash or stop responding are restarted with new games. Their
+    games are reported as lost in the step they crashed in.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        workers_count: int,
+        games_per_worker: int,
+        delta_time: float = DEFAULT_DELTA_TIME,
+        observed_bullets: int = DEFAULT_OBSERVED_BULLETS,
+        seed: Optional[int] = None,
+        step_timeout: float = DEFAULT_STEP_TIMEOUT,
+    ):
+        self.workers_count = workers_count
+        self.games_per_worker = games_per_worker
+        self.delta_time = delta_time
+        self.observed_bullets = observed_bullets
+        self.step_timeout = step_timeout
+        self.restarts_count = 0
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.context = multiprocessing.get_context()
+        self.shared_arrays = SharedArrays(
+            rollout_array_specs(self.games_count, observed_bullets)
+        )
+        self.processes: List[multiprocessing.process.BaseProcess] = []
+        self.connections: List[Connection] = []
+        for worker in range(workers_count):
+            process, connection = self.start_worker(worker)
+            self.processes.append(process)
+            self.connections.append(connection)
+        self.closed = False
+
+    @property
+    def games_count(self) -> int:
+        """Number of games in all workers."""
+        return self.workers_count * self.games_per_worker
+
+    def worker_games(self, worker: int) -> slice:
+        """Slice of the games handled by a worker."""
+        return slice(
+            worker * self.games_per_worker, (worker + 1) * self.games_per_worker
+        )
+
+    def start_worker(self, worker: int):
+        """Start a worker process with new games."""
+        (seed_sequence,) = self.seed_sequence.spawn(1)
+        parent_connection, child_connection = self.context.Pipe()
+        process = self.context.Process(
+            target=rollout_worker,
+            kwargs={
+                "connection": child_connection,
+                "shared_memory_name": self.shared_arrays.name,
+                "specs": self.shared_arrays.specs,
+                "games": self.worker_games(worker),
+                "delta_time": self.delta_time,
+                "observed_bullets": self.observed_bullets,
+                "seed": int(seed_sequence.generate_state(1)[0]),
+            },
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        return process, parent_connection
+
+    def restart_worker(self, worker: int):
+        """Kill a worker and start a new one in its place."""
+        self.processes[worker].kill()
+        self.processes[worker].join()
+        self.connections[worker].close()
+        self.processes[worker], self.connections[worker] = self.start_worker(worker)
+        self.restarts_count += 1
+        self.send(worker, RESET_COMMAND)
+        if self.wait_for_workers([worker]):
+            raise RuntimeError(f"Worker {worker} failed right after restarting")
+
+    def send(self, worker: int, command: str) -> bool:
+        """Send a command to a worker. Returns whether it was sent."""
+        try:
+            self.connections[worker].send(command)
+        except (BrokenPipeError, ConnectionResetError):
+            return False
+        return True
+
+    def wait_for_workers(self, workers: List[int]) -> List[int]:
+        """Wait for workers to finish their command. Returns the failed workers."""
+        pending = {self.connections[worker]: worker for worker in workers}
+        failed = []
+        while len(pending) != 0:
+            ready = wait(list(pending), timeout=self.step_timeout)
+            if len(ready) == 0:
+                failed.extend(pending.values())
+                break
+            for connection in ready:
+                worker = pending.pop(connection)
+                try:
+                    connection.recv()
+                except (EOFError, ConnectionResetError):
+                    failed.append(worker)
+        return failed
+
+    def run_command(self, command: str) -> List[int]:
+        """Run a command on all workers, restarting the failed ones."""
+        workers = [
+            worker for worker in range(self.workers_count) if self.send(worker, command)
+        ]
+        failed = sorted(
+            set(range(self.workers_count)) - set(workers)
+            | set(self.wait_for_workers(workers))
+        )
+        for worker in failed:
+            self.restart_worker(worker)
+        return failed
+
+    def reset(self) -> np.ndarray:
+        """Reset all games, and return their observations."""
+        self.run_command(RESET_COMMAND)
+        return self.shared_arrays["observations"].copy()
+
+    def step(
+        self,
+        move_directions: np.ndarray,
+        shoot_angles: np.ndarray,
+        should_shoot: np.ndarray,
+    ) -> RolloutStep:
+        """Step all games, like :meth:`BatchedBoard.update`, in all workers."""
+        self.shared_arrays["move_directions"][:] = move_directions
+        self.shared_arrays["shoot_angles"][:] = shoot_angles
+        self.shared_arrays["should_shoot"][:] = should_shoot
+        failed = self.run_command(STEP_COMMAND)
+        for worker in failed:
+            games = self.worker_games(worker)
+            self.shared_arrays["score_deltas"][games] = 0
+            self.shared_arrays["lost"][games] = True
+            self.shared_arrays["final_scores"][games] = 0
+        return RolloutStep(
+            observations=self.shared_arrays["observations"].copy(),
+            score_deltas=self.shared_arrays["score_deltas"].copy(),
+            lost=self.shared_arrays["lost"].copy(),
+            final_scores=self.shared_arrays["final_scores"].copy(),
+        )
+
+    def close(self):
+        """Stop all workers and free the shared memory."""
+        if self.closed:
+            return
+        self.closed = True
+        for worker in range(self.workers_count):
+            self.send(worker, CLOSE_COMMAND)
+        for process, connection in zip(self.processes, self.connections):
+            process.join(timeout=self.step_timeout)
+            if process.is_alive():
+                process.kill()
+                process.join()
+            connection.close()
+        self.shared_arrays.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,266 @@
+"""
+Asyncio server hosting many games for remote clients.
+
+Every connection is a session playing its own game. The games of all sessions
+are games of a single :class:`BatchedBoard`, ticked together at a fixed rate,
+so thousands of sessions cost a few array operations per tick.
+Clients that read slower than the server writes are paused by their
+transports. Paused clients skip ticks, and get a keyframe when they resume.
+"""
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from shooter.batched_board import NO_DIRECTION, BatchedBoard
+from shooter.game_loop import DEFAULT_MAX_TICKS_PER_FRAME, FixedTimestep
+from shooter.instrumentation import BoardStats
+from shooter.protocol import (
+    ACTION,
+    ACTION_MESSAGE,
+    BULLET_DTYPE,
+    DELTA_MESSAGE,
+    KEYFRAME_MESSAGE,
+    STATE_DTYPE,
+    WELCOME,
+    WELCOME_MESSAGE,
+    Action,
+    MessageReader,
+    ProtocolError,
+    decode_action,
+    encode_message,
+    mask_size,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7777
+DEFAULT_SERVER_TICK_RATE = 30
+DEFAULT_MAX_SESSIONS = 1024
+DEFAULT_WRITE_BUFFER_LIMIT = 64 * 1024
+
+
+class Session(asyncio.Protocol):
+    """Connection of a single client, playing a single game."""
+
+    def __init__(self, server: "GameServer"):
+        self.server = server
+        self.transport: Optional[asyncio.WriteTransport] = None
+        self.game = -1
+        self.reader = MessageReader(max_payload_size=ACTION.size)
+        self.paused = False
+        self.needs_keyframe = True
+
+    def connection_made(self, transport):
+        self.transport = transport
+        transport.set_write_buffer_limits(high=self.server.write_buffer_limit)
+        self.server.add_session(self)
+
+    def data_received(self, data: bytes):
+        try:
+            for message_type, payload in self.reader.feed(data):
+                if message_type != ACTION_MESSAGE:
+                    raise ProtocolError(f"Unexpected message type: {message_type}")
+                self.server.set_action(self.game, decode_action(payload))
+        except ProtocolError:
+            self.server.stats.count("protocol_errors")
+            self.transport.close()
+
+    def connection_lost(self, exc: Optional[Exception]):
+        self.server.remove_session(self)
+
+    def pause_writing(self):
+        self.paused = True
+
+    def resume_writing(self):
+        self.paused = False
+
+
+class GameServer:  # pylint: disable=too-many-instance-attributes
+    """
+    Host games of many sessions, and tick them all together.
+
+    Games without a session are kept lost, and are reset when a session takes
+    them. Lost games of sessions are reset right after their final state is
+    sent. Timings of ticks and counts of sent states are kept in ``stats``.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        tick_rate: float = DEFAULT_SERVER_TICK_RATE,
+        seed: Optional[int] = None,
+        write_buffer_limit: int = DEFAULT_WRITE_BUFFER_LIMIT,
+        max_ticks_per_frame: int = DEFAULT_MAX_TICKS_PER_FRAME,
+    ):
+        self.board = BatchedBoard(games_count=max_sessions, auto_reset=False, seed=seed)
+        self.board.lost[:] = True
+        self.timestep = FixedTimestep(tick_rate, max_ticks_per_frame)
+        self.write_buffer_limit = write_buffer_limit
+        self.stats = BoardStats()
+        self.tick = 0
+        self.sessions: Dict[int, Session] = {}
+        # Pop the lowest free games first.
+        self.free_games = list(range(max_sessions - 1, -1, -1))
+        self.move_directions = np.full(max_sessions, NO_DIRECTION)
+        self.shoot_angles = np.zeros(max_sessions)
+        self.should_shoot = np.zeros(max_sessions, dtype=bool)
+        self.listeners: List[asyncio.AbstractServer] = []
+        self.ticker: Optional[asyncio.Task] = None
+
+    def add_session(self, session: Session):
+        """Start a game for a new session, or close it if the server is full."""
+        if len(self.free_games) == 0:
+            self.stats.count("sessions_rejected")
+            session.transport.close()
+            return
+        session.game = game = self.free_games.pop()
+        self.sessions[game] = session
+        self.set_action(game, Action(None, 0.0, False))
+        self.board.reset(np.array([game]))
+        session.needs_keyframe = True
+        session.transport.write(
+            encode_message(
+                WELCOME_MESSAGE, WELCOME.pack(game, self.timestep.tick_duration)
+            )
+        )
+        self.stats.count("sessions")
+
+    def remove_session(self, session: Session):
+        """Free the game of a closed session."""
+        if self.sessions.get(session.game) is not session:
+            return
+        del self.sessions[session.game]
+        self.board.lost[session.game] = True
+        self.set_action(session.game, Action(None, 0.0, False))
+        self.free_games.append(session.game)
+
+    def set_action(self, game: int, action: Action):
+        """Set the action repeated by a game from the next tick on."""
+        self.move_directions[game] = (
+            NO_DIRECTION if action.move_direction is None else action.move_direction
+        )
+        self.shoot_angles[game] = action.shoot_angle_radians
+        self.should_shoot[game] = action.should_shoot
+
+    def step(self):
+        """Tick all games, send their states, and reset the lost ones."""
+        start_time = time.perf_counter()
+        previous_counts = self.board.bullet_counts.copy()
+        self.board.update(
+            delta_time=self.timestep.tick_duration,
+            move_directions=self.move_directions,
+            shoot_angles=self.shoot_angles,
+            should_shoot=self.should_shoot,
+        )
+        self.tick += 1
+        self.send_states(previous_counts)
+        games = np.fromiter(self.sessions, dtype=int, count=len(self.sessions))
+        lost_games = games[self.board.lost[games]]
+        if len(lost_games) != 0:
+            self.board.reset(lost_games)
+            for game in lost_games:
+                self.sessions[game].needs_keyframe = True
+        self.stats.lap("tick", start_time)
+
+    def send_states(self, previous_counts: np.ndarray):
+        """Send the state of every game to its session."""
+        board = self.board
+        kept_counts = np.cumsum(board.kept_bullets, axis=1)
+        kept_previous = np.where(
+            previous_counts > 0,
+            kept_counts[np.arange(board.games_count), previous_counts - 1],
+            0,
+        )
+        states = np.empty(board.games_count, dtype=STATE_DTYPE)
+        states["tick"] = self.tick
+        states["score"] = board.scores
+        states["lost"] = board.lost
+        states["player_location"] = board.player_locations
+        states["enemy_location"] = board.enemy_locations
+        states["previous_bullets"] = previous_counts
+        states["new_bullets"] = board.bullet_counts - kept_previous
+        masks = np.packbits(board.kept_bullets, axis=1, bitorder="little")
+        for game, session in self.sessions.items():
+            if session.paused:
+                session.needs_keyframe = True
+                self.stats.count("states_skipped")
+                continue
+            state = states[game]
+            bullets_count = board.bullet_counts[game]
+            if session.needs_keyframe:
+                session.needs_keyframe = False
+                state["previous_bullets"] = 0
+                state["new_bullets"] = bullets_count
+                message_type, mask = KEYFRAME_MESSAGE, b""
+                self.stats.count("keyframes_sent")
+            else:
+                message_type = DELTA_MESSAGE
+                mask = masks[game, : mask_size(previous_counts[game])].tobytes()
+            message = encode_message(
+                message_type,
+                state.tobytes()
+                + mask
+                + self.bullets_bytes(
+                    game, bullets_count - state["new_bullets"], bullets_count
+                ),
+            )
+            session.transport.write(message)
+            self.stats.count("states_sent")
+            self.stats.count("bytes_sent", len(message))
+
+    def bullets_bytes(self, game: int, start: int, end: int) -> bytes:
+        """Encode a range of bullets of a game."""
+        if start == end:
+            return b""
+        bullets = np.empty(end - start, dtype=BULLET_DTYPE)
+        bullets["location"] = self.board.bullet_locations[game, start:end]
+        bullets["velocity"] = self.board.bullet_velocities[game, start:end]
+        bullets["is_player"] = self.board.bullet_is_player[game, start:end]
+        return bullets.tobytes()
+
+    async def run(self):
+        """Tick the games at a fixed rate, forever."""
+        self.timestep.restart()
+        while True:
+            for _ in range(self.timestep.advance()):
+                self.step()
+            await asyncio.sleep(
+                self.timestep.tick_duration - self.timestep.accumulated_time
+            )
+
+    async def start(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        path: Optional[str] = None,
+    ) -> asyncio.AbstractServer:
+        """
+        Listen on a TCP port, or on a Unix socket if a path is given.
+
+        Games start ticking when the server starts listening for the first time.
+        """
+        loop = asyncio.get_running_loop()
+        backlog = len(self.free_games) + len(self.sessions)
+        if path is not None:
+            listener = await loop.create_unix_server(
+                lambda: Session(self), path, backlog=backlog
+            )
+        else:
+            listener = await loop.create_server(
+                lambda: Session(self), host, port, backlog=backlog
+            )
+        self.listeners.append(listener)
+        if self.ticker is None:
+            self.ticker = asyncio.create_task(self.run())
+        return listener
+
+    async def close(self):
+        """Stop listening, stop ticking and close all sessions."""
+        for listener in self.listeners:
+            listener.close()
+            await listener.wait_closed()
+        if self.ticker is not None:
+            self.ticker.cancel()
+        for session in list(self.sessions.values()):
+            session.transport.close()
@@ -12,6 +12,15 @@ from shooter.utils import direction_vector
 class Shooter(Square):
     """A shooter class that can shoot bullets"""
 
+    __slots__ = (
+        "shooter_id",
+        "speed",
+        "bullet_width",
+        "bullet_speed",
+        "reload_time",
+        "time_to_reload",
+    )
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         location: np.ndarray,
@@ -36,7 +45,7 @@ class Shooter(Square):
 
     def move_in_vector(self, distance: float, vector: np.ndarray):
         """Move in a given direction and distance"""
-        self.location += distance * vector
+        self._set_own_location(self.location + distance * vector)
 
     def move_in_direction(self, delta_time: float, direction: Direction):
         """Move shooter in direction in given time."""
@@ -77,12 +86,14 @@ class Shooter(Square):
 
     def update_time_to_reload(self, delta_time: float):
         """Update the time to reload."""
-        self.time_to_reload = np.max([0, self.time_to_reload - delta_time])
+        self.time_to_reload = max(0.0, self.time_to_reload - delta_time)
 
 
 class Bullet(Square):
     """A bullet class that can hit shooters."""
 
+    __slots__ = ("shooter_id", "speed", "angle_radians")
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         location: np.ndarray,
@@ -98,7 +109,10 @@ class Bullet(Square):
 
     def update(self, delta_time: float):
         """Update bullet location after a giving time."""
-        self.location += delta_time * self.speed * direction_vector(self.angle_radians)
+        self._set_own_location(
+            self.location
+            + delta_time * self.speed * direction_vector(self.angle_radians)
+        )
 
     def is_hitting(self, other: Square):
         """
@@ -0,0 +1,277 @@
+"""Run games headlessly, as fast as possible."""
+import time
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from shooter.batched_board import BatchedBoard
+from shooter.board import Board
+from shooter.direction import Direction
+from shooter.instrumentation import BoardStats
+from shooter.policies import Policy
+from shooter.replay import ReplayWriter
+from shooter.rollout import RolloutPool
+
+BATCHED_ENGINE = "batched"
+BOARD_ENGINE = "board"
+POOL_ENGINE = "pool"
+ENGINES = [BATCHED_ENGINE, BOARD_ENGINE, POOL_ENGINE]
+SEED_BOUND = 2**32
+
+
+class EpisodeResult(NamedTuple):
+    """Result of a single finished episode."""
+
+    game: int
+    score: int
+    length: int
+
+
+class SimulationResult(NamedTuple):
+    """Result of a simulation."""
+
+    episodes: List[EpisodeResult]
+    steps: int
+    elapsed_seconds: float
+    stats: Optional[BoardStats] = None
+
+    @property
+    def steps_per_second(self) -> float:
+        """Game steps per second, summed over all games."""
+        return self.steps / self.elapsed_seconds
+
+    @property
+    def episodes_per_second(self) -> float:
+        """Finished episodes per second."""
+        return len(self.episodes) / self.elapsed_seconds
+
+    @property
+    def mean_score(self) -> float:
+        """Mean score of finished episodes."""
+        if len(self.episodes) == 0:
+            return float("nan")
+        return float(np.mean([episode.score for episode in self.episodes]))
+
+    @property
+    def mean_episode_length(self) -> float:
+        """Mean number of steps of finished episodes."""
+        if len(self.episodes) == 0:
+            return float("nan")
+        return float(np.mean([episode.length for episode in self.episodes]))
+
+
+def simulate(  # pylint: disable=too-many-arguments
+    games_count: int,
+    steps: int,
+    delta_time: float,
+    policy: Policy,
+    seed: Optional[int] = None,
+    engine: str = BATCHED_ENGINE,
+    workers_count: int = 1,
+    recorder: Optional[ReplayWriter] = None,
+    collect_stats: bool = False,
+) -> SimulationResult:
+    """
+    Run games for a number of steps, resetting games when they are lost.
+
+    Only episodes that were lost during the simulation are reported.
+    The number of workers is only used by the pool engine. Games can only be
+    recorded, and update stats can only be collected, by the board engine.
+    """
+    if recorder is not None and engine != BOARD_ENGINE:
+        raise ValueError(f"Recording is not supported by the {engine} engine")
+    if collect_stats and engine != BOARD_ENGINE:
+        raise ValueError(f"Collecting stats is not supported by the {engine} engine")
+    if engine == BATCHED_ENGINE:
+        return simulate_batched_board(
+            games_count=games_count,
+            steps=steps,
+            delta_time=delta_time,
+            policy=policy,
+            seed=seed,
+        )
+    if engine == BOARD_ENGINE:
+        return simulate_boards(
+            games_count=games_count,
+            steps=steps,
+            delta_time=delta_time,
+            policy=policy,
+            seed=seed,
+            recorder=recorder,
+            collect_stats=collect_stats,
+        )
+    if engine == POOL_ENGINE:
+        return simulate_pool(
+            games_count=games_count,
+            steps=steps,
+            delta_time=delta_time,
+            policy=policy,
+            seed=seed,
+            workers_count=workers_count,
+        )
+    raise ValueError(f"Unknown engine: {engine}")
+
+
+def simulate_batched_board(
+    games_count: int,
+    steps: int,
+    delta_time: float,
+    policy: Policy,
+    seed: Optional[int] = None,
+) -> SimulationResult:
+    """Run games using a single batched board."""
+    rng = np.random.default_rng(seed)
+    batched_board = BatchedBoard(
+        games_count=games_count, seed=int(rng.integers(SEED_BOUND))
+    )
+    episodes: List[EpisodeResult] = []
+    lengths = np.zeros(games_count, dtype=int)
+    start_time = time.perf_counter()
+    for _ in range(steps):
+        actions = policy(
+            batched_board.player_locations, batched_board.enemy_locations, rng
+        )
+        result = batched_board.update(
+            delta_time=delta_time,
+            move_directions=actions.move_directions,
+            shoot_angles=actions.shoot_angles,
+            should_shoot=actions.should_shoot,
+        )
+        lengths += 1
+        for game in np.flatnonzero(result.lost):
+            episodes.append(
+                EpisodeResult(
+                    game=int(game),
+                    score=int(result.final_scores[game]),
+                    length=int(lengths[game]),
+                )
+            )
+        lengths[result.lost] = 0
+    return SimulationResult(
+        episodes=episodes,
+        steps=games_count * steps,
+        elapsed_seconds=time.perf_counter() - start_time,
+    )
+
+
+def simulate_boards(  # pylint: disable=too-many-arguments,too-many-locals
+    games_count: int,
+    steps: int,
+    delta_time: float,
+    policy: Policy,
+    seed: Optional[int] = None,
+    recorder: Optional[ReplayWriter] = None,
+    collect_stats: bool = False,
+) -> SimulationResult:
+    """
+    Run games using a board for each game, recording them if required to.
+
+    When collecting stats, all boards share the same stats.
+    """
+    rng = np.random.default_rng(seed)
+    stats = BoardStats() if collect_stats else None
+    boards = [
+        Board(seed=int(rng.integers(SEED_BOUND)), stats=stats)
+        for _ in range(games_count)
+    ]
+    if recorder is not None:
+        for game, board in enumerate(boards):
+            recorder.record(board, game=game)
+    episodes: List[EpisodeResult] = []
+    lengths = np.zeros(games_count, dtype=int)
+    start_time = time.perf_counter()
+    for _ in range(steps):
+        actions = policy(
+            np.array([board.player.location for board in boards]),
+            np.array(
+                [board.enemy_locations[board.nearest_enemy()] for board in boards]
+            ),
+            rng,
+        )
+        for game, board in enumerate(boards):
+            move_direction = actions.move_directions[game]
+            update_arguments = {
+                "delta_time": delta_time,
+                "move_direction": (
+                    Direction(move_direction) if move_direction >= 0 else None
+                ),
+                "shoot_angle_radians": float(actions.shoot_angles[game]),
+                "should_shoot": bool(actions.should_shoot[game]),
+            }
+            board.update(**update_arguments)
+            if recorder is not None:
+                recorder.record(board, game=game, **update_arguments)
+            lengths[game] += 1
+            if board.is_lost:
+                episodes.append(
+                    EpisodeResult(
+                        game=game, score=board.score, length=int(lengths[game])
+                    )
+                )
+                lengths[game] = 0
+                board.reset()
+                if recorder is not None:
+                    recorder.end_episode(game)
+                    recorder.record(board, game=game)
+    return SimulationResult(
+        episodes=episodes,
+        steps=games_count * steps,
+        elapsed_seconds=time.perf_counter() - start_time,
+        stats=stats,
+    )
+
+
+def simulate_pool(  # pylint: disable=too-many-arguments
+    games_count: int,
+    steps: int,
+    delta_time: float,
+    policy: Policy,
+    seed: Optional[int] = None,
+    workers_count: int = 1,
+) -> SimulationResult:
+    """Run games using batched boards in a pool of worker processes."""
+    if games_count % workers_count != 0:
+        raise ValueError(
+            f"Games count ({games_count}) must be divisible "
+            f"by workers count ({workers_count})"
+        )
+    rng = np.random.default_rng(seed)
+    episodes: List[EpisodeResult] = []
+    lengths = np.zeros(games_count, dtype=int)
+    with RolloutPool(
+        workers_count=workers_count,
+        games_per_worker=games_count // workers_count,
+        delta_time=delta_time,
+        observed_bullets=0,
+        seed=int(rng.integers(SEED_BOUND)),
+    ) as pool:
+        start_time = time.perf_counter()
+        observations = pool.reset()
+        for _ in range(steps):
+            # Observations start with the player and the enemy locations.
+            actions = policy(
+                observations[:, 0:2].astype(float),
+                observations[:, 2:4].astype(float),
+                rng,
+            )
+            result = pool.step(
+                move_directions=actions.move_directions,
+                shoot_angles=actions.shoot_angles,
+                should_shoot=actions.should_shoot,
+            )
+            observations = result.observations
+            lengths += 1
+            for game in np.flatnonzero(result.lost):
+                episodes.append(
+                    EpisodeResult(
+                        game=int(game),
+                        score=int(result.final_scores[game]),
+                        length=int(lengths[game]),
+                    )
+                )
+            lengths[result.lost] = 0
+        return SimulationResult(
+            episodes=episodes,
+            steps=games_count * steps,
+            elapsed_seconds=time.perf_counter() - start_time,
+        )
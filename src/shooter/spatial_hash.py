@@ -0,0 +1,70 @@
+"""Uniform grid over the screen, for finding points near a box quickly."""
+from typing import Tuple
+
+import numpy as np
+
+
+class SpatialHash:
+    """
+    Spatial hash of points, bucketed in square cells covering the screen.
+
+    Points outside the screen are kept in the nearest edge cell, so queries may
+    return points that are far from the box, but never miss a point inside it.
+    The hash is rebuilt from scratch with :meth:`build`. Cell keys are small
+    integers, so sorting points by their cells is a linear time radix sort.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells_per_side = int(np.ceil(1 / cell_size))
+        cells_count = self.cells_per_side**2
+        self.key_dtype = np.int16 if cells_count <= np.iinfo(np.int16).max else int
+        self.order = np.empty(0, dtype=int)
+        self.cell_starts = np.zeros(cells_count + 1, dtype=int)
+
+    def cells(self, locations: np.ndarray) -> np.ndarray:
+        """Cell coordinates of locations, clipped to the screen."""
+        # Truncating instead of flooring only changes negative coordinates,
+        # which are clipped to the first cell anyway.
+        cells = (locations / self.cell_size).astype(self.key_dtype)
+        # np.clip has a large fixed overhead, so clip with minimum and maximum.
+        np.maximum(cells, 0, out=cells)
+        np.minimum(cells, self.cells_per_side - 1, out=cells)
+        return cells
+
+    def build(self, locations: np.ndarray):
+        """Hash points by their locations."""
+        cells = self.cells(locations)
+        keys = cells[:, 1] * self.key_dtype(self.cells_per_side) + cells[:, 0]
+        self.order = np.argsort(keys, kind="stable")
+        self.cell_starts[1:] = np.cumsum(
+            np.bincount(keys, minlength=self.cells_per_side**2)
+        )
+
+    def query(
+        self, min_corners: np.ndarray, max_corners: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find points in all cells overlapping each of the given boxes.
+
+        Returns the indices of boxes and of candidate points in them, as pairs.
+        """
+        min_cells = self.cells(min_corners).astype(int)
+        max_cells = self.cells(max_corners).astype(int)
+        # Cells of a box in a single row are consecutive, so their points are
+        # a single range of the points order.
+        rows_counts = max_cells[:, 1] - min_cells[:, 1] + 1
+        boxes = np.repeat(np.arange(len(min_cells)), rows_counts)
+        rows = concatenated_ranges(min_cells[:, 1], rows_counts)
+        starts = self.cell_starts[rows * self.cells_per_side + min_cells[boxes, 0]]
+        ends = self.cell_starts[rows * self.cells_per_side + max_cells[boxes, 0] + 1]
+        points = self.order[concatenated_ranges(starts, ends - starts)]
+        return np.repeat(boxes, ends - starts), points
+
+
+def concatenated_ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Concatenation of ranges with the given starts and lengths."""
+    ends = np.cumsum(counts)
+    return np.arange(ends[-1] if len(ends) != 0 else 0) + np.repeat(
+        starts - ends + counts, counts
+    )
@@ -1,53 +1,113 @@
 """Implement a square class which is the base for any other object in game."""
+from typing import Tuple
+
 import numpy as np
 
+Bounds = Tuple[float, float, float, float]
+
+# min x, min y, max x and max y of the entire screen.
+_SCREEN_BOUNDS: Bounds = (0.0, 0.0, 1.0, 1.0)
+
 
 class Square:
-    """Square class."""
+    """
+    Square class.
+
+    The square bounds are cached as floats, and updated whenever the location
+    or the width are set. Therefore, the location array is read-only and can
+    only be changed by setting a new location.
+    """
+
+    __slots__ = ("_location", "_width", "_bounds")
 
     def __init__(self, location: np.ndarray, width: float):
-        self.location = np.array(location)
-        self.width = width
+        self._width = width
+        self._location = np.array(location)
+        self._location.flags.writeable = False
+        self._bounds = self._compute_bounds()
+
+    @property
+    def location(self) -> np.ndarray:
+        """Center of the square."""
+        return self._location
+
+    @location.setter
+    def location(self, location: np.ndarray):
+        self._set_own_location(np.array(location))
+
+    @property
+    def width(self) -> float:
+        """Width of the square."""
+        return self._width
+
+    @width.setter
+    def width(self, width: float):
+        self._width = width
+        self._bounds = self._compute_bounds()
+
+    @property
+    def bounds(self) -> Bounds:
+        """Minimal x, minimal y, maximal x and maximal y of the square."""
+        return self._bounds
+
+    def _set_own_location(self, location: np.ndarray):
+        """Set a location array without copying it. Nothing else may use it."""
+        location.flags.writeable = False
+        self._location = location
+        self._bounds = self._compute_bounds()
+
+    def _compute_bounds(self) -> Bounds:
+        half_width = self._width / 2
+        x, y = self._location.tolist()  # pylint: disable=invalid-name
+        return (x - half_width, y - half_width, x + half_width, y + half_width)
 
     def __contains__(self, location: np.ndarray) -> bool:
-        return (
-            self.top_left[0] <= location[0] <= self.bottom_right[0]
-            and self.top_left[1] <= location[1] <= self.bottom_right[1]
-        )
+        min_x, min_y, max_x, max_y = self._bounds
+        return min_x <= location[0] <= max_x and min_y <= location[1] <= max_y
 
     def is_intersecting(self, other: "Square") -> bool:
         """Is this square intersecting with the other square."""
-        min_x = max(self.top_left[0], other.top_left[0])
-        min_y = max(self.top_left[1], other.top_left[1])
-        max_x = min(self.bottom_right[0], other.bottom_right[0])
-        max_y = min(self.bottom_right[1], other.bottom_right[1])
-        return min_x <= max_x and min_y <= max_y
+        min_x1, min_y1, max_x1, max_y1 = self._bounds
+        min_x2, min_y2, max_x2, max_y2 = other.bounds
+        return max(min_x1, min_x2) <= min(max_x1, max_x2) and max(
+            min_y1, min_y2
+        ) <= min(max_y1, max_y2)
 
     @property
     def valid(self):
         """Is this square is intersecting with the screen."""
-        all_screen = self.all_screen()
-        return self.top_left in all_screen and self.bottom_right in all_screen
+        min_x, min_y, max_x, max_y = self._bounds
+        screen_min_x, screen_min_y, screen_max_x, screen_max_y = _SCREEN_BOUNDS
+        return (
+            screen_min_x <= min_x <= screen_max_x
+            and screen_min_y <= min_y <= screen_max_y
+            and screen_min_x <= max_x <= screen_max_x
+            and screen_min_y <= max_y <= screen_max_y
+        )
 
     @property
     def top_left(self) -> np.ndarray:
         """Top left corner of the square."""
-        return self.location + np.array([-self.width / 2, -self.width / 2])
+        min_x, min_y, _, _ = self._bounds
+        return np.array([min_x, min_y])
 
     @property
     def top_right(self) -> np.ndarray:
         """Top right corner of the square."""
-        return self.location + np.array([-self.width / 2, self.width / 2])
+        min_x, _, _, max_y = self._bounds
+        return np.array([min_x, max_y])
 
     @property
     def bottom_left(self) -> np.ndarray:
         """Bottom left corner of the square."""
-        return self.location + np.array([self.width / 2, -self.width / 2])
+        _, min_y, max_x, _ = self._bounds
+        return np.array([max_x, min_y])
 
     @property
     def bottom_right(self) -> np.ndarray:
         """Bottom right corner of the square."""
-        return self.location + np.array([self.width / 2, self.width / 2])
+        _, _, max_x, max_y = self._bounds
+        return np.array([max_x, max_y])
 
     def __repr__(self):
         return f"Square(location={self.location}, width={self.width})"
@@ -1,10 +1,59 @@
 """Utility methods for the shooter game."""
+from typing import Optional
+
 import numpy as np
 
+from shooter.geometry import squares_intersecting
+from shooter.instrumentation import BoardStats
+
+
+def random_location(
+    margin: float = 0, size=2, rng: Optional[np.random.Generator] = None
+):
+    """
+    Get a random location, or an array of random locations of a given size.
+
+    Locations are drawn from the given generator, or from the global numpy
+    random state if no generator is given.
+    """
+    if rng is None:
+        return np.random.uniform(margin, 1 - margin, size=size)
+    return rng.uniform(margin, 1 - margin, size=size)
+
+
+def random_squares_not_intersecting(  # pylint: disable=too-many-arguments
+    others: np.ndarray,
+    width: float,
+    margin: float,
+    rng: np.random.Generator,
+    candidates_count: int,
+    stats: Optional[BoardStats] = None,
+) -> np.ndarray:
+    """
+    Get a random location for each of the other squares, not intersecting it.
 
-def random_location(margin: float = 0):
-    """Get a random location."""
-    return np.random.uniform(margin, 1 - margin, size=2)
+    Candidate locations are drawn in blocks, and the first valid candidate is
+    kept for each square. Only squares without any valid candidate draw again.
+    Spawned squares and drawn candidates are counted in the stats, if given.
+    """
+    if stats is not None:
+        stats.count("spawns", len(others))
+    locations = np.empty_like(others)
+    missing = np.arange(len(others))
+    while len(missing) != 0:
+        candidates = random_location(
+            margin=margin, size=(len(missing), candidates_count, 2), rng=rng
+        )
+        if stats is not None:
+            stats.count("spawn_candidates", len(missing) * candidates_count)
+        valid = ~squares_intersecting(
+            candidates, width, others[missing, np.newaxis], width
+        )
+        found = valid.any(axis=1)
+        first_valid = valid.argmax(axis=1)
+        locations[missing[found]] = candidates[found, first_valid[found]]
+        missing = missing[~found]
+    return locations
 
 
 def direction_vector(angle_radians):
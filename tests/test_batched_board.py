@@ -0,0 +1,372 @@
+import numpy as np
+import pytest
+
+from shooter.batched_board import NO_DIRECTION, BatchedBoard
+from shooter.board import Board
+from shooter.direction import Direction
+from shooter.utils import direction_vector
+
+
+def copy_board_state(board: Board, batched_board: BatchedBoard, game: int = 0):
+    bullets_count = len(board.bullet_is_player)
+    batched_board.player_locations[game] = board.player.location
+    batched_board.enemy_locations[game] = board.enemy_locations[0]
+    batched_board.player_time_to_reload[game] = board.player.time_to_reload
+    batched_board.enemy_time_to_reload[game] = board.enemy_time_to_reload[0]
+    batched_board.scores[game] = board.score
+    batched_board.bullet_counts[game] = bullets_count
+    batched_board.bullet_locations[game, :bullets_count] = board.bullet_locations
+    batched_board.bullet_velocities[game, :bullets_count] = board.bullet_velocities
+    batched_board.bullet_is_player[game, :bullets_count] = board.bullet_is_player
+
+
+def assert_same_state(board: Board, batched_board: BatchedBoard, game: int = 0):
+    bullets_count = batched_board.bullet_counts[game]
+    np.testing.assert_array_equal(
+        batched_board.player_locations[game], board.player.location
+    )
+    np.testing.assert_array_equal(
+        batched_board.enemy_locations[game], board.enemy_locations[0]
+    )
+    assert batched_board.player_time_to_reload[game] == board.player.time_to_reload
+    assert batched_board.enemy_time_to_reload[game] == board.enemy_time_to_reload[0]
+    assert batched_board.scores[game] == board.score
+    np.testing.assert_array_equal(
+        batched_board.bullet_locations[game, :bullets_count], board.bullet_locations
+    )
+    np.testing.assert_array_equal(
+        batched_board.bullet_velocities[game, :bullets_count], board.bullet_velocities
+    )
+    np.testing.assert_array_equal(
+        batched_board.bullet_is_player[game, :bullets_count], board.bullet_is_player
+    )
+
+
+def test_batched_board_constructor():
+    games_count = 20
+
+    batched_board = BatchedBoard(games_count=games_count, seed=0)
+
+    assert batched_board.player_locations.shape == (games_count, 2)
+    assert batched_board.enemy_locations.shape == (games_count, 2)
+    assert np.all(batched_board.player_locations >= batched_board.shooter_width)
+    assert np.all(batched_board.player_locations <= 1 - batched_board.shooter_width)
+    assert not np.any(
+        np.all(
+            np.abs(batched_board.player_locations - batched_board.enemy_locations)
+            <= batched_board.shooter_width,
+            axis=1,
+        )
+    )
+    np.testing.assert_array_equal(batched_board.bullet_counts, 0)
+    np.testing.assert_array_equal(batched_board.scores, 0)
+    assert not np.any(batched_board.lost)
+
+
+def test_batched_board_seed():
+    batched_board1 = BatchedBoard(games_count=5, seed=3)
+    batched_board2 = BatchedBoard(games_count=5, seed=3)
+
+    np.testing.assert_array_equal(
+        batched_board1.player_locations, batched_board2.player_locations
+    )
+    np.testing.assert_array_equal(
+        batched_board1.enemy_locations, batched_board2.enemy_locations
+    )
+
+
+def test_batched_board_reset_with_seed():
+    batched_board = BatchedBoard(games_count=5, seed=3)
+    player_locations = batched_board.player_locations.copy()
+    enemy_locations = batched_board.enemy_locations.copy()
+    batched_board.reset()
+
+    batched_board.reset(seed=3)
+
+    np.testing.assert_array_equal(batched_board.player_locations, player_locations)
+    np.testing.assert_array_equal(batched_board.enemy_locations, enemy_locations)
+
+
+def random_action(board: Board, rng: np.random.Generator, delta_time: float):
+    """Shoot around the enemy while randomly moving inside the screen."""
+    delta_x, delta_y = board.enemy_locations[0] - board.player.location
+    angle = np.arctan2(delta_y, delta_x) + rng.normal(0, 0.1)
+    direction = rng.choice([None, *Direction])
+    if direction is not None:
+        location = (
+            board.player.location
+            + delta_time * board.player_speed * direction.to_vector()
+        )
+        if np.any(location < 0.1) or np.any(location > 0.9):
+            direction = None
+    return direction, angle, bool(rng.integers(2))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batched_board_matches_board(seed):
+    rng = np.random.default_rng(seed)
+    board = Board(seed=seed)
+    batched_board = BatchedBoard(games_count=1, auto_reset=False, seed=seed)
+    copy_board_state(board, batched_board)
+    delta_time = 0.02
+
+    for _ in range(500):
+        direction, angle, should_shoot = random_action(board, rng, delta_time)
+        score = board.score
+        board.update(
+            delta_time=delta_time,
+            move_direction=direction,
+            shoot_angle_radians=angle,
+            should_shoot=should_shoot,
+        )
+        batched_board.update(
+            delta_time=delta_time,
+            move_directions=[NO_DIRECTION if direction is None else direction],
+            shoot_angles=[angle],
+            should_shoot=[should_shoot],
+        )
+        if board.score != score:
+            batched_board.enemy_locations[0] = board.enemy_locations[0]
+        assert_same_state(board, batched_board)
+        assert batched_board.lost[0] == board.is_lost
+        if board.is_lost:
+            break
+
+
+def test_batched_board_player_move():
+    batched_board = BatchedBoard(games_count=5, seed=0)
+    player_locations = np.full((5, 2), 0.5)
+    batched_board.player_locations[:] = player_locations
+    batched_board.enemy_locations[:] = 0.2
+    delta_time = 0.1
+    move_directions = np.array([*Direction, NO_DIRECTION])
+
+    batched_board.update(
+        delta_time=delta_time,
+        move_directions=move_directions,
+        shoot_angles=np.zeros(5),
+        should_shoot=np.zeros(5, dtype=bool),
+    )
+
+    for i, direction in enumerate(Direction):
+        np.testing.assert_array_almost_equal(
+            batched_board.player_locations[i],
+            player_locations[i]
+            + delta_time * batched_board.player_speed * direction.to_vector(),
+        )
+    np.testing.assert_array_equal(batched_board.player_locations[4], [0.5, 0.5])
+
+
+def test_batched_board_player_shoot():
+    batched_board = BatchedBoard(games_count=2, seed=0)
+    batched_board.player_locations[:] = 0.5
+    batched_board.enemy_locations[:] = 0.2
+    batched_board.enemy_time_to_reload[:] = 1
+    angle = np.pi / 3
+    delta_time = 0.1
+
+    batched_board.update(
+        delta_time=delta_time,
+        move_directions=[NO_DIRECTION, NO_DIRECTION],
+        shoot_angles=[angle, angle],
+        should_shoot=[True, False],
+    )
+
+    np.testing.assert_array_equal(batched_board.bullet_counts, [1, 0])
+    assert batched_board.bullet_is_player[0, 0]
+    np.testing.assert_array_almost_equal(
+        batched_board.bullet_locations[0, 0],
+        0.5 + delta_time * batched_board.bullet_speed * direction_vector(angle),
+    )
+    np.testing.assert_array_equal(
+        batched_board.player_time_to_reload,
+        [batched_board.player_reload_time, 0],
+    )
+
+
+def test_batched_board_hit_enemy():
+    batched_board = BatchedBoard(games_count=2, seed=0)
+    batched_board.player_locations[:] = 0.8
+    batched_board.enemy_locations[:] = 0.2
+    batched_board.enemy_time_to_reload[:] = 1
+    batched_board.add_bullets(
+        games=np.array([0]),
+        locations=np.array([[0.2, 0.2]]),
+        angles=np.array([0]),
+        is_player=True,
+    )
+
+    result = batched_board.update(
+        delta_time=0.01,
+        move_directions=[NO_DIRECTION, NO_DIRECTION],
+        shoot_angles=[0, 0],
+        should_shoot=[False, False],
+    )
+
+    np.testing.assert_array_equal(result.score_deltas, [1, 0])
+    np.testing.assert_array_equal(batched_board.scores, [1, 0])
+    np.testing.assert_array_equal(batched_board.bullet_counts, [0, 0])
+    assert not np.any(result.lost)
+    assert not np.allclose(batched_board.enemy_locations[0], 0.2, atol=0.01)
+
+
+def test_batched_board_hit_enemy_with_bullets_in_order():
+    batched_board = BatchedBoard(games_count=1, seed=0)
+    batched_board.player_locations[:] = 0.8
+    batched_board.enemy_locations[:] = 0.2
+    batched_board.enemy_time_to_reload[:] = 1
+    for _ in range(3):
+        batched_board.add_bullets(
+            games=np.array([0]),
+            locations=np.array([[0.2, 0.2]]),
+            angles=np.array([0]),
+            is_player=True,
+        )
+
+    result = batched_board.update(
+        delta_time=0.01,
+        move_directions=[NO_DIRECTION],
+        shoot_angles=[0],
+        should_shoot=[False],
+    )
+
+    np.testing.assert_array_equal(result.score_deltas, [1])
+    np.testing.assert_array_equal(batched_board.bullet_counts, [2])
+
+
+def test_batched_board_enemy_bullet_hits_player():
+    batched_board = BatchedBoard(games_count=2, auto_reset=False, seed=0)
+    batched_board.player_locations[:] = 0.8
+    batched_board.enemy_locations[:] = 0.2
+    batched_board.enemy_time_to_reload[:] = 1
+    batched_board.add_bullets(
+        games=np.array([0, 1]),
+        locations=np.array([[0.8, 0.8], [0.8, 0.8]]),
+        angles=np.array([0, 0]),
+        is_player=np.array([False, True]),
+    )
+
+    result = batched_board.update(
+        delta_time=0.01,
+        move_directions=[NO_DIRECTION, NO_DIRECTION],
+        shoot_angles=[0, 0],
+        should_shoot=[False, False],
+    )
+
+    np.testing.assert_array_equal(result.lost, [True, False])
+    np.testing.assert_array_equal(batched_board.lost, [True, False])
+    np.testing.assert_array_equal(batched_board.bullet_counts, [0, 1])
+
+
+def test_batched_board_auto_reset():
+    batched_board = BatchedBoard(games_count=2, seed=0)
+    batched_board.player_locations[:] = [[0.05, 0.5], [0.5, 0.5]]
+    batched_board.enemy_locations[:] = 0.8
+    batched_board.enemy_time_to_reload[:] = 1
+    batched_board.scores[:] = [3, 4]
+
+    result = batched_board.update(
+        delta_time=0.1,
+        move_directions=[Direction.LEFT, NO_DIRECTION],
+        shoot_angles=[0, 0],
+        should_shoot=[False, False],
+    )
+
+    np.testing.assert_array_equal(result.lost, [True, False])
+    np.testing.assert_array_equal(result.final_scores, [3, 4])
+    np.testing.assert_array_equal(batched_board.scores, [0, 4])
+    assert not np.any(batched_board.lost)
+    np.testing.assert_array_equal(batched_board.player_locations[1], [0.5, 0.5])
+
+
+def test_batched_board_enemy_touches_player():
+    batched_board = BatchedBoard(games_count=1, auto_reset=False, seed=0)
+    batched_board.player_locations[:] = 0.5
+    batched_board.enemy_locations[:] = 0.55
+
+    batched_board.update(
+        delta_time=0.1,
+        move_directions=[NO_DIRECTION],
+        shoot_angles=[0],
+        should_shoot=[False],
+    )
+
+    np.testing.assert_array_equal(batched_board.lost, [True])
+
+
+def test_batched_board_grow_bullets_capacity():
+    batched_board = BatchedBoard(games_count=2, bullets_capacity=1, seed=0)
+    batched_board.player_locations[:] = 0.5
+    batched_board.enemy_locations[:] = 0.2
+    batched_board.enemy_time_to_reload[:] = 1
+
+    for _ in range(3):
+        batched_board.add_bullets(
+            games=np.array([0]),
+            locations=np.array([[0.5, 0.5]]),
+            angles=np.array([0]),
+            is_player=True,
+        )
+
+    assert batched_board.bullets_capacity == 4
+    np.testing.assert_array_equal(batched_board.bullet_counts, [3, 0])
+    np.testing.assert_array_equal(
+        batched_board.bullet_mask,
+        [[True, True, True, False], [False, False, False, False]],
+    )
+
+
+def test_board_fork():
+    board = Board(seed=0)
+    board.add_bullets(board.player.location[np.newaxis], np.array([0.3]), True)
+    board.score = 2
+
+    batched_board = board.fork(4, seed=0)
+
+    assert batched_board.games_count == 4
+    assert not batched_board.auto_reset
+    for game in range(4):
+        assert_same_state(board, batched_board, game=game)
+        assert batched_board.bullet_counts[game] == 1
+
+
+def test_board_fork_games_are_independent():
+    rng = np.random.default_rng(0)
+    board = Board(seed=0)
+    batched_board = board.fork(3)
+    delta_time = 0.02
+
+    for _ in range(100):
+        direction, angle, should_shoot = random_action(board, rng, delta_time)
+        board.update(
+            delta_time=delta_time,
+            move_direction=direction,
+            shoot_angle_radians=angle,
+            should_shoot=should_shoot,
+        )
+        batched_board.update(
+            delta_time=delta_time,
+            move_directions=[NO_DIRECTION if direction is None else direction]
+            + [NO_DIRECTION] * 2,
+            shoot_angles=[angle, 0, 0],
+            should_shoot=[should_shoot, False, False],
+        )
+        if board.is_lost or board.score != 0:
+            break
+        assert_same_state(board, batched_board, game=0)
+
+    np.testing.assert_array_equal(
+        batched_board.player_locations[1], batched_board.player_locations[2]
+    )
+
+
+def test_board_fork_lost():
+    board = Board(seed=0)
+    board.set_lost()
+
+    assert np.all(board.fork(2).lost)
+
+
+def test_board_fork_multiple_enemies():
+    with pytest.raises(ValueError, match="not 2 enemies"):
+        Board(enemies_count=2).fork(2)
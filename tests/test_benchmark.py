@@ -0,0 +1,104 @@
+import pytest
+
+from shooter.benchmark import (
+    BENCHMARKS,
+    CLI_IMPORT_BUDGET,
+    Regression,
+    compare_results,
+    import_seconds,
+    load_results,
+    make_board_with_bullets,
+    run_benchmarks,
+    save_results,
+    time_function,
+)
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_benchmark_setup(name):
+    function = BENCHMARKS[name]()
+
+    units = function()
+
+    assert units is None or units >= 0
+
+
+def test_board_with_bullets_keeps_bullets():
+    board = make_board_with_bullets(100)
+
+    for _ in range(100):
+        board.update(
+            delta_time=1e-3,
+            move_direction=None,
+            shoot_angle_radians=0,
+            should_shoot=False,
+        )
+
+    assert len(board.bullet_locations) >= 100
+
+
+def test_cli_import_budget():
+    assert import_seconds("shooter.cli") < CLI_IMPORT_BUDGET
+
+
+def test_import_seconds_includes_imported_modules():
+    assert import_seconds("shooter.board") > import_seconds("shooter.constants")
+
+
+def test_time_function_counts_calls():
+    calls = []
+
+    seconds = time_function(lambda: calls.append(1), min_time=0.001, repeats=2)
+
+    assert seconds > 0
+    assert len(calls) >= 2
+
+
+def test_time_function_counts_units():
+    seconds_per_call = time_function(lambda: None, min_time=0.001, repeats=1)
+    seconds_per_unit = time_function(lambda: 1000, min_time=0.001, repeats=1)
+
+    assert seconds_per_unit < seconds_per_call
+
+
+def test_run_benchmarks():
+    results = run_benchmarks(["square_valid"], min_time=0.001, repeats=1)
+
+    assert list(results) == ["square_valid"]
+    assert results["square_valid"] > 0
+
+
+def test_save_and_load_results(tmp_path):
+    path = tmp_path / "results.json"
+    results = {"a": 1.5, "b": 2e-6}
+
+    save_results(results, str(path))
+
+    assert load_results(str(path)) == results
+
+
+def test_compare_results():
+    baseline = {"same": 1.0, "slower": 1.0, "much_slower": 1.0, "faster": 1.0}
+    results = {
+        "same": 1.0,
+        "slower": 1.05,
+        "much_slower": 1.5,
+        "faster": 0.5,
+        "new": 3.0,
+    }
+
+    regressions = compare_results(results, baseline, threshold=0.1)
+
+    assert regressions == [Regression(name="much_slower", baseline=1.0, current=1.5)]
+    assert regressions[0].ratio == 1.5
+
+
+def test_run_all_benchmarks(monkeypatch):
+    monkeypatch.setattr(
+        "shooter.benchmark.BENCHMARKS",
+        {"a": lambda: lambda: None, "b": lambda: lambda: 2},
+    )
+
+    results = run_benchmarks(min_time=0.001, repeats=1)
+
+    assert list(results) == ["a", "b"]
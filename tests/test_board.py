@@ -0,0 +1,668 @@
+from multiprocessing import get_context
+
+import numpy as np
+import pytest
+
+from shooter.board import (
+    BROAD_PHASES,
+    COLLISION_MODES,
+    DISCRETE_COLLISIONS,
+    SWEPT_COLLISIONS,
+    Board,
+    GameStatus,
+)
+from shooter.direction import Direction
+from shooter.geometry import squares_intersecting
+from shooter.instrumentation import BoardStats
+from shooter.shooter_class import Bullet, Shooter
+from shooter.utils import direction_vector
+
+
+def make_board(
+    player_location,
+    enemy_location,
+    broad_phase=BROAD_PHASES[0],
+    collision_mode=DISCRETE_COLLISIONS,
+):
+    board = Board(broad_phase=broad_phase, seed=0, collision_mode=collision_mode)
+    board.player.location = np.array(player_location, dtype=float)
+    board.enemy_locations[0] = enemy_location
+    board.enemy_time_to_reload[0] = board.enemy_reload_time
+    return board
+
+
+def test_board_player_shoot():
+    board = make_board([0.5, 0.5], [0.2, 0.2])
+    angle_radians = np.pi / 3
+    delta_time = 0.1
+
+    board.update(
+        delta_time=delta_time,
+        move_direction=None,
+        shoot_angle_radians=angle_radians,
+        should_shoot=True,
+    )
+
+    np.testing.assert_array_equal(board.bullet_is_player, [True])
+    np.testing.assert_array_almost_equal(
+        board.bullet_velocities, [board.bullet_speed * direction_vector(angle_radians)]
+    )
+    np.testing.assert_array_almost_equal(
+        board.bullet_locations,
+        [0.5 + delta_time * board.bullet_speed * direction_vector(angle_radians)],
+    )
+    assert board.player.time_to_reload == board.player_reload_time
+
+
+def test_board_bullets_view():
+    board = make_board([0.5, 0.5], [0.2, 0.2])
+    angle_radians = np.pi / 3
+    board.add_bullets(np.array([[0.5, 0.5]]), np.array([angle_radians]), is_player=True)
+    board.add_bullets(np.array([[0.2, 0.2]]), np.array([0]), is_player=False)
+
+    bullets = board.bullets
+
+    assert len(bullets) == 2
+    assert all(isinstance(bullet, Bullet) for bullet in bullets)
+    assert bullets[0].shooter_id == board.player.shooter_id
+    assert bullets[1].shooter_id == board.enemy_shooter_id
+    np.testing.assert_array_equal(bullets[0].location, [0.5, 0.5])
+    np.testing.assert_array_equal(bullets[1].location, [0.2, 0.2])
+    np.testing.assert_almost_equal(bullets[0].angle_radians, angle_radians)
+    assert bullets[0].width == board.bullet_width
+    assert bullets[0].speed == board.bullet_speed
+
+    bullets[0].update(1)
+
+    np.testing.assert_array_equal(board.bullet_locations[0], [0.5, 0.5])
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES)
+def test_board_bullet_hits_enemy(broad_phase):
+    board = make_board([0.8, 0.8], [0.2, 0.2], broad_phase=broad_phase)
+    board.add_bullets(board.player.location[np.newaxis], np.array([0]), is_player=True)
+    board.bullet_locations[0] = [0.2, 0.2]
+
+    board.update(
+        delta_time=0.01,
+        move_direction=None,
+        shoot_angle_radians=0,
+        should_shoot=False,
+    )
+
+    assert board.score == board.hit_score
+    assert board.is_playing
+    assert len(board.bullets) == 0
+    assert not board.enemies[0].is_intersecting(board.player)
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES)
+def test_board_bullets_hit_enemy_in_order(broad_phase):
+    board = make_board([0.8, 0.8], [0.2, 0.2], broad_phase=broad_phase)
+    for _ in range(3):
+        board.add_bullets(
+            board.player.location[np.newaxis], np.array([0]), is_player=True
+        )
+    board.bullet_locations[:] = [0.2, 0.2]
+
+    board.update(
+        delta_time=0.01,
+        move_direction=None,
+        shoot_angle_radians=0,
+        should_shoot=False,
+    )
+
+    assert board.score == board.hit_score
+    assert len(board.bullets) == 2
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES)
+def test_board_enemy_bullet_hits_player(broad_phase):
+    board = make_board([0.8, 0.8], [0.2, 0.2], broad_phase=broad_phase)
+    board.add_bullets(board.enemy_locations, np.array([0]), is_player=False)
+    board.bullet_locations[0] = [0.8, 0.8]
+
+    board.update(
+        delta_time=0.01,
+        move_direction=None,
+        shoot_angle_radians=0,
+        should_shoot=False,
+    )
+
+    assert board.is_lost
+    assert len(board.bullets) == 0
+
+
+def test_board_bullet_leaves_screen():
+    board = make_board([0.5, 0.5], [0.2, 0.8])
+    board.add_bullets(board.player.location[np.newaxis], np.array([0]), is_player=True)
+    board.bullet_locations[0] = [0.99, 0.5]
+
+    board.update(
+        delta_time=0.01,
+        move_direction=None,
+        shoot_angle_radians=0,
+        should_shoot=False,
+    )
+
+    assert board.is_playing
+    assert len(board.bullets) == 0
+
+
+@pytest.mark.parametrize("collision_mode", COLLISION_MODES)
+@pytest.mark.parametrize("enemies_count", [1, 20])
+@pytest.mark.parametrize("seed", range(5))
+def test_board_broad_phases_match(seed, enemies_count, collision_mode):
+    boards = []
+    for broad_phase in BROAD_PHASES:
+        rng = np.random.default_rng(seed)
+        board = Board(
+            enemies_count=enemies_count,
+            broad_phase=broad_phase,
+            seed=seed,
+            collision_mode=collision_mode,
+        )
+        board.player.location = np.array([0.3, 0.4])
+        board.enemy_locations[0] = [0.6, 0.5]
+        board.bullet_locations = rng.uniform(-0.05, 1.05, size=(1000, 2))
+        board.bullet_velocities = rng.uniform(-0.1, 0.1, size=(1000, 2))
+        board.bullet_is_player = rng.uniform(size=1000) < 0.5
+        board.update_bullets(
+            delta_time=0.01, enemy_starts=board.enemy_locations + [0.02, -0.01]
+        )
+        boards.append(board)
+
+    brute_force_board, spatial_hash_board = boards
+    assert brute_force_board.score > 0
+    assert brute_force_board.is_lost
+    assert spatial_hash_board.score == brute_force_board.score
+    assert spatial_hash_board.status == brute_force_board.status
+    np.testing.assert_array_equal(
+        spatial_hash_board.enemy_locations, brute_force_board.enemy_locations
+    )
+    np.testing.assert_array_equal(
+        spatial_hash_board.bullet_locations, brute_force_board.bullet_locations
+    )
+    np.testing.assert_array_equal(
+        spatial_hash_board.bullet_is_player, brute_force_board.bullet_is_player
+    )
+
+
+def test_board_multiple_enemies():
+    board = Board(enemies_count=50, seed=0)
+
+    assert board.enemies_count == 50
+    assert board.enemy_locations.shape == (50, 2)
+    np.testing.assert_array_equal(board.enemy_time_to_reload, np.zeros(50))
+    assert not np.any(
+        squares_intersecting(
+            board.enemy_locations,
+            board.shooter_width,
+            board.player.location,
+            board.shooter_width,
+        )
+    )
+
+
+def test_board_enemies_view():
+    board = make_board([0.5, 0.5], [0.2, 0.2])
+
+    (enemy,) = board.enemies
+
+    assert isinstance(enemy, Shooter)
+    assert enemy.shooter_id == board.enemy_shooter_id
+    np.testing.assert_array_equal(enemy.location, [0.2, 0.2])
+    assert enemy.time_to_reload == board.enemy_reload_time
+    assert enemy.speed == board.enemy_speed
+
+
+def test_board_nearest_enemy():
+    board = Board(enemies_count=3)
+    board.player.location = np.array([0.5, 0.5])
+    board.enemy_locations[:] = [[0.1, 0.1], [0.6, 0.7], [0.9, 0.5]]
+
+    assert board.nearest_enemy() == 1
+
+
+def test_board_enemies_move_and_shoot_like_shooters():
+    board = Board(enemies_count=3)
+    board.player.location = np.array([0.5, 0.5])
+    board.enemy_locations[:] = [[0.1, 0.1], [0.5, 0.9], [0.9, 0.3]]
+    board.enemy_time_to_reload[:] = [0, 0.5, 0.01]
+    shooters = board.enemies
+    delta_time = 0.02
+
+    board.update_enemies(delta_time)
+
+    for enemy, shooter in enumerate(shooters):
+        shooter.move_towards(delta_time=delta_time, location=board.player.location)
+        np.testing.assert_array_equal(board.enemy_locations[enemy], shooter.location)
+    np.testing.assert_array_equal(board.enemy_time_to_reload, [1, 0.48, 1])
+    np.testing.assert_array_equal(board.bullet_is_player, [False, False])
+    np.testing.assert_array_equal(board.bullet_locations, board.enemy_locations[[0, 2]])
+    for location, velocity in zip(board.bullet_locations, board.bullet_velocities):
+        direction = board.player.location - location
+        np.testing.assert_array_almost_equal(
+            velocity, board.bullet_speed * direction / np.linalg.norm(direction)
+        )
+    assert board.is_playing
+
+
+def test_board_any_enemy_touches_player():
+    board = Board(enemies_count=3)
+    board.player.location = np.array([0.5, 0.5])
+    board.enemy_locations[:] = [[0.1, 0.1], [0.55, 0.55], [0.9, 0.3]]
+
+    board.update_enemies(delta_time=0.01)
+
+    assert board.is_lost
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES)
+def test_board_bullets_hit_multiple_enemies(broad_phase):
+    board = Board(enemies_count=3, broad_phase=broad_phase, seed=0)
+    board.player.location = np.array([0.5, 0.5])
+    board.enemy_locations[:] = [[0.2, 0.2], [0.8, 0.8], [0.2, 0.8]]
+    board.add_bullets(
+        np.array([[0.8, 0.8], [0.2, 0.2], [0.5, 0.9]]),
+        np.zeros(3),
+        is_player=True,
+    )
+
+    board.update_bullets(delta_time=0)
+
+    assert board.score == 2 * board.hit_score
+    np.testing.assert_array_equal(board.bullet_locations, [[0.5, 0.9]])
+    np.testing.assert_array_equal(board.enemy_locations[2], [0.2, 0.8])
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES)
+def test_board_bullet_hits_only_first_enemy(broad_phase):
+    board = Board(enemies_count=2, broad_phase=broad_phase, seed=0)
+    board.player.location = np.array([0.8, 0.8])
+    board.enemy_locations[:] = [[0.2, 0.2], [0.25, 0.2]]
+    board.add_bullets(np.array([[0.22, 0.2]]), np.zeros(1), is_player=True)
+
+    board.update_bullets(delta_time=0)
+
+    assert board.score == board.hit_score
+    np.testing.assert_array_equal(board.enemy_locations[1], [0.25, 0.2])
+    assert not np.array_equal(board.enemy_locations[0], [0.2, 0.2])
+
+
+def test_board_unknown_broad_phase():
+    with pytest.raises(ValueError, match="Unknown broad phase: foo"):
+        Board(broad_phase="foo")
+
+
+def test_board_unknown_collision_mode():
+    with pytest.raises(ValueError, match="Unknown collision mode: foo"):
+        Board(collision_mode="foo")
+
+
+def update_without_action(board, delta_time):
+    board.update(
+        delta_time=delta_time,
+        move_direction=None,
+        shoot_angle_radians=0,
+        should_shoot=False,
+    )
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES)
+@pytest.mark.parametrize(
+    ["collision_mode", "hit"], [(DISCRETE_COLLISIONS, False), (SWEPT_COLLISIONS, True)]
+)
+def test_board_fast_bullet_passes_enemy(broad_phase, collision_mode, hit):
+    board = make_board(
+        [0.8, 0.8], [0.5, 0.2], broad_phase=broad_phase, collision_mode=collision_mode
+    )
+    board.add_bullets(np.array([[0.2, 0.2]]), np.array([0]), is_player=True)
+    board.bullet_velocities[0] = [10, 0]
+
+    update_without_action(board, delta_time=0.06)
+
+    assert board.score == (board.hit_score if hit else 0)
+    assert len(board.bullets) == (0 if hit else 1)
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES)
+@pytest.mark.parametrize(
+    ["collision_mode", "lost"], [(DISCRETE_COLLISIONS, False), (SWEPT_COLLISIONS, True)]
+)
+def test_board_fast_bullet_passes_player(broad_phase, collision_mode, lost):
+    board = make_board(
+        [0.5, 0.5], [0.2, 0.8], broad_phase=broad_phase, collision_mode=collision_mode
+    )
+    board.add_bullets(np.array([[0.5, 0.1]]), np.array([0]), is_player=False)
+    board.bullet_velocities[0] = [0, 10]
+
+    update_without_action(board, delta_time=0.06)
+
+    assert board.is_lost == lost
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES)
+@pytest.mark.parametrize(
+    ["collision_mode", "hit"], [(DISCRETE_COLLISIONS, False), (SWEPT_COLLISIONS, True)]
+)
+def test_board_enemy_passes_standing_bullet(broad_phase, collision_mode, hit):
+    board = make_board(
+        [0.1, 0.5], [0.9, 0.5], broad_phase=broad_phase, collision_mode=collision_mode
+    )
+    board.add_bullets(np.array([[0.75, 0.5]]), np.array([0]), is_player=True)
+    board.bullet_velocities[0] = 0
+
+    update_without_action(board, delta_time=1)
+
+    assert board.score == (board.hit_score if hit else 0)
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES)
+def test_board_swept_bullets_hit_enemy_in_time_order(broad_phase):
+    board = make_board(
+        [0.8, 0.8], [0.5, 0.2], broad_phase=broad_phase, collision_mode=SWEPT_COLLISIONS
+    )
+    board.add_bullets(np.array([[0.1, 0.2], [0.3, 0.2]]), np.zeros(2), is_player=True)
+    board.bullet_velocities[:] = [5, 0]
+    board.respawn_enemies = lambda enemies: board.enemy_locations.__setitem__(
+        enemies, [0.2, 0.9]
+    )
+
+    update_without_action(board, delta_time=0.05)
+
+    assert board.score == board.hit_score
+    # The bullet shot later hits first, so the other one passes on.
+    np.testing.assert_allclose(board.bullet_locations, [[0.35, 0.2]])
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES)
+def test_board_swept_bullet_hits_respawned_enemy(broad_phase):
+    board = make_board(
+        [0.8, 0.8], [0.5, 0.2], broad_phase=broad_phase, collision_mode=SWEPT_COLLISIONS
+    )
+    board.add_bullets(np.array([[0.3, 0.2], [0.2, 0.5]]), np.zeros(2), is_player=True)
+    board.bullet_velocities[:] = [5, 0]
+    respawn_locations = iter([[0.6, 0.5], [0.2, 0.9]])
+    board.respawn_enemies = lambda enemies: board.enemy_locations.__setitem__(
+        enemies, next(respawn_locations)
+    )
+
+    update_without_action(board, delta_time=0.1)
+
+    assert board.score == 2 * board.hit_score
+    assert len(board.bullets) == 0
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES)
+def test_board_swept_bullet_misses_enemy_respawned_after_it_passed(broad_phase):
+    board = make_board(
+        [0.8, 0.8], [0.5, 0.2], broad_phase=broad_phase, collision_mode=SWEPT_COLLISIONS
+    )
+    board.add_bullets(np.array([[0.3, 0.2], [0.2, 0.5]]), np.zeros(2), is_player=True)
+    board.bullet_velocities[:] = [5, 0]
+    # The second bullet started at this location, and passed it before the first
+    # bullet hit.
+    board.respawn_enemies = lambda enemies: board.enemy_locations.__setitem__(
+        enemies, [0.2, 0.5]
+    )
+
+    update_without_action(board, delta_time=0.1)
+
+    assert board.score == board.hit_score
+    assert len(board.bullets) == 1
+
+
+def test_board_swept_without_time():
+    board = make_board([0.8, 0.8], [0.2, 0.2], collision_mode=SWEPT_COLLISIONS)
+    board.add_bullets(np.array([[0.25, 0.2]]), np.zeros(1), is_player=True)
+
+    board.update_bullets(delta_time=0)
+
+    assert board.score == board.hit_score
+
+
+def step_until(board, max_time, move_direction, should_shoot, delta_time=1e-3):
+    elapsed_time = 0.0
+    while board.is_playing and elapsed_time < max_time - delta_time / 2:
+        board.update(
+            delta_time=delta_time,
+            move_direction=move_direction,
+            shoot_angle_radians=0.3,
+            should_shoot=should_shoot,
+        )
+        elapsed_time += delta_time
+    return elapsed_time
+
+
+@pytest.mark.parametrize("should_shoot", [False, True])
+@pytest.mark.parametrize(
+    ["move_direction", "tolerance"], [(None, 1e-3), (Direction.LEFT, 2e-2)]
+)
+@pytest.mark.parametrize("seed", range(3))
+def test_board_advance_until_like_update(seed, move_direction, tolerance, should_shoot):
+    board = Board(seed=seed)
+    stepped_board = Board(seed=seed)
+
+    elapsed_time = board.advance_until(
+        2, move_direction, shoot_angle_radians=0.3, should_shoot=should_shoot
+    )
+    stepped_time = step_until(stepped_board, 2, move_direction, should_shoot)
+
+    assert board.status == stepped_board.status
+    assert board.score == stepped_board.score
+    assert elapsed_time == pytest.approx(stepped_time, abs=tolerance)
+    np.testing.assert_allclose(
+        board.player.location, stepped_board.player.location, atol=tolerance
+    )
+    np.testing.assert_allclose(
+        board.enemy_locations, stepped_board.enemy_locations, atol=tolerance
+    )
+    assert len(board.bullets) == len(stepped_board.bullets)
+
+
+def test_board_advance_until_jumps_between_events():
+    stats = BoardStats()
+    board = make_board([0.5, 0.5], [0.9, 0.9])
+    board.stats = stats
+    board.enemy_time_to_reload[0] = 0.5
+
+    elapsed_time = board.advance_until(
+        1, move_direction=None, shoot_angle_radians=0, should_shoot=False
+    )
+
+    assert elapsed_time == 1
+    assert board.is_playing
+    # Jump to the enemy reload, and then to the end.
+    assert stats.counters["advance_steps"] == 2
+    assert len(board.bullets) == 1
+    assert board.enemy_time_to_reload[0] == pytest.approx(0.5)
+
+
+def test_board_advance_until_bullet_hits_enemy():
+    board = make_board([0.5, 0.5], [0.9, 0.5], collision_mode=SWEPT_COLLISIONS)
+    board.enemy_time_to_reload[0] = 10
+    stepped_board = make_board([0.5, 0.5], [0.9, 0.5])
+    stepped_board.enemy_time_to_reload[0] = 10
+
+    board.advance_until(
+        1.5, move_direction=None, shoot_angle_radians=0, should_shoot=True
+    )
+    step_until(stepped_board, 1.5, move_direction=None, should_shoot=True)
+
+    assert board.score == stepped_board.score == board.hit_score
+    # Enemies respawn at the same locations, since the player stands still.
+    np.testing.assert_allclose(
+        board.enemy_locations, stepped_board.enemy_locations, atol=1e-3
+    )
+
+
+def test_board_advance_until_player_leaves_screen():
+    board = make_board([0.1, 0.5], [0.9, 0.5])
+
+    elapsed_time = board.advance_until(
+        1, move_direction=Direction.LEFT, shoot_angle_radians=0, should_shoot=False
+    )
+
+    assert board.is_lost
+    assert elapsed_time == pytest.approx(0.1, abs=1e-4)
+
+
+def test_board_advance_until_lost_board():
+    board = Board(seed=0)
+    board.set_lost()
+
+    assert board.advance_until(1, None, shoot_angle_radians=0, should_shoot=True) == 0
+
+
+def test_board_enemies_without_shooting():
+    board = make_board([0.5, 0.5], [0.9, 0.9])
+    board.enemy_time_to_reload[0] = 0
+
+    board.update_enemies(0.1, should_shoot=False)
+
+    assert len(board.bullets) == 0
+    assert board.enemy_time_to_reload[0] == 0
+
+
+def test_board_reset():
+    board = make_board([0.5, 0.5], [0.2, 0.2])
+    board.add_bullets(board.player.location[np.newaxis], np.array([0]), is_player=True)
+    board.score = 3
+    board.set_lost()
+
+    board.reset()
+
+    assert board.is_playing
+    assert board.score == 0
+    assert len(board.bullets) == 0
+    assert board.bullet_locations.shape == (0, 2)
+
+
+def play_seeded_game(seed, steps=200):
+    board = Board(enemies_count=5, seed=seed)
+    rng = np.random.default_rng(seed)
+    for _ in range(steps):
+        board.update(
+            delta_time=0.05,
+            move_direction=rng.choice([None, *Direction]),
+            shoot_angle_radians=rng.uniform(-np.pi, np.pi),
+            should_shoot=True,
+        )
+        if board.is_lost:
+            board.reset()
+    return board.player.location, board.enemy_locations, board.bullet_locations
+
+
+def test_board_seed_is_reproducible():
+    for array1, array2 in zip(play_seeded_game(3), play_seeded_game(3)):
+        np.testing.assert_array_equal(array1, array2)
+
+
+def test_board_seed_is_reproducible_in_other_process():
+    with get_context("spawn").Pool(1) as pool:
+        other_process_arrays = pool.apply(play_seeded_game, (3,))
+
+    for array1, array2 in zip(play_seeded_game(3), other_process_arrays):
+        np.testing.assert_array_equal(array1, array2)
+
+
+def test_board_reset_with_seed():
+    board = Board(enemies_count=5, seed=7)
+    player_location = board.player.location.copy()
+    enemy_locations = board.enemy_locations.copy()
+    board.update(
+        delta_time=0.1, move_direction=None, shoot_angle_radians=0, should_shoot=True
+    )
+
+    board.reset(seed=7)
+
+    np.testing.assert_array_equal(board.player.location, player_location)
+    np.testing.assert_array_equal(board.enemy_locations, enemy_locations)
+    np.testing.assert_array_equal(board.enemy_time_to_reload, np.zeros(5))
+
+
+def play_random_steps(board, rng, steps):
+    for _ in range(steps):
+        board.update(
+            delta_time=0.05,
+            move_direction=rng.choice([None, *Direction]),
+            shoot_angle_radians=rng.uniform(-np.pi, np.pi),
+            should_shoot=True,
+        )
+        if board.is_lost:
+            break
+
+
+def test_board_snapshot_restore():
+    board = Board(enemies_count=3, seed=0)
+    play_random_steps(board, np.random.default_rng(0), steps=20)
+    snapshot = board.snapshot()
+    other_board = Board(enemies_count=5, seed=1)
+
+    other_board.restore(snapshot)
+
+    assert other_board.snapshot() == snapshot
+    assert other_board.enemies_count == 3
+    np.testing.assert_array_equal(other_board.player.location, board.player.location)
+    np.testing.assert_array_equal(other_board.bullet_locations, board.bullet_locations)
+    np.testing.assert_array_equal(other_board.bullet_is_player, board.bullet_is_player)
+    assert other_board.bullet_is_player.dtype == bool
+    assert other_board.player.time_to_reload == board.player.time_to_reload
+    assert other_board.score == board.score
+
+
+def test_board_restore_lost():
+    board = Board(seed=0)
+    board.score = 4
+    board.set_lost()
+    snapshot = board.snapshot()
+    board.reset()
+
+    board.restore(snapshot)
+
+    assert board.status == GameStatus.LOST
+    assert board.score == 4
+
+
+def test_board_snapshot_is_hashable():
+    board = Board(enemies_count=2, seed=0)
+    snapshot = board.snapshot()
+    board.update(
+        delta_time=0.05, move_direction=None, shoot_angle_radians=0, should_shoot=True
+    )
+
+    transpositions = {snapshot: 1, board.snapshot(): 2}
+    board.restore(snapshot)
+
+    assert transpositions[board.snapshot()] == 1
+
+
+def test_board_restore_then_update_like_original():
+    board = Board(enemies_count=3, seed=0)
+    play_random_steps(board, np.random.default_rng(0), steps=5)
+    snapshot = board.snapshot()
+    board.rng = np.random.default_rng(1)
+    play_random_steps(board, np.random.default_rng(2), steps=30)
+    expected_snapshot = board.snapshot()
+
+    board.restore(snapshot)
+    board.rng = np.random.default_rng(1)
+    play_random_steps(board, np.random.default_rng(2), steps=30)
+
+    assert board.snapshot() == expected_snapshot
+
+
+def test_board_restore_does_not_share_arrays():
+    board = Board(seed=0)
+    board.add_bullets(board.player.location[np.newaxis], np.array([0]), is_player=True)
+    snapshot = board.snapshot()
+
+    board.restore(snapshot)
+    board.player.time_to_reload += 1
+    board.bullet_locations += 0.1
+    board.enemy_time_to_reload += 1
+
+    assert board.snapshot() != snapshot
+    board.restore(snapshot)
+    assert board.snapshot() == snapshot
@@ -0,0 +1,153 @@
+import gym
+import numpy as np
+
+from shooter.direction import Direction
+from shooter.env import (
+    ENV_ID,
+    NO_MOVE_ACTION,
+    ShooterEnv,
+    ShooterVectorEnv,
+    register_envs,
+)
+from shooter.observation import observation_size
+
+
+def test_env_reset():
+    env = ShooterEnv(observed_bullets=4)
+
+    observation = env.reset(seed=0)
+
+    assert observation.shape == (observation_size(4),)
+    assert env.observation_space.contains(observation)
+
+
+def test_env_reset_with_info():
+    env = ShooterEnv()
+
+    observation, info = env.reset(return_info=True)
+
+    assert env.observation_space.contains(observation)
+    assert info == {}
+
+
+def test_env_step():
+    env = ShooterEnv(delta_time=0.1)
+    env.reset()
+    env.board.player.location = np.array([0.5, 0.5])
+    env.board.enemy_locations[0] = [0.2, 0.2]
+    env.board.enemy_time_to_reload[0] = 1
+
+    observation, reward, done, info = env.step(
+        (Direction.RIGHT.value, np.array([0.0], dtype=np.float32), 1)
+    )
+
+    assert env.observation_space.contains(observation)
+    assert reward == 0
+    assert not done
+    assert info == {"score": 0}
+    np.testing.assert_array_almost_equal(
+        env.board.player.location, [0.5 + 0.1 * env.board.player_speed, 0.5]
+    )
+    assert len(env.board.bullets) == 1
+
+
+def test_env_step_reward_and_done():
+    env = ShooterEnv()
+    env.reset()
+    env.board.player.location = np.array([0.8, 0.8])
+    env.board.enemy_locations[0] = [0.2, 0.2]
+    env.board.enemy_time_to_reload[0] = 1
+    env.board.add_bullets(
+        env.board.player.location[np.newaxis], np.array([0]), is_player=True
+    )
+    env.board.bullet_locations[0] = [0.2, 0.2]
+
+    _, reward, done, info = env.step(
+        (NO_MOVE_ACTION, np.array([0.0], dtype=np.float32), 0)
+    )
+
+    assert reward == env.board.hit_score
+    assert not done
+    assert info == {"score": env.board.hit_score}
+
+    env.board.player.location = np.array([0.01, 0.5])
+    _, reward, done, _ = env.step(
+        (NO_MOVE_ACTION, np.array([0.0], dtype=np.float32), 0)
+    )
+
+    assert reward == 0
+    assert done
+
+
+def test_register_envs():
+    register_envs()
+    register_envs()
+
+    env = gym.make(ENV_ID)
+
+    assert env.spec.id == ENV_ID
+    assert env.observation_space.contains(env.reset())
+
+
+def test_vector_env_reset():
+    env = ShooterVectorEnv(num_envs=4, observed_bullets=2)
+
+    observations = env.reset(seed=1)
+
+    assert observations.shape == (4, observation_size(2))
+    assert env.observation_space.contains(observations)
+    np.testing.assert_array_equal(
+        observations, ShooterVectorEnv(num_envs=4, observed_bullets=2).reset(seed=1)
+    )
+
+
+def test_vector_env_reset_with_info():
+    env = ShooterVectorEnv(num_envs=4)
+
+    observations, info = env.reset(return_info=True)
+
+    assert env.observation_space.contains(observations)
+    assert info == {}
+
+
+def test_vector_env_step():
+    env = ShooterVectorEnv(num_envs=8, seed=0)
+    env.reset()
+    env.action_space.seed(0)
+
+    for _ in range(20):
+        observations, rewards, dones, infos = env.step(env.action_space.sample())
+
+        assert env.observation_space.contains(observations)
+        assert rewards.shape == (8,)
+        assert dones.shape == (8,)
+        assert isinstance(infos, dict)
+
+
+def test_vector_env_auto_reset():
+    env = ShooterVectorEnv(num_envs=2, seed=0)
+    env.reset()
+    env.board.player_locations[:] = [[0.01, 0.5], [0.5, 0.5]]
+    env.board.enemy_locations[:] = 0.8
+    env.board.enemy_time_to_reload[:] = 1
+    env.board.scores[:] = [2, 0]
+
+    observations, rewards, dones, infos = env.step(
+        (
+            np.array([NO_MOVE_ACTION, Direction.UP]),
+            np.zeros((2, 1), dtype=np.float32),
+            np.zeros(2),
+        )
+    )
+
+    np.testing.assert_array_equal(rewards, [0, 0])
+    np.testing.assert_array_equal(dones, [True, False])
+    np.testing.assert_array_equal(infos["_final_observation"], [True, False])
+    np.testing.assert_array_almost_equal(infos["final_observation"][0][:2], [0.01, 0.5])
+    assert infos["final_observation"][1] is None
+    np.testing.assert_array_equal(infos["final_score"], [2, 0])
+    np.testing.assert_array_almost_equal(
+        observations[:, :2], env.board.player_locations
+    )
+    assert not np.any(env.board.lost)
+    assert env.board.scores[0] == 0
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from shooter.board import Board
+from shooter.game_loop import (
+    FixedTimestep,
+    board_positions,
+    interpolate_locations,
+    interpolate_positions,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+
+def test_fixed_timestep_ticks():
+    clock = FakeClock()
+    timestep = FixedTimestep(tick_rate=10, clock=clock)
+
+    ticks = []
+    for delta_time in [0.05, 0.1, 0.12, 0.3, 0.01]:
+        clock.time += delta_time
+        ticks.append(timestep.advance())
+
+    assert ticks == [0, 1, 1, 3, 0]
+    assert timestep.alpha == pytest.approx(0.8)
+    assert timestep.dropped_time == 0
+
+
+def test_fixed_timestep_caps_catch_up():
+    clock = FakeClock()
+    timestep = FixedTimestep(tick_rate=10, max_ticks_per_frame=3, clock=clock)
+
+    clock.time += 1.25
+    ticks = timestep.advance()
+
+    assert ticks == 3
+    assert timestep.dropped_time == pytest.approx(0.9)
+    assert timestep.alpha == pytest.approx(0.5)
+
+
+def test_fixed_timestep_restart():
+    clock = FakeClock()
+    timestep = FixedTimestep(tick_rate=10, clock=clock)
+    clock.time += 0.05
+    timestep.advance()
+
+    clock.time += 10
+    timestep.restart()
+    clock.time += 0.02
+
+    assert timestep.advance() == 0
+    assert timestep.alpha == pytest.approx(0.2)
+
+
+def test_fixed_timestep_tick_duration():
+    assert FixedTimestep(tick_rate=50).tick_duration == pytest.approx(0.02)
+
+
+def test_interpolate_locations():
+    interpolated = interpolate_locations(
+        previous=np.array([[0.1, 0.1], [0.5, 0.5]]),
+        current=np.array([[0.2, 0.1], [0.9, 0.1]]),
+        alpha=0.25,
+        max_distance=0.2,
+    )
+
+    np.testing.assert_array_almost_equal(interpolated, [[0.125, 0.1], [0.9, 0.1]])
+
+
+def test_interpolate_positions_between_ticks():
+    board = Board(enemies_count=3, seed=0)
+    board.enemy_time_to_reload[:] = 1
+    board.add_bullets(board.player.location[np.newaxis], np.array([1]), True)
+    tick_duration = 0.01
+    previous = board_positions(board)
+    board.update(
+        delta_time=tick_duration,
+        move_direction=None,
+        shoot_angle_radians=0,
+        should_shoot=False,
+    )
+    current = board_positions(board)
+
+    for alpha in [0, 0.3, 1]:
+        positions = interpolate_positions(previous, board, alpha, tick_duration)
+
+        for name in ["player_location", "enemy_locations", "bullet_locations"]:
+            np.testing.assert_array_almost_equal(
+                getattr(positions, name),
+                (1 - alpha) * getattr(previous, name) + alpha * getattr(current, name),
+            )
+        np.testing.assert_array_equal(
+            positions.bullet_is_player, current.bullet_is_player
+        )
+
+
+def test_interpolate_positions_of_respawned_enemy():
+    board = Board(enemies_count=2, seed=0)
+    previous = board_positions(board)
+    board.respawn_enemies(np.array([1]))
+
+    positions = interpolate_positions(previous, board, alpha=0.5, tick_duration=0.01)
+
+    np.testing.assert_array_equal(positions.enemy_locations, board.enemy_locations)
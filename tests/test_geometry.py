@@ -0,0 +1,174 @@
+import numpy as np
+import pytest
+
+from shooter.geometry import (
+    move_towards,
+    squares_in_screen,
+    squares_intersecting,
+    swept_squares_hit_times,
+)
+from shooter.shooter_class import Shooter
+from shooter.square import Square
+from shooter.utils import random_location
+
+
+def test_squares_intersecting_like_square():
+    locations1 = np.random.uniform(size=(100, 2))
+    locations2 = np.random.uniform(size=(100, 2))
+    width1, width2 = 0.2, 0.3
+
+    intersecting = squares_intersecting(locations1, width1, locations2, width2)
+
+    assert intersecting.shape == (100,)
+    for location1, location2, is_intersecting in zip(
+        locations1, locations2, intersecting
+    ):
+        square1 = Square(location=location1, width=width1)
+        square2 = Square(location=location2, width=width2)
+        assert is_intersecting == square1.is_intersecting(square2)
+
+
+def test_squares_intersecting_broadcast():
+    locations1 = np.random.uniform(size=(3, 5, 2))
+    locations2 = random_location()
+
+    intersecting = squares_intersecting(locations1, 0.1, locations2, 0.1)
+
+    assert intersecting.shape == (3, 5)
+
+
+def test_squares_intersecting_touching():
+    assert squares_intersecting(np.array([0.5, 0.5]), 0.2, np.array([0.7, 0.5]), 0.2)
+
+
+def test_squares_in_screen_like_square():
+    locations = np.random.uniform(-0.1, 1.1, size=(100, 2))
+    width = 0.2
+
+    in_screen = squares_in_screen(locations, width)
+
+    for location, is_in_screen in zip(locations, in_screen):
+        assert is_in_screen == Square(location=location, width=width).valid
+
+
+@pytest.mark.parametrize(
+    "location",
+    [[0.04, 0.5], [0.96, 0.5], [0.5, 0.04], [0.5, 0.96], [-1, -1], [2, 2]],
+)
+def test_squares_not_in_screen(location):
+    assert not squares_in_screen(np.array(location), 0.1)
+
+
+def test_move_towards_like_shooter():
+    locations = np.random.uniform(size=(100, 2))
+    targets = np.random.uniform(size=(100, 2))
+    targets[0] = locations[0]
+    shooters = [
+        Shooter(
+            location=location,
+            width=0.1,
+            speed=1,
+            bullet_width=0.05,
+            bullet_speed=1,
+            reload_time=1,
+        )
+        for location in locations
+    ]
+
+    moved = move_towards(locations, targets, max_distance=0.2)
+
+    assert moved is locations
+    for shooter, location, target in zip(shooters, moved, targets):
+        shooter.move_towards(delta_time=0.2, location=target)
+        np.testing.assert_array_almost_equal(location, shooter.location)
+
+
+def test_swept_squares_hit_times_standing():
+    hit_times = swept_squares_hit_times(
+        np.array([[0.5, 0.5], [0.5, 0.5]]),
+        np.zeros(2),
+        0.1,
+        np.array([[0.55, 0.5], [0.7, 0.5]]),
+        np.zeros(2),
+        0.1,
+        duration=1,
+    )
+
+    np.testing.assert_array_equal(hit_times, [0, np.inf])
+
+
+def test_swept_squares_hit_times_passing_over():
+    location1, velocity1 = np.array([0.1, 0.5]), np.array([1.0, 0])
+    location2, velocity2 = np.array([0.5, 0.52]), np.array([0, -0.1])
+
+    hit_time = swept_squares_hit_times(
+        location1, velocity1, 0.1, location2, velocity2, 0.1, duration=1
+    )
+
+    # The squares don't touch at the start nor at the end.
+    assert not squares_intersecting(location1, 0.1, location2, 0.1)
+    assert not squares_intersecting(
+        location1 + velocity1, 0.1, location2 + velocity2, 0.1
+    )
+    assert hit_time == pytest.approx(0.3)
+
+
+def test_swept_squares_hit_times_after_duration():
+    hit_time = swept_squares_hit_times(
+        np.array([0.1, 0.5]), np.array([1.0, 0]), 0.1, np.array([0.5, 0.5]), 0, 0.1, 0.2
+    )
+
+    assert hit_time == np.inf
+
+
+def test_swept_squares_hit_times_broadcast():
+    hit_times = swept_squares_hit_times(
+        np.random.uniform(size=(3, 1, 2)),
+        np.random.uniform(size=(3, 1, 2)),
+        0.1,
+        np.random.uniform(size=(5, 2)),
+        0,
+        0.1,
+        duration=1,
+    )
+
+    assert hit_times.shape == (3, 5)
+
+
+def test_swept_squares_hit_times_like_intersecting():
+    rng = np.random.default_rng(0)
+    locations1, locations2 = rng.uniform(size=(2, 1000, 2))
+    velocities1, velocities2 = rng.uniform(-1, 1, size=(2, 1000, 2))
+    duration = 0.2
+
+    hit_times = swept_squares_hit_times(
+        locations1, velocities1, 0.05, locations2, velocities2, 0.1, duration
+    )
+
+    hitting = np.isfinite(hit_times)
+    assert np.all(hit_times[hitting] <= duration)
+    # Squares touching at the end or at the start hit, and those that hit touch
+    # at their hit times.
+    assert np.all(
+        hitting[
+            squares_intersecting(
+                locations1 + duration * velocities1,
+                0.05,
+                locations2 + duration * velocities2,
+                0.1,
+            )
+        ]
+    )
+    np.testing.assert_array_equal(
+        hit_times == 0, squares_intersecting(locations1, 0.05, locations2, 0.1)
+    )
+    times = hit_times[hitting, np.newaxis]
+    assert np.all(
+        squares_intersecting(
+            locations1[hitting] + times * velocities1[hitting],
+            0.05 + 1e-9,
+            locations2[hitting] + times * velocities2[hitting],
+            0.1,
+        )
+    )
+    assert 0 < hitting.mean() < 1
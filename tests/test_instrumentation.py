@@ -0,0 +1,155 @@
+import math
+
+import numpy as np
+import pytest
+
+from shooter.board import SPATIAL_HASH_BROAD_PHASE, Board
+from shooter.instrumentation import (
+    HISTOGRAM_BUCKETS,
+    BoardStats,
+    PhaseTiming,
+    bucket_index,
+    bucket_upper_bound,
+)
+
+UPDATE_PHASES = [
+    "update_player",
+    "update_enemies",
+    "respawn_loop",
+    "update_bullets",
+    "update",
+]
+
+
+@pytest.mark.parametrize(
+    ["seconds", "index"],
+    [(0, 0), (1.5e-6, 0), (2e-6, 1), (5e-6, 2), (1e-3, 9), (1, 19), (100, 20)],
+)
+def test_bucket_index(seconds, index):
+    assert bucket_index(seconds) == index
+
+
+def test_bucket_upper_bound():
+    assert bucket_upper_bound(0) == pytest.approx(2e-6)
+    assert bucket_upper_bound(9) == pytest.approx(1.024e-3)
+    assert bucket_upper_bound(HISTOGRAM_BUCKETS - 1) == math.inf
+
+
+def test_phase_timing():
+    timing = PhaseTiming()
+    for seconds in [1e-6, 3e-6, 3e-6, 5e-3]:
+        timing.add(seconds)
+
+    assert timing.calls == 4
+    assert timing.total_seconds == pytest.approx(5.007e-3)
+    assert timing.mean_seconds == pytest.approx(5.007e-3 / 4)
+    assert timing.max_seconds == 5e-3
+    assert sum(timing.histogram) == 4
+    assert timing.percentile_seconds(50) == pytest.approx(4e-6)
+    assert timing.percentile_seconds(100) == pytest.approx(5e-3)
+
+
+def test_empty_phase_timing():
+    timing = PhaseTiming()
+
+    assert timing.mean_seconds == 0
+    assert timing.percentile_seconds(50) == 0
+
+
+def test_phase_timing_merge():
+    timing, other = PhaseTiming(), PhaseTiming()
+    timing.add(1e-6)
+    other.add(1e-3)
+    other.add(2e-3)
+
+    timing.merge(other)
+
+    assert timing.calls == 3
+    assert timing.total_seconds == pytest.approx(3.001e-3)
+    assert timing.max_seconds == 2e-3
+    assert sum(timing.histogram) == 3
+
+
+def test_board_stats_merge():
+    stats, other = BoardStats(), BoardStats()
+    stats.add_time("a", 1e-3)
+    stats.count("x")
+    other.add_time("a", 2e-3)
+    other.add_time("b", 3e-3)
+    other.count("x", 2)
+    other.count("y", 5)
+
+    stats.merge(other)
+
+    assert stats.phases["a"].calls == 2
+    assert stats.phases["b"].calls == 1
+    assert stats.counters == {"x": 3, "y": 5}
+
+
+def test_board_stats_lap():
+    stats = BoardStats()
+
+    now_time = stats.lap("phase", 0.0)
+
+    assert stats.phases["phase"].total_seconds == pytest.approx(now_time)
+
+
+def test_board_stats_report():
+    stats = BoardStats()
+    stats.add_time("update", 1e-3)
+    stats.count("bullets_processed", 10)
+
+    lines = stats.report().splitlines()
+
+    assert lines[0].split()[0] == "Phase"
+    assert lines[1].split()[:2] == ["update", "1"]
+    assert lines[3].split() == ["Counter", "Count"]
+    assert lines[4].split() == ["bullets_processed", "10"]
+
+
+def test_board_stats_report_without_counters():
+    stats = BoardStats()
+    stats.add_time("update", 1e-3)
+
+    assert len(stats.report().splitlines()) == 2
+
+
+@pytest.mark.parametrize("broad_phase", ["brute_force", SPATIAL_HASH_BROAD_PHASE])
+def test_board_update_stats(broad_phase):
+    stats = BoardStats()
+    board = Board(enemies_count=2, broad_phase=broad_phase, seed=0, stats=stats)
+    board.player.location = np.array([0.1, 0.1])
+    board.enemy_locations = np.array([[0.5, 0.5], [0.8, 0.8]])
+    board.enemy_time_to_reload[:] = 1
+    board.add_bullets(np.array([[0.5, 0.5], [0.9, 0.9]]), np.zeros(2), is_player=True)
+
+    for _ in range(3):
+        board.update(
+            delta_time=1e-3,
+            move_direction=None,
+            shoot_angle_radians=0,
+            should_shoot=False,
+        )
+
+    assert list(stats.phases) == UPDATE_PHASES
+    for phase in UPDATE_PHASES:
+        assert stats.phases[phase].calls == 3
+    assert stats.phases["update"].total_seconds >= (
+        stats.phases["update_bullets"].total_seconds
+    )
+    assert stats.counters["enemy_hits"] == 1
+    # Both enemies were spawned when the board was created.
+    assert stats.counters["spawns"] == 2 + 1
+    assert stats.counters["spawn_candidates"] >= board.spawn_candidates
+    assert stats.counters["bullets_processed"] == 2 + 1 + 1
+    assert stats.counters["collision_tests"] > 0
+
+
+def test_board_without_stats():
+    board = Board()
+
+    board.update(
+        delta_time=1e-3, move_direction=None, shoot_angle_radians=0, should_shoot=False
+    )
+
+    assert board.stats is None
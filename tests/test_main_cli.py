@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from shooter.cli import shooter_cli
+from shooter.cli.main_cli import LAZY_COMMANDS, load_command
+
+HEAVY_MODULES = ["pygame", "tensorflow", "shooter.benchmark", "shooter.simulation"]
+
+
+def imported_modules(code):
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import shooter.board",
+        "from shooter.cli import shooter_cli\n"
+        "try:\n    shooter_cli(['--help'])\nexcept SystemExit:\n    pass",
+    ],
+)
+def test_startup_does_not_import_heavy_modules(code):
+    modules = imported_modules(code)
+
+    assert "shooter" in modules
+    assert modules.isdisjoint(HEAVY_MODULES)
+
+
+@pytest.mark.parametrize("name", list(LAZY_COMMANDS))
+def test_lazy_command(name):
+    command = load_command(LAZY_COMMANDS[name].import_path)
+
+    assert command.name == name
+    assert command.get_short_help_str(limit=1000) == LAZY_COMMANDS[name].short_help
+
+
+def test_help_lists_commands():
+    result = CliRunner().invoke(shooter_cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name, command in LAZY_COMMANDS.items():
+        assert f"{name}  " in result.output
+        assert command.short_help in result.output
+
+
+def test_lazy_command_runs():
+    result = CliRunner().invoke(shooter_cli, ["replay", "--help"])
+
+    assert result.exit_code == 0
+    assert "REPLAY_FILE" in result.output
+
+
+def test_unknown_command():
+    result = CliRunner().invoke(shooter_cli, ["foo"])
+
+    assert result.exit_code != 0
+    assert "No such command 'foo'" in result.output
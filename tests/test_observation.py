@@ -0,0 +1,77 @@
+import numpy as np
+
+from shooter.batched_board import BatchedBoard
+from shooter.board import Board
+from shooter.observation import (
+    BULLET_FEATURES,
+    STATE_FEATURES,
+    batched_board_observations,
+    board_observation,
+    observation_size,
+)
+
+
+def test_observation_size():
+    assert observation_size(0) == STATE_FEATURES
+    assert observation_size(3) == STATE_FEATURES + 3 * BULLET_FEATURES
+
+
+def test_board_observation():
+    board = Board()
+    board.player.time_to_reload = 0.25
+    board.enemy_time_to_reload[0] = 0.5
+    board.add_bullets(board.player.location[np.newaxis], np.array([0]), is_player=True)
+    board.add_bullets(board.enemy_locations, np.array([np.pi / 2]), is_player=False)
+
+    observation = board_observation(board, observed_bullets=3)
+
+    assert observation.shape == (observation_size(3),)
+    assert observation.dtype == np.float32
+    np.testing.assert_array_almost_equal(observation[0:2], board.player.location)
+    np.testing.assert_array_almost_equal(observation[2:4], board.enemy_locations[0])
+    np.testing.assert_array_almost_equal(observation[4:6], [0.25, 0.5])
+    bullets = observation[STATE_FEATURES:].reshape(3, BULLET_FEATURES)
+    np.testing.assert_array_equal(bullets[:, 0], [1, 1, 0])
+    np.testing.assert_array_equal(bullets[:, 1], [1, 0, 0])
+    np.testing.assert_array_almost_equal(bullets[:2, 2:4], board.bullet_locations)
+    np.testing.assert_array_almost_equal(bullets[:2, 4:6], board.bullet_velocities)
+    np.testing.assert_array_equal(bullets[2], 0)
+
+
+def test_board_observation_with_more_bullets_than_observed():
+    board = Board()
+    for _ in range(3):
+        board.add_bullets(
+            board.player.location[np.newaxis], np.array([0]), is_player=True
+        )
+
+    observation = board_observation(board, observed_bullets=2)
+
+    bullets = observation[STATE_FEATURES:].reshape(2, BULLET_FEATURES)
+    np.testing.assert_array_equal(bullets[:, 0], [1, 1])
+
+
+def test_batched_board_observations():
+    batched_board = BatchedBoard(games_count=3, bullets_capacity=2, seed=0)
+    batched_board.add_bullets(
+        games=np.array([1]),
+        locations=np.array([[0.5, 0.5]]),
+        angles=np.array([0]),
+        is_player=False,
+    )
+
+    observations = batched_board_observations(batched_board, observed_bullets=4)
+
+    assert observations.shape == (3, observation_size(4))
+    np.testing.assert_array_almost_equal(
+        observations[:, 0:2], batched_board.player_locations
+    )
+    np.testing.assert_array_almost_equal(
+        observations[:, 2:4], batched_board.enemy_locations
+    )
+    bullets = observations[:, STATE_FEATURES:].reshape(3, 4, BULLET_FEATURES)
+    np.testing.assert_array_equal(bullets[:, :, 0], [[0] * 4, [1, 0, 0, 0], [0] * 4])
+    np.testing.assert_array_almost_equal(
+        bullets[1, 0, 2:], [0.5, 0.5, batched_board.bullet_speed, 0]
+    )
+    np.testing.assert_array_equal(bullets[[0, 2]], 0)
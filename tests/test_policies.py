@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from shooter.batched_board import NO_DIRECTION
+from shooter.direction import Direction
+from shooter.policies import POLICIES, random_policy, scripted_policy
+
+
+@pytest.mark.parametrize("policy", list(POLICIES.values()))
+def test_policy_shapes(policy):
+    rng = np.random.default_rng(0)
+    player_locations = rng.uniform(size=(10, 2))
+    enemy_locations = rng.uniform(size=(10, 2))
+
+    actions = policy(player_locations, enemy_locations, rng)
+
+    assert actions.move_directions.shape == (10,)
+    assert actions.shoot_angles.shape == (10,)
+    assert actions.should_shoot.shape == (10,)
+    assert actions.should_shoot.dtype == bool
+    assert np.all(actions.move_directions >= NO_DIRECTION)
+    assert np.all(actions.move_directions < len(Direction))
+
+
+def test_random_policy_angles():
+    rng = np.random.default_rng(0)
+
+    actions = random_policy(np.zeros((100, 2)), np.zeros((100, 2)), rng)
+
+    assert np.all(np.abs(actions.shoot_angles) <= np.pi)
+    assert set(actions.move_directions) == {NO_DIRECTION, *Direction}
+
+
+def test_scripted_policy_aims_at_enemy():
+    actions = scripted_policy(
+        np.array([[0.5, 0.5], [0.5, 0.5]]),
+        np.array([[0.7, 0.5], [0.5, 0.3]]),
+        np.random.default_rng(0),
+    )
+
+    np.testing.assert_array_almost_equal(actions.shoot_angles, [0, -np.pi / 2])
+    np.testing.assert_array_equal(actions.should_shoot, [True, True])
+
+
+@pytest.mark.parametrize(
+    ["player_location", "enemy_location", "direction"],
+    [
+        ([0.5, 0.5], [0.7, 0.55], Direction.LEFT),
+        ([0.5, 0.5], [0.3, 0.55], Direction.RIGHT),
+        ([0.5, 0.5], [0.55, 0.7], Direction.UP),
+        ([0.5, 0.5], [0.55, 0.3], Direction.DOWN),
+        ([0.2, 0.5], [0.4, 0.55], Direction.UP),
+        ([0.2, 0.8], [0.4, 0.6], NO_DIRECTION),
+    ],
+)
+def test_scripted_policy_runs_away(player_location, enemy_location, direction):
+    actions = scripted_policy(
+        np.array([player_location]),
+        np.array([enemy_location]),
+        np.random.default_rng(0),
+    )
+
+    np.testing.assert_array_equal(actions.move_directions, [direction])
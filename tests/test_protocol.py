@@ -0,0 +1,155 @@
+import numpy as np
+import pytest
+
+from shooter.direction import Direction
+from shooter.protocol import (
+    ACTION,
+    ACTION_MESSAGE,
+    BULLET_DTYPE,
+    DELTA_MESSAGE,
+    HEADER,
+    KEYFRAME_MESSAGE,
+    STATE_DTYPE,
+    Action,
+    MessageReader,
+    ProtocolError,
+    RemoteBoard,
+    decode_action,
+    encode_action,
+    encode_message,
+    mask_size,
+)
+
+
+def state_payload(tick, previous_bullets, kept=(), new_bullets=()):
+    state = np.zeros(1, dtype=STATE_DTYPE)
+    state["tick"] = tick
+    state["score"] = 3
+    state["player_location"] = [0.25, 0.5]
+    state["enemy_location"] = [0.75, 0.5]
+    state["previous_bullets"] = previous_bullets
+    state["new_bullets"] = len(new_bullets)
+    bullets = np.zeros(len(new_bullets), dtype=BULLET_DTYPE)
+    for bullet, (location, velocity, is_player) in zip(bullets, new_bullets):
+        bullet["location"] = location
+        bullet["velocity"] = velocity
+        bullet["is_player"] = is_player
+    mask = np.packbits(np.array(kept, dtype=bool), bitorder="little")
+    return state.tobytes() + mask.tobytes() + bullets.tobytes()
+
+
+@pytest.mark.parametrize(
+    "action",
+    [
+        Action(Direction.UP, 1.5, True),
+        Action(Direction.RIGHT, 0.0, False),
+        Action(None, -2.0, True),
+    ],
+)
+def test_action_round_trip(action):
+    reader = MessageReader()
+
+    [(message_type, payload)] = reader.feed(encode_action(action))
+
+    assert message_type == ACTION_MESSAGE
+    assert decode_action(payload) == action
+
+
+def test_decode_action_with_wrong_size():
+    with pytest.raises(ProtocolError, match="must be"):
+        decode_action(b"\0")
+
+
+def test_decode_action_with_unknown_direction():
+    with pytest.raises(ProtocolError, match="Unknown move direction: 9"):
+        decode_action(ACTION.pack(9, 0.0, False))
+
+
+@pytest.mark.parametrize("bullets_count, size", [(0, 0), (1, 1), (8, 1), (9, 2)])
+def test_mask_size(bullets_count, size):
+    assert mask_size(bullets_count) == size
+
+
+def test_message_reader_splits_stream():
+    data = encode_message(7, b"abc") + encode_message(8) + encode_message(9, b"de")
+    reader = MessageReader()
+
+    messages = reader.feed(data[:5]) + reader.feed(data[5:12]) + reader.feed(data[12:])
+
+    assert messages == [(7, b"abc"), (8, b""), (9, b"de")]
+    assert len(reader.buffer) == 0
+
+
+def test_message_reader_keeps_partial_message():
+    reader = MessageReader()
+
+    assert reader.feed(encode_message(7, b"abc")[:-1]) == []
+    assert len(reader.buffer) == HEADER.size + 2
+
+
+def test_message_reader_rejects_large_payload():
+    reader = MessageReader(max_payload_size=2)
+
+    with pytest.raises(ProtocolError, match="too large"):
+        reader.feed(encode_message(7, b"abc"))
+
+
+def test_remote_board_keyframe_and_delta():
+    board = RemoteBoard(tick_duration=0.5)
+    board.apply(
+        KEYFRAME_MESSAGE,
+        state_payload(
+            tick=1,
+            previous_bullets=0,
+            new_bullets=[([0.1, 0.1], [0.2, 0.0], True), ([0.5, 0.5], [0.0, 0.2], False)],
+        ),
+    )
+
+    board.apply(
+        DELTA_MESSAGE,
+        state_payload(
+            tick=2,
+            previous_bullets=2,
+            kept=[False, True],
+            new_bullets=[([0.3, 0.3], [0.0, 0.0], True)],
+        ),
+    )
+
+    assert board.tick == 2
+    assert board.score == 3
+    assert not board.lost
+    np.testing.assert_array_equal(board.player_location, [0.25, 0.5])
+    np.testing.assert_array_equal(board.enemy_location, [0.75, 0.5])
+    np.testing.assert_array_equal(board.bullet_locations, [[0.5, 0.6], [0.3, 0.3]])
+    np.testing.assert_array_equal(board.bullet_velocities, [[0.0, 0.2], [0.0, 0.0]])
+    np.testing.assert_array_equal(board.bullet_is_player, [False, True])
+
+
+def test_remote_board_keyframe_replaces_bullets():
+    board = RemoteBoard(tick_duration=0.5)
+    bullet = ([0.1, 0.1], [0.2, 0.0], True)
+    board.apply(
+        KEYFRAME_MESSAGE, state_payload(1, previous_bullets=0, new_bullets=[bullet])
+    )
+
+    board.apply(KEYFRAME_MESSAGE, state_payload(5, previous_bullets=0))
+
+    assert board.tick == 5
+    assert len(board.bullet_is_player) == 0
+
+
+@pytest.mark.parametrize(
+    "message_type, payload, match",
+    [
+        (KEYFRAME_MESSAGE, b"\0", "too short"),
+        (KEYFRAME_MESSAGE, state_payload(1, 0) + b"\0", "doesn't match"),
+        (KEYFRAME_MESSAGE, state_payload(1, 1, kept=[True]), "can't keep"),
+        (DELTA_MESSAGE, state_payload(1, 1, kept=[True]), "can't follow"),
+        (ACTION_MESSAGE, state_payload(1, 0), "Unknown state message type: 1"),
+    ],
+)
+def test_remote_board_rejects_invalid_states(message_type, payload, match):
+    board = RemoteBoard(tick_duration=0.5)
+
+    with pytest.raises(ProtocolError, match=match):
+        board.apply(message_type, payload)
@@ -0,0 +1,161 @@
+import numpy as np
+import pygame
+import pytest
+
+from shooter.batched_board import BatchedBoard
+from shooter.board import Board
+from shooter.cli.pygame_util import draw_rect
+from shooter.constants import BLUE, RED, SCREEN_SIZE, WHITE
+from shooter.rasterizer import (
+    GRAYSCALE_WEIGHTS,
+    image_shape,
+    rasterize,
+    rasterize_batched_board,
+    rasterize_board,
+    squares_coverage,
+)
+
+
+def make_board():
+    board = Board(enemies_count=3, seed=0)
+    board.add_bullets(
+        board.player.location[np.newaxis], np.array([0.3]), is_player=True
+    )
+    board.add_bullets(board.enemy_locations, np.array([1, 2, 3]), is_player=False)
+    board.update_bullets(delta_time=1.5)
+    board.add_bullets(np.array([[0.99, 0.5]]), np.array([0]), is_player=False)
+    return board
+
+
+def pygame_image(board):
+    screen = pygame.Surface((SCREEN_SIZE, SCREEN_SIZE))
+    screen.fill(WHITE)
+    draw_rect(screen, board.player, BLUE)
+    for enemy in board.enemies:
+        draw_rect(screen, enemy, RED)
+    bullets = board.bullets
+    for bullet, is_player in zip(bullets, board.bullet_is_player):
+        if not is_player:
+            draw_rect(screen, bullet, RED)
+    for bullet, is_player in zip(bullets, board.bullet_is_player):
+        if is_player:
+            draw_rect(screen, bullet, BLUE)
+    return np.swapaxes(pygame.surfarray.array3d(screen), 0, 1)
+
+
+def test_squares_coverage():
+    covered = squares_coverage(
+        np.array([[[0.25, 0.45], [0.95, 0.05]]]), width=0.2, resolution=10
+    )
+
+    expected = np.zeros((1, 10, 10), dtype=bool)
+    expected[0, 3:5, 1:3] = True
+    expected[0, 0:2, 8:10] = True
+    np.testing.assert_array_equal(covered, expected)
+
+
+def test_squares_coverage_with_mask():
+    covered = squares_coverage(
+        np.array([[[0.25, 0.45], [0.95, 0.05]]]),
+        width=0.2,
+        resolution=10,
+        mask=np.array([[False, True]]),
+    )
+
+    expected = np.zeros((1, 10, 10), dtype=bool)
+    expected[0, 0:2, 8:10] = True
+    np.testing.assert_array_equal(covered, expected)
+
+
+def test_rasterize_board_like_pygame():
+    board = make_board()
+
+    image = rasterize_board(board, resolution=SCREEN_SIZE)
+
+    assert image.dtype == np.uint8
+    np.testing.assert_array_equal(image, pygame_image(board))
+
+
+def test_rasterize_board_shape():
+    image = rasterize_board(make_board())
+
+    assert image.shape == image_shape()
+    assert image.dtype == np.uint8
+
+
+def test_rasterize_grayscale():
+    board = make_board()
+
+    image = rasterize_board(board, grayscale=True)
+    colored = rasterize_board(board)
+
+    assert image.shape == image_shape(grayscale=True)
+    np.testing.assert_array_equal(
+        image[..., 0], np.rint(colored @ GRAYSCALE_WEIGHTS).astype(np.uint8)
+    )
+
+
+def test_rasterize_downsample():
+    board = make_board()
+
+    image = rasterize_board(board, resolution=80, downsample=4)
+    full_image = rasterize_board(board, resolution=80).astype(float)
+
+    assert image.shape == image_shape(resolution=80, downsample=4)
+    np.testing.assert_array_equal(
+        image, np.rint(full_image.reshape(20, 4, 20, 4, 3).mean(axis=(1, 3)))
+    )
+
+
+def test_rasterize_downsample_not_dividing_resolution():
+    with pytest.raises(
+        ValueError, match=r"^Resolution \(84\) must be divisible by downsample \(5\)$"
+    ):
+        rasterize(
+            player_locations=np.zeros((1, 2)),
+            enemy_locations=np.zeros((1, 1, 2)),
+            bullet_locations=np.zeros((1, 0, 2)),
+            bullet_is_player=np.zeros((1, 0), dtype=bool),
+            bullet_mask=np.zeros((1, 0), dtype=bool),
+            downsample=5,
+        )
+
+
+def test_rasterize_batched_board_like_boards():
+    batched_board = BatchedBoard(games_count=4, bullets_capacity=4, seed=0)
+    batched_board.add_bullets(
+        games=np.array([0, 2]),
+        locations=batched_board.player_locations[[0, 2]],
+        angles=np.array([0, 1]),
+        is_player=True,
+    )
+    batched_board.add_bullets(
+        games=np.array([2]),
+        locations=batched_board.enemy_locations[[2]],
+        angles=np.array([2]),
+        is_player=False,
+    )
+
+    images = rasterize_batched_board(batched_board, resolution=SCREEN_SIZE)
+
+    assert images.shape == (4, *image_shape(resolution=SCREEN_SIZE))
+    for game, image in enumerate(images):
+        board = Board()
+        board.player.location = batched_board.player_locations[game]
+        board.enemy_locations[0] = batched_board.enemy_locations[game]
+        mask = batched_board.bullet_mask[game]
+        board.add_bullets(
+            batched_board.bullet_locations[game][mask],
+            np.zeros(mask.sum()),
+            is_player=False,
+        )
+        board.bullet_is_player = batched_board.bullet_is_player[game][mask]
+        np.testing.assert_array_equal(image, pygame_image(board))
+
+
+def test_rasterize_batched_board_without_bullets():
+    batched_board = BatchedBoard(games_count=2, seed=0)
+
+    images = rasterize_batched_board(batched_board, grayscale=True, downsample=2)
+
+    assert images.shape == (2, *image_shape(grayscale=True, downsample=2))
@@ -0,0 +1,119 @@
+import os
+
+import numpy as np
+import pygame
+import pytest
+
+from shooter.board import Board
+from shooter.cli.pygame_util import draw_square, draw_squares
+from shooter.cli.renderer import BoardRenderer, FrameStats
+from shooter.constants import RED, SCREEN_SIZE, WHITE
+
+
+@pytest.fixture(name="screen")
+def screen_fixture():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    yield pygame.display.set_mode([SCREEN_SIZE, SCREEN_SIZE])
+    pygame.quit()
+
+
+def make_renderer(screen, max_dirty_rects=512):
+    return BoardRenderer(
+        screen, font=pygame.font.Font(None, 24), max_dirty_rects=max_dirty_rects
+    )
+
+
+def screen_pixels(screen):
+    return pygame.surfarray.array3d(screen)
+
+
+def make_board(seed):
+    board = Board(enemies_count=3, seed=seed)
+    rng = np.random.default_rng(seed)
+    board.add_bullets(rng.uniform(size=(20, 2)), np.zeros(20), is_player=True)
+    board.add_bullets(rng.uniform(size=(20, 2)), np.zeros(20), is_player=False)
+    # Bullets partly out of the screen
+    board.add_bullets(
+        np.array([[0.995, 0.005], [0.005, 0.995]]), np.zeros(2), is_player=seed == 0
+    )
+    return board
+
+
+def test_draw_squares_like_draw_square():
+    locations = np.array([[0.1, 0.2], [0.5, 0.5], [0.99, 0.01]])
+    batched = pygame.Surface((SCREEN_SIZE, SCREEN_SIZE))
+    batched.fill(WHITE)
+    single = pygame.Surface((SCREEN_SIZE, SCREEN_SIZE))
+    single.fill(WHITE)
+
+    rects = draw_squares(batched, locations, width=0.05, color=RED)
+    for location in locations:
+        draw_square(single, location, width=0.05, color=RED)
+
+    np.testing.assert_array_equal(screen_pixels(batched), screen_pixels(single))
+    assert rects == [(37, 87, 25, 25), (237, 237, 25, 25), (482, -7, 25, 25)]
+
+
+def test_draw_squares_without_locations():
+    screen = pygame.Surface((SCREEN_SIZE, SCREEN_SIZE))
+
+    assert draw_squares(screen, np.empty((0, 2)), width=0.05, color=RED) == []
+
+
+@pytest.mark.parametrize("max_dirty_rects", [0, 512])
+def test_renderer_clears_previous_frame(screen, max_dirty_rects):
+    renderer = make_renderer(screen, max_dirty_rects=max_dirty_rects)
+    renderer.render(make_board(seed=0), footer="first")
+    board = make_board(seed=1)
+    renderer.render(board, aim_end=np.array([0.5, 0.5]), footer="second")
+    pixels = screen_pixels(screen)
+
+    make_renderer(screen).render(board, aim_end=np.array([0.5, 0.5]), footer="second")
+
+    np.testing.assert_array_equal(pixels, screen_pixels(screen))
+
+
+def test_renderer_caches_text(screen):
+    renderer = make_renderer(screen)
+    board = Board()
+    renderer.render(board)
+    score_surface = renderer.texts["score"][1]
+
+    renderer.render(board)
+    assert renderer.texts["score"][1] is score_surface
+    board.score += 1
+    renderer.render(board)
+    assert renderer.texts["score"][1] is not score_surface
+
+
+def test_renderer_stats(screen):
+    renderer = make_renderer(screen)
+
+    for _ in range(3):
+        renderer.render(Board())
+
+    assert renderer.stats.frames_count == 3
+    assert renderer.stats.mean_draw_seconds > 0
+
+
+def test_frame_stats():
+    stats = FrameStats(frames_count=2)
+    assert stats.fps == 0
+    assert stats.mean_draw_seconds == 0
+
+    for frame_time, draw_seconds in [(1.0, 0.5), (1.25, 0.001), (1.5, 0.003)]:
+        stats.record_frame(draw_seconds, frame_time=frame_time)
+
+    assert stats.fps == pytest.approx(4)
+    assert stats.mean_draw_seconds == pytest.approx(0.002)
+    assert stats.summary() == "4.0 FPS, draw 2.00 ms"
+
+
+def test_frame_stats_without_elapsed_time():
+    stats = FrameStats()
+
+    stats.record_frame(0.001, frame_time=1.0)
+    stats.record_frame(0.001, frame_time=1.0)
+
+    assert stats.fps == 0
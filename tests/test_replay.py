@@ -0,0 +1,269 @@
+import numpy as np
+import pytest
+
+from shooter.board import Board, GameStatus
+from shooter.direction import Direction
+from shooter.policies import random_policy
+from shooter.replay import MAGIC, ReplayReader, ReplayWriter, restore_frame
+from shooter.simulation import BATCHED_ENGINE, BOARD_ENGINE, simulate
+
+UPDATES = [
+    (0.05, Direction.UP, 0.5, True),
+    (0.1, None, 1.5, False),
+    (0.05, Direction.LEFT, -2.0, True),
+    (0.2, Direction.DOWN, 3.0, True),
+]
+
+
+def play_recorded_game(recorder, seed=0, game=0):
+    board = Board(enemies_count=2, seed=seed)
+    states = [board_state(board)]
+    recorder.record(board, game=game)
+    for delta_time, move_direction, angle, should_shoot in UPDATES:
+        board.update(
+            delta_time=delta_time,
+            move_direction=move_direction,
+            shoot_angle_radians=angle,
+            should_shoot=should_shoot,
+        )
+        recorder.record(
+            board,
+            delta_time=delta_time,
+            move_direction=move_direction,
+            shoot_angle_radians=angle,
+            should_shoot=should_shoot,
+            game=game,
+        )
+        states.append(board_state(board))
+    return states
+
+
+def board_state(board):
+    return {
+        "player_location": board.player.location.copy(),
+        "player_time_to_reload": board.player.time_to_reload,
+        "enemy_locations": board.enemy_locations.copy(),
+        "enemy_time_to_reload": board.enemy_time_to_reload.copy(),
+        "bullet_locations": board.bullet_locations.copy(),
+        "bullet_velocities": board.bullet_velocities.copy(),
+        "bullet_is_player": board.bullet_is_player.copy(),
+        "score": board.score,
+        "status": board.status,
+    }
+
+
+def assert_frame_state(frame, state):
+    for name, value in state.items():
+        np.testing.assert_array_equal(getattr(frame, name), value)
+
+
+def test_replay_round_trip(tmp_path):
+    path = tmp_path / "game.replay"
+    with ReplayWriter(path) as recorder:
+        states = play_recorded_game(recorder)
+
+    reader = ReplayReader(path)
+
+    assert reader.episodes_count == 1
+    assert reader.ticks_count == len(UPDATES) + 1
+    assert reader.episode_length(0) == len(UPDATES) + 1
+    for frame, state in zip(reader.episode_frames(0), states):
+        assert_frame_state(frame, state)
+
+
+def test_replay_inputs(tmp_path):
+    path = tmp_path / "game.replay"
+    with ReplayWriter(path) as recorder:
+        play_recorded_game(recorder)
+
+    frames = list(ReplayReader(path).episode_frames(0))
+
+    assert frames[0].delta_time == 0
+    assert frames[0].move_direction is None
+    assert frames[0].shoot_angle_radians == 0
+    assert not frames[0].should_shoot
+    for frame, update in zip(frames[1:], UPDATES):
+        assert (
+            frame.delta_time,
+            frame.move_direction,
+            frame.shoot_angle_radians,
+            frame.should_shoot,
+        ) == update
+
+
+def test_replay_several_chunks(tmp_path):
+    path = tmp_path / "games.replay"
+    with ReplayWriter(path, chunk_ticks=3) as recorder:
+        all_states = []
+        for seed in range(4):
+            all_states.append(play_recorded_game(recorder, seed=seed))
+            recorder.end_episode()
+
+    reader = ReplayReader(path)
+
+    assert len(reader.chunks) == 4
+    assert reader.episodes_count == 4
+    for episode, states in enumerate(all_states):
+        for tick, state in enumerate(states):
+            assert_frame_state(reader.frame(episode, tick), state)
+
+
+def test_replay_interleaved_games(tmp_path):
+    path = tmp_path / "games.replay"
+    boards = [Board(seed=seed) for seed in range(2)]
+    with ReplayWriter(path) as recorder:
+        for _ in range(3):
+            for game, board in enumerate(boards):
+                board.update(
+                    delta_time=0.05,
+                    move_direction=Direction(game),
+                    shoot_angle_radians=0,
+                    should_shoot=False,
+                )
+                recorder.record(
+                    board, delta_time=0.05, move_direction=Direction(game), game=game
+                )
+        recorder.end_episode(game=1)
+        recorder.end_episode(game=2)
+
+    reader = ReplayReader(path)
+
+    assert reader.episodes_count == 2
+    assert [frame.move_direction for frame in reader.episode_frames(0)] == [
+        Direction(1)
+    ] * 3
+    assert [frame.move_direction for frame in reader.episode_frames(1)] == [
+        Direction(0)
+    ] * 3
+    assert_frame_state(reader.frame(0, 2), board_state(boards[1]))
+    assert_frame_state(reader.frame(1, 2), board_state(boards[0]))
+
+
+def test_replay_empty(tmp_path):
+    path = tmp_path / "empty.replay"
+    recorder = ReplayWriter(path)
+    recorder.close()
+    recorder.close()
+
+    reader = ReplayReader(path)
+
+    assert reader.episodes_count == 0
+    assert reader.ticks_count == 0
+
+
+def test_replay_frame_out_of_range(tmp_path):
+    path = tmp_path / "game.replay"
+    with ReplayWriter(path) as recorder:
+        play_recorded_game(recorder)
+
+    with pytest.raises(
+        IndexError, match=r"^Tick 5 is out of range for episode 0 of 5 ticks$"
+    ):
+        ReplayReader(path).frame(0, 5)
+
+
+def test_replay_frame_is_read_only(tmp_path):
+    path = tmp_path / "game.replay"
+    with ReplayWriter(path) as recorder:
+        play_recorded_game(recorder)
+
+    frame = ReplayReader(path).frame(0, 1)
+
+    with pytest.raises(ValueError):
+        frame.enemy_locations[0] = 0
+
+
+def test_read_not_replay_file(tmp_path):
+    path = tmp_path / "not.replay"
+    path.write_bytes(b"x" * 100)
+
+    with pytest.raises(ValueError, match="^Not a replay file: "):
+        ReplayReader(path)
+
+
+def test_read_truncated_replay_file(tmp_path):
+    path = tmp_path / "game.replay"
+    with ReplayWriter(path) as recorder:
+        play_recorded_game(recorder)
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with pytest.raises(ValueError, match="^Replay file is truncated: "):
+        ReplayReader(path)
+
+
+def test_read_replay_file_without_footer(tmp_path):
+    path = tmp_path / "game.replay"
+    path.write_bytes(MAGIC)
+
+    with pytest.raises(ValueError, match="^Not a replay file: "):
+        ReplayReader(path)
+
+
+def test_restore_frame(tmp_path):
+    path = tmp_path / "game.replay"
+    with ReplayWriter(path) as recorder:
+        states = play_recorded_game(recorder)
+    board = Board()
+
+    restore_frame(board, ReplayReader(path).frame(0, 3))
+
+    assert board_state(board).keys() == states[3].keys()
+    for name, value in board_state(board).items():
+        np.testing.assert_array_equal(value, states[3][name])
+    board.enemy_locations[0] = 0
+    board.update(
+        delta_time=0.05, move_direction=None, shoot_angle_radians=0, should_shoot=False
+    )
+
+
+def test_restore_lost_frame(tmp_path):
+    path = tmp_path / "game.replay"
+    board = Board()
+    board.set_lost()
+    with ReplayWriter(path) as recorder:
+        recorder.record(board)
+
+    restore_frame(board, ReplayReader(path).frame(0, 0))
+
+    assert board.status == GameStatus.LOST
+
+
+def test_simulate_recording(tmp_path):
+    path = tmp_path / "simulation.replay"
+    with ReplayWriter(path, chunk_ticks=16) as recorder:
+        result = simulate(
+            games_count=3,
+            steps=100,
+            delta_time=0.05,
+            policy=random_policy,
+            seed=0,
+            engine=BOARD_ENGINE,
+            recorder=recorder,
+        )
+
+    reader = ReplayReader(path)
+
+    assert reader.episodes_count == len(result.episodes) + 3
+    assert reader.ticks_count == result.steps + reader.episodes_count
+    lost_lengths = []
+    for episode in range(reader.episodes_count):
+        length = reader.episode_length(episode)
+        last_frame = reader.frame(episode, length - 1)
+        if last_frame.status == GameStatus.LOST:
+            lost_lengths.append(length - 1)
+    assert sorted(lost_lengths) == sorted(episode.length for episode in result.episodes)
+
+
+def test_simulate_recording_unsupported_engine(tmp_path):
+    with ReplayWriter(tmp_path / "simulation.replay") as recorder:
+        with pytest.raises(
+            ValueError, match=r"^Recording is not supported by the batched engine$"
+        ):
+            simulate(
+                games_count=1,
+                steps=1,
+                delta_time=0.05,
+                policy=random_policy,
+                engine=BATCHED_ENGINE,
+                recorder=recorder,
+            )
@@ -0,0 +1,211 @@
+import os
+import signal
+from multiprocessing import Pipe
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from shooter.batched_board import NO_DIRECTION
+from shooter.observation import observation_size
+from shooter.rollout import (
+    CLOSE_COMMAND,
+    DONE_REPLY,
+    RESET_COMMAND,
+    STEP_COMMAND,
+    RolloutPool,
+    SharedArrays,
+    rollout_array_specs,
+    rollout_worker,
+)
+
+WORKERS_COUNT = 2
+GAMES_PER_WORKER = 3
+GAMES_COUNT = WORKERS_COUNT * GAMES_PER_WORKER
+OBSERVED_BULLETS = 4
+
+
+def make_pool(seed=1, step_timeout=10.0):
+    return RolloutPool(
+        workers_count=WORKERS_COUNT,
+        games_per_worker=GAMES_PER_WORKER,
+        observed_bullets=OBSERVED_BULLETS,
+        seed=seed,
+        step_timeout=step_timeout,
+    )
+
+
+def crashing_worker(connection, **kwargs):  # pylint: disable=unused-argument
+    connection.recv()
+
+
+def run_worker_in_process(shared_arrays, commands, close=True):
+    parent_connection, child_connection = Pipe()
+    for command in commands:
+        parent_connection.send(command)
+    if close:
+        parent_connection.send(CLOSE_COMMAND)
+    else:
+        parent_connection.close()
+    rollout_worker(
+        connection=child_connection,
+        shared_memory_name=shared_arrays.name,
+        specs=shared_arrays.specs,
+        games=slice(1, 3),
+        delta_time=0.05,
+        observed_bullets=OBSERVED_BULLETS,
+        seed=0,
+    )
+    return parent_connection
+
+
+def step_pool(pool, should_shoot=True):
+    return pool.step(
+        move_directions=np.full(GAMES_COUNT, NO_DIRECTION),
+        shoot_angles=np.zeros(GAMES_COUNT),
+        should_shoot=np.full(GAMES_COUNT, should_shoot),
+    )
+
+
+def test_shared_arrays_are_shared_between_instances():
+    specs = rollout_array_specs(games_count=3, observed_bullets=2)
+    owner = SharedArrays(specs)
+    other = SharedArrays(specs, name=owner.name)
+    owner["observations"][:] = 1.5
+    owner["lost"][1] = True
+
+    np.testing.assert_array_equal(
+        other["observations"], np.full((3, observation_size(2)), 1.5)
+    )
+    np.testing.assert_array_equal(other["lost"], [False, True, False])
+
+    other.close()
+    owner.close()
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=owner.name)
+
+
+def test_rollout_worker_writes_its_games():
+    shared_arrays = SharedArrays(rollout_array_specs(4, OBSERVED_BULLETS))
+    shared_arrays["move_directions"][:] = NO_DIRECTION
+    shared_arrays["should_shoot"][:] = True
+
+    connection = run_worker_in_process(shared_arrays, [RESET_COMMAND, STEP_COMMAND])
+
+    assert connection.recv() == DONE_REPLY
+    assert connection.recv() == DONE_REPLY
+    observations = shared_arrays["observations"]
+    assert np.all(observations[1:3, 6] == 1)
+    assert np.all(observations[[0, 3]] == 0)
+    shared_arrays.close()
+
+
+def test_rollout_worker_stops_when_pool_goes_away():
+    shared_arrays = SharedArrays(rollout_array_specs(4, OBSERVED_BULLETS))
+
+    run_worker_in_process(shared_arrays, [RESET_COMMAND], close=False)
+
+    assert np.all(shared_arrays["observations"][1:3, 0:4] > 0)
+    shared_arrays.close()
+
+
+def test_rollout_pool_reset_and_step():
+    with make_pool() as pool:
+        assert pool.games_count == GAMES_COUNT
+        observations = pool.reset()
+        assert observations.shape == (GAMES_COUNT, observation_size(OBSERVED_BULLETS))
+        assert observations.dtype == np.float32
+
+        result = step_pool(pool)
+
+    assert result.observations.shape == observations.shape
+    assert result.score_deltas.shape == (GAMES_COUNT,)
+    assert not np.any(result.lost)
+    np.testing.assert_array_equal(result.final_scores, np.zeros(GAMES_COUNT))
+    # Every game shot a bullet, which is now observed as alive.
+    np.testing.assert_array_equal(result.observations[:, 6], np.ones(GAMES_COUNT))
+
+
+def test_rollout_pool_is_deterministic_with_seed():
+    with make_pool(seed=1) as pool1, make_pool(seed=1) as pool2:
+        np.testing.assert_array_equal(pool1.reset(), pool2.reset())
+        np.testing.assert_array_equal(
+            step_pool(pool1).observations, step_pool(pool2).observations
+        )
+
+
+def test_rollout_pool_workers_have_different_games():
+    with make_pool() as pool:
+        observations = pool.reset()
+    assert not np.array_equal(
+        observations[:GAMES_PER_WORKER], observations[GAMES_PER_WORKER:]
+    )
+
+
+def test_rollout_pool_restarts_crashed_worker():
+    with make_pool() as pool:
+        pool.reset()
+        pool.processes[1].kill()
+        pool.processes[1].join()
+
+        result = step_pool(pool)
+
+        assert pool.restarts_count == 1
+        assert pool.processes[1].is_alive()
+        np.testing.assert_array_equal(
+            result.lost, [False] * GAMES_PER_WORKER + [True] * GAMES_PER_WORKER
+        )
+        assert not np.any(step_pool(pool).lost)
+
+
+def test_rollout_pool_restarts_stuck_worker():
+    with make_pool(step_timeout=0.5) as pool:
+        pool.reset()
+        os.kill(pool.processes[0].pid, signal.SIGSTOP)
+
+        result = step_pool(pool)
+
+        assert pool.restarts_count == 1
+        np.testing.assert_array_equal(
+            result.lost, [True] * GAMES_PER_WORKER + [False] * GAMES_PER_WORKER
+        )
+
+
+def test_rollout_pool_restarts_worker_on_reset():
+    with make_pool() as pool:
+        pool.processes[0].kill()
+        pool.processes[0].join()
+
+        observations = pool.reset()
+
+        assert pool.restarts_count == 1
+        assert observations.shape == (GAMES_COUNT, observation_size(OBSERVED_BULLETS))
+
+
+def test_rollout_pool_close_stops_workers():
+    pool = make_pool()
+    pool.reset()
+    name = pool.shared_arrays.name
+    pool.close()
+    pool.close()
+
+    assert not any(process.is_alive() for process in pool.processes)
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
+
+
+def test_rollout_pool_fails_when_restarted_worker_fails(monkeypatch):
+    monkeypatch.setattr("shooter.rollout.rollout_worker", crashing_worker)
+    pool = make_pool()
+    with pytest.raises(RuntimeError, match="Worker 0 failed right after restarting"):
+        pool.reset()
+    pool.close()
+
+
+def test_rollout_pool_close_kills_stuck_workers():
+    pool = make_pool(step_timeout=0.1)
+    pool.reset()
+    os.kill(pool.processes[0].pid, signal.SIGSTOP)
+    pool.close()
+
+    assert not any(process.is_alive() for process in pool.processes)
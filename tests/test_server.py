@@ -0,0 +1,228 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from shooter.direction import Direction
+from shooter.load_test import load_test
+from shooter.protocol import (
+    KEYFRAME_MESSAGE,
+    WELCOME,
+    WELCOME_MESSAGE,
+    Action,
+    MessageReader,
+    RemoteBoard,
+    encode_action,
+    encode_message,
+)
+from shooter.server import GameServer, Session
+
+
+class FakeTransport:
+    def __init__(self):
+        self.written = bytearray()
+        self.closed = False
+        self.high = None
+
+    def set_write_buffer_limits(self, high):
+        self.high = high
+
+    def write(self, data):
+        self.written += data
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClient:
+    def __init__(self, server):
+        self.transport = FakeTransport()
+        self.session = Session(server)
+        self.session.connection_made(self.transport)
+        self.reader = MessageReader()
+        self.board = None
+        self.message_types = []
+
+    def receive(self):
+        messages = self.reader.feed(bytes(self.transport.written))
+        self.transport.written.clear()
+        for message_type, payload in messages:
+            self.message_types.append(message_type)
+            if message_type == WELCOME_MESSAGE:
+                _, tick_duration = WELCOME.unpack(payload)
+                self.board = RemoteBoard(tick_duration)
+            else:
+                self.board.apply(message_type, payload)
+
+    def assert_matches(self, server):
+        game = self.session.game
+        board = server.board
+        count = board.bullet_counts[game]
+        assert self.board.tick == server.tick
+        assert self.board.score == board.scores[game]
+        np.testing.assert_array_equal(
+            self.board.bullet_locations, board.bullet_locations[game, :count]
+        )
+        np.testing.assert_array_equal(
+            self.board.bullet_velocities, board.bullet_velocities[game, :count]
+        )
+        np.testing.assert_array_equal(
+            self.board.bullet_is_player, board.bullet_is_player[game, :count]
+        )
+        np.testing.assert_allclose(
+            self.board.player_location, board.player_locations[game], atol=1e-6
+        )
+        np.testing.assert_allclose(
+            self.board.enemy_location, board.enemy_locations[game], atol=1e-6
+        )
+
+
+def test_session_welcome():
+    server = GameServer(max_sessions=4, tick_rate=50, seed=0)
+
+    client = FakeClient(server)
+    client.receive()
+
+    assert client.session.game == 0
+    assert client.board.tick_duration == 1 / 50
+    assert client.transport.high == server.write_buffer_limit
+    assert not server.board.lost[0]
+    assert server.board.lost[1:].all()
+
+
+def test_remote_boards_follow_server():
+    server = GameServer(max_sessions=4, tick_rate=50, seed=0)
+    clients = [FakeClient(server) for _ in range(3)]
+    rng = np.random.default_rng(1)
+
+    for _ in range(200):
+        for client in clients:
+            client.session.data_received(
+                encode_action(
+                    Action(
+                        move_direction=None,
+                        shoot_angle_radians=rng.uniform(0, 2 * np.pi),
+                        should_shoot=True,
+                    )
+                )
+            )
+        server.step()
+        for client in clients:
+            client.receive()
+            client.assert_matches(server)
+
+    assert server.board.bullet_counts[:3].max() > 1
+    assert server.stats.counters["states_sent"] == 3 * 200
+    assert server.stats.phases["tick"].calls == 200
+
+
+def test_lost_game_is_reset_with_keyframe():
+    server = GameServer(max_sessions=2, tick_rate=50, seed=0)
+    client = FakeClient(server)
+    client.session.data_received(encode_action(Action(Direction.LEFT, 0.0, False)))
+
+    while not server.board.lost[0]:
+        server.step()
+        client.receive()
+    final_score = client.board.score
+    assert client.board.lost
+    assert not server.board.lost[0]
+    server.step()
+    client.receive()
+
+    assert client.message_types[-1] == KEYFRAME_MESSAGE
+    assert not client.board.lost
+    assert client.board.score == 0 <= final_score
+    client.assert_matches(server)
+
+
+def test_paused_session_skips_states_and_gets_keyframe():
+    server = GameServer(max_sessions=2, tick_rate=50, seed=0)
+    client = FakeClient(server)
+    client.session.data_received(encode_action(Action(None, 0.5, True)))
+    server.step()
+    client.receive()
+
+    client.session.pause_writing()
+    for _ in range(5):
+        server.step()
+    assert len(client.transport.written) == 0
+    client.session.resume_writing()
+    server.step()
+    client.receive()
+
+    assert server.stats.counters["states_skipped"] == 5
+    assert client.message_types == [
+        WELCOME_MESSAGE,
+        KEYFRAME_MESSAGE,
+        KEYFRAME_MESSAGE,
+    ]
+    client.assert_matches(server)
+
+
+def test_full_server_rejects_session():
+    server = GameServer(max_sessions=1, seed=0)
+    FakeClient(server)
+
+    client = FakeClient(server)
+
+    assert client.transport.closed
+    assert len(client.transport.written) == 0
+    assert server.stats.counters["sessions_rejected"] == 1
+
+
+def test_disconnect_frees_game():
+    server = GameServer(max_sessions=2, seed=0)
+    first, second = FakeClient(server), FakeClient(server)
+    first.session.data_received(encode_action(Action(Direction.UP, 1.0, True)))
+
+    first.session.connection_lost(None)
+    first.session.connection_lost(None)
+    third = FakeClient(server)
+
+    assert list(server.sessions) == [1, 0]
+    assert server.sessions[1] is second.session
+    assert third.session.game == 0
+    assert server.should_shoot[0] == 0
+    assert server.move_directions[0] == -1
+
+
+@pytest.mark.parametrize(
+    "data",
+    [encode_message(KEYFRAME_MESSAGE), encode_message(1, b"\0" * 100)],
+)
+def test_invalid_message_closes_session(data):
+    server = GameServer(max_sessions=1, seed=0)
+    client = FakeClient(server)
+
+    client.session.data_received(data)
+
+    assert client.transport.closed
+    assert server.stats.counters["protocol_errors"] == 1
+
+
+async def run_load_test(server, **kwargs):
+    listener = await server.start(**kwargs)
+    address = listener.sockets[0].getsockname()
+    connect_kwargs = (
+        {"path": address} if isinstance(address, str) else {"port": address[1]}
+    )
+    result = await load_test(sessions=5, seconds=0.3, seed=0, **connect_kwargs)
+    await server.close()
+    return result
+
+
+@pytest.mark.parametrize("unix", [False, True])
+def test_load_test(tmp_path, unix):
+    server = GameServer(max_sessions=4, tick_rate=100, seed=0)
+    kwargs = {"path": str(tmp_path / "shooter.sock")} if unix else {"port": 0}
+
+    result = asyncio.run(run_load_test(server, **kwargs))
+
+    assert result.sessions == 5
+    assert result.errors == 0
+    assert result.states_received > 4
+    assert result.keyframes_received >= 4
+    assert result.states_per_second > 0
+    assert result.bytes_per_second > 0
+    assert server.stats.counters["sessions_rejected"] == 1
@@ -444,3 +444,18 @@ def test_shooter_cannot_shoot_itself():
     bullet = shooter.shoot(angle_radians=angle_radians)
 
     assert not bullet.is_hitting(shooter)
+
+
+def test_shooter_and_bullet_have_no_dict():
+    shooter = Shooter(
+        location=random_location(),
+        width=0.4,
+        speed=0.8,
+        bullet_width=0.1,
+        bullet_speed=0.2,
+        reload_time=0.5,
+    )
+    bullet = shooter.shoot(angle_radians=0)
+
+    assert not hasattr(shooter, "__dict__")
+    assert not hasattr(bullet, "__dict__")
@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+from shooter.policies import random_policy, scripted_policy
+from shooter.simulation import (
+    BATCHED_ENGINE,
+    BOARD_ENGINE,
+    ENGINES,
+    POOL_ENGINE,
+    EpisodeResult,
+    SimulationResult,
+    simulate,
+)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_simulate(engine):
+    result = simulate(
+        games_count=4,
+        steps=100,
+        delta_time=0.05,
+        policy=random_policy,
+        seed=0,
+        engine=engine,
+    )
+
+    assert result.steps == 400
+    assert result.elapsed_seconds > 0
+    assert len(result.episodes) > 0
+    for episode in result.episodes:
+        assert 0 <= episode.game < 4
+        assert 1 <= episode.length <= 100
+        assert episode.score >= 0
+    assert result.steps_per_second > 0
+    assert result.episodes_per_second > 0
+
+
+@pytest.mark.parametrize("engine", [BATCHED_ENGINE, BOARD_ENGINE])
+def test_simulate_is_reproducible(engine):
+    results = [
+        simulate(
+            games_count=4,
+            steps=50,
+            delta_time=0.05,
+            policy=scripted_policy,
+            seed=3,
+            engine=engine,
+        )
+        for _ in range(2)
+    ]
+
+    assert results[0].episodes == results[1].episodes
+
+
+def test_simulate_pool_with_workers_is_reproducible():
+    results = [
+        simulate(
+            games_count=4,
+            steps=50,
+            delta_time=0.05,
+            policy=scripted_policy,
+            seed=3,
+            engine=POOL_ENGINE,
+            workers_count=2,
+        )
+        for _ in range(2)
+    ]
+
+    assert results[0].steps == 200
+    assert results[0].episodes == results[1].episodes
+
+
+def test_simulate_pool_games_not_divisible_by_workers():
+    with pytest.raises(ValueError, match="must be divisible"):
+        simulate(
+            games_count=3,
+            steps=1,
+            delta_time=0.05,
+            policy=random_policy,
+            engine=POOL_ENGINE,
+            workers_count=2,
+        )
+
+
+def test_simulate_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown engine: foo"):
+        simulate(
+            games_count=1, steps=1, delta_time=0.05, policy=random_policy, engine="foo"
+        )
+
+
+def test_simulation_result_statistics():
+    result = SimulationResult(
+        episodes=[
+            EpisodeResult(game=0, score=2, length=10),
+            EpisodeResult(game=1, score=4, length=30),
+        ],
+        steps=100,
+        elapsed_seconds=0.5,
+    )
+
+    assert result.steps_per_second == 200
+    assert result.episodes_per_second == 4
+    assert result.mean_score == 3
+    assert result.mean_episode_length == 20
+
+
+def test_simulation_result_statistics_without_episodes():
+    result = SimulationResult(episodes=[], steps=100, elapsed_seconds=0.5)
+
+    assert np.isnan(result.mean_score)
+    assert np.isnan(result.mean_episode_length)
+
+
+def test_simulate_stats():
+    result = simulate(
+        games_count=2,
+        steps=10,
+        delta_time=0.05,
+        policy=random_policy,
+        seed=0,
+        engine=BOARD_ENGINE,
+        collect_stats=True,
+    )
+
+    assert result.stats.phases["update"].calls == 20
+
+
+def test_simulate_without_stats():
+    result = simulate(
+        games_count=2, steps=10, delta_time=0.05, policy=random_policy, seed=0
+    )
+
+    assert result.stats is None
+
+
+def test_simulate_stats_unsupported_engine():
+    with pytest.raises(
+        ValueError, match=r"^Collecting stats is not supported by the batched engine$"
+    ):
+        simulate(
+            games_count=1,
+            steps=1,
+            delta_time=0.05,
+            policy=random_policy,
+            engine=BATCHED_ENGINE,
+            collect_stats=True,
+        )
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from shooter.spatial_hash import SpatialHash
+
+
+def points_in_box(locations, min_corner, max_corner):
+    return np.flatnonzero(
+        np.all((locations >= min_corner) & (locations <= max_corner), axis=1)
+    )
+
+
+def test_spatial_hash_constructor():
+    spatial_hash = SpatialHash(cell_size=0.3)
+
+    assert spatial_hash.cells_per_side == 4
+    assert spatial_hash.key_dtype == np.int16
+    np.testing.assert_array_equal(spatial_hash.cell_starts, np.zeros(17))
+
+
+def test_spatial_hash_with_many_cells_uses_large_keys():
+    assert SpatialHash(cell_size=0.001).key_dtype == int
+
+
+def test_spatial_hash_cells():
+    spatial_hash = SpatialHash(cell_size=0.1)
+
+    cells = spatial_hash.cells(
+        np.array([[0.05, 0.05], [0.15, 0.95], [-0.5, 0.5], [0.5, 1.5]])
+    )
+
+    np.testing.assert_array_equal(cells, [[0, 0], [1, 9], [0, 5], [5, 9]])
+
+
+def test_spatial_hash_build():
+    spatial_hash = SpatialHash(cell_size=0.5)
+
+    spatial_hash.build(np.array([[0.7, 0.7], [0.2, 0.2], [0.7, 0.1], [0.3, 0.4]]))
+
+    np.testing.assert_array_equal(spatial_hash.order, [1, 3, 2, 0])
+    np.testing.assert_array_equal(spatial_hash.cell_starts, [0, 2, 3, 3, 4])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_spatial_hash_query_finds_all_points_in_boxes(seed):
+    rng = np.random.default_rng(seed)
+    locations = rng.uniform(-0.1, 1.1, size=(1000, 2))
+    spatial_hash = SpatialHash(cell_size=0.1)
+    spatial_hash.build(locations)
+    min_corners = rng.uniform(-0.2, 1, size=(20, 2))
+    max_corners = min_corners + rng.uniform(0, 0.3, size=(20, 2))
+
+    boxes, points = spatial_hash.query(min_corners, max_corners)
+
+    assert len(set(zip(boxes, points))) == len(boxes)
+    for box, (min_corner, max_corner) in enumerate(zip(min_corners, max_corners)):
+        candidates = points[boxes == box]
+        assert set(points_in_box(locations, min_corner, max_corner)) <= set(candidates)
+        assert len(candidates) < len(locations)
+
+
+def test_spatial_hash_query_box_in_single_cell():
+    spatial_hash = SpatialHash(cell_size=0.5)
+    spatial_hash.build(np.array([[0.7, 0.7], [0.2, 0.2], [0.7, 0.1], [0.3, 0.4]]))
+
+    boxes, points = spatial_hash.query(np.array([[0.1, 0.1]]), np.array([[0.2, 0.2]]))
+
+    np.testing.assert_array_equal(boxes, [0, 0])
+    np.testing.assert_array_equal(points, [1, 3])
+
+
+def test_spatial_hash_query_empty():
+    spatial_hash = SpatialHash(cell_size=0.1)
+    spatial_hash.build(np.empty((0, 2)))
+
+    boxes, points = spatial_hash.query(np.array([[0.2, 0.2]]), np.array([[0.4, 0.4]]))
+
+    assert len(boxes) == 0
+    assert len(points) == 0
+
+
+def test_spatial_hash_query_without_boxes():
+    spatial_hash = SpatialHash(cell_size=0.1)
+    spatial_hash.build(np.array([[0.5, 0.5]]))
+
+    boxes, points = spatial_hash.query(np.empty((0, 2)), np.empty((0, 2)))
+
+    assert len(boxes) == 0
+    assert len(points) == 0
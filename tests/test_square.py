@@ -146,3 +146,71 @@ def test_square_repr():
     square = Square(location=np.array([0.5, 0.5]), width=0.5)
 
     assert str(square) == "Square(location=[0.5 0.5], width=0.5)"
+
+
+def test_square_bounds():
+    square = Square(location=np.array([0.5, 0.25]), width=0.5)
+
+    assert square.bounds == (0.25, 0.0, 0.75, 0.5)
+
+
+def test_square_bounds_follow_location():
+    square = Square(location=np.array([0.5, 0.5]), width=0.2)
+
+    square.location = np.array([0.2, 0.3])
+
+    np.testing.assert_array_almost_equal(square.top_left, [0.1, 0.2])
+    np.testing.assert_array_almost_equal(square.bottom_right, [0.3, 0.4])
+    assert np.array([0.25, 0.35]) in square
+    assert np.array([0.5, 0.5]) not in square
+
+
+def test_square_bounds_follow_width():
+    square = Square(location=np.array([0.5, 0.5]), width=0.2)
+
+    square.width = 0.4
+
+    assert square.width == 0.4
+    np.testing.assert_array_almost_equal(square.top_left, [0.3, 0.3])
+    np.testing.assert_array_almost_equal(square.bottom_right, [0.7, 0.7])
+
+
+def test_square_location_is_copied_and_read_only():
+    location = np.array([0.5, 0.5])
+    square = Square(location=location, width=0.2)
+
+    location[0] = 0.1
+
+    np.testing.assert_array_equal(square.location, [0.5, 0.5])
+    with pytest.raises(ValueError):
+        square.location[0] = 0.1
+
+
+def test_square_has_no_dict():
+    square = Square(location=np.array([0.5, 0.5]), width=0.2)
+
+    with pytest.raises(AttributeError):
+        square.color = "red"
+
+
+@pytest.mark.parametrize(
+    "square",
+    [
+        Square(location=np.array([0.05, 0.5]), width=0.2),
+        Square(location=np.array([0.95, 0.5]), width=0.2),
+        Square(location=np.array([0.5, 0.05]), width=0.2),
+        Square(location=np.array([0.5, 0.95]), width=0.2),
+        Square(location=np.array([0.5, 0.5]), width=1.1),
+    ],
+)
+def test_square_is_not_valid(square):
+    assert not square.valid
+
+
+def test_square_not_intersecting():
+    square1 = Square(location=np.array([0.2, 0.2]), width=0.2)
+    square2 = Square(location=np.array([0.5, 0.2]), width=0.2)
+    square3 = Square(location=np.array([0.2, 0.5]), width=0.2)
+
+    assert not square1.is_intersecting(square2)
+    assert not square1.is_intersecting(square3)
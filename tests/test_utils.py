@@ -1,6 +1,11 @@
 import numpy as np
 
-from shooter.utils import direction_vector, random_location
+from shooter.geometry import squares_intersecting
+from shooter.utils import (
+    direction_vector,
+    random_location,
+    random_squares_not_intersecting,
+)
 
 
 def test_random_location_without_margin():
@@ -20,6 +25,52 @@ def test_random_location_with_margin():
     assert margin <= location[1] <= 1 - margin
 
 
+def test_random_location_with_generator():
+    locations1 = random_location(0.1, size=(5, 2), rng=np.random.default_rng(0))
+    locations2 = random_location(0.1, size=(5, 2), rng=np.random.default_rng(0))
+
+    assert locations1.shape == (5, 2)
+    np.testing.assert_array_equal(locations1, locations2)
+
+
+def test_random_squares_not_intersecting():
+    others = np.array([[0.5, 0.5], [0.2, 0.3], [0.5, 0.5]])
+
+    locations = random_squares_not_intersecting(
+        others, width=0.1, margin=0.1, rng=np.random.default_rng(0), candidates_count=4
+    )
+
+    assert locations.shape == (3, 2)
+    assert np.all((locations >= 0.1) & (locations <= 0.9))
+    assert not np.any(squares_intersecting(locations, 0.1, others, 0.1))
+
+
+def test_random_squares_not_intersecting_crowded():
+    others = np.full((100, 2), 0.5)
+
+    locations = random_squares_not_intersecting(
+        others, width=0.4, margin=0, rng=np.random.default_rng(0), candidates_count=2
+    )
+
+    assert not np.any(squares_intersecting(locations, 0.4, others, 0.4))
+
+
+def test_random_squares_not_intersecting_is_reproducible():
+    others = np.random.uniform(size=(10, 2))
+    locations1, locations2 = [
+        random_squares_not_intersecting(
+            others,
+            width=0.2,
+            margin=0.1,
+            rng=np.random.default_rng(3),
+            candidates_count=8,
+        )
+        for _ in range(2)
+    ]
+
+    np.testing.assert_array_equal(locations1, locations2)
+
+
 def test_direction_vector():
     np.testing.assert_array_almost_equal(direction_vector(0), np.array([1, 0]))
     np.testing.assert_array_almost_equal(